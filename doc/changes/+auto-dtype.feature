@@ -0,0 +1 @@
+Added the ``"auto"`` data type, which chooses between ``Dense``, ``Dia`` and ``CSR`` from the structure of each matrix, for ``Qobj.to("auto")`` and as ``default_dtype``. The thresholds are the new ``auto_dtype_*`` options of ``CoreOptions``.
@@ -0,0 +1 @@
+Added a binary format to ``qsave`` and ``qload``, with ``binary=True``, which stores arrays as raw file sections and supports loading only some fields or states of a ``Result``, compression and memory-mapped reading.
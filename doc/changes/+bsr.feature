@@ -0,0 +1 @@
+Added the ``BSR`` (block compressed sparse row) data type for matrices made of dense blocks of the same shape, such as those built with ``qutip.core.data.block_build(..., dtype="bsr")``. It stores one index per block instead of one per element.
@@ -0,0 +1 @@
+Added a cache of the results of ``isherm`` and ``isdiag`` on data-layer matrices, which is carried through ``copy``, ``adjoint``, ``conj``, ``transpose``, ``neg``, ``mul``, ``add`` and ``kron`` instead of scanning the result again.
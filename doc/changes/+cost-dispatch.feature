@@ -0,0 +1,5 @@
+Dispatchers can choose between specialisations at call time with cost
+functions of the arguments.  Products of ``CSR`` and ``Dense`` matrices use
+this to convert fairly filled sparse operators to ``Dense`` and use BLAS.  The
+rates of the cost model can be calibrated with
+``qutip.core.data.cost_model.calibrate()``.
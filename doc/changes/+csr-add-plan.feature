@@ -0,0 +1 @@
+Added ``CSRAddPlan``, which computes the sparsity pattern of a sum of fixed ``CSR`` matrices once so that later weighted sums only scatter data. ``QobjEvo`` uses it when evaluating sums of constant ``CSR`` terms at a time.
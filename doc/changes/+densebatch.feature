@@ -0,0 +1,3 @@
+Add the ``DenseBatch`` data-layer type, which stores many same-shaped states
+together so that ``matmul``, ``expect``, ``inner`` and the norms act on all of
+them in a single call, returning arrays of results.
@@ -0,0 +1,3 @@
+Add ``qutip.core.data.profile``, a context manager which records the
+specialisations run by the data-layer dispatchers and the implicit conversions
+they make, with their counts, sizes and timings.
@@ -0,0 +1 @@
+Added ``qutip.core.data.expect_many`` and ``ExpectMany``, which compute the expectation values of several operators with the same state in one pass. ``Result`` uses them automatically for ``e_ops`` that share a data type and dimensions.
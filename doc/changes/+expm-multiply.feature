@@ -0,0 +1 @@
+Added ``qutip.core.data.expm_multiply`` and ``Qobj.expm_multiply`` to compute the action of a matrix exponential on a state without forming the exponential, so sparse generators stay sparse.
@@ -0,0 +1 @@
+Added ``qutip.core.data.kron_many``, the Kronecker product of several matrices without intermediate products of the size of the output, used by ``tensor``, ``super_tensor`` and ``expand_operator``.
@@ -0,0 +1 @@
+Added the ``KronProduct`` data type, a lazy Kronecker product of small factors. ``tensor`` of ``KronProduct`` operators stays lazy, and products with ``Dense`` states apply the factors one subsystem at a time, so local terms of many-body Hamiltonians never form their full matrix.
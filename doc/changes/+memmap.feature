@@ -0,0 +1 @@
+Added ``Dense.from_memmap`` and ``CSR.from_memmap`` to create matrices backed by ``numpy.memmap`` arrays without copy, and ``qutip.save_memmap`` and ``qutip.load_memmap`` to store a ``Qobj`` in a file which can be mapped back into memory.
@@ -0,0 +1 @@
+Added the Wigner and Q functions and the distributions to the functions using ``settings.core["numpy_backend"]``, with ``qutip.core.bench_numpy_backend`` to time a backend such as its ``ThreadedNumpy`` against NumPy.
@@ -0,0 +1,3 @@
+Restore OpenMP support: when compiled with ``--with-openmp``, products of
+``CSR`` matrices with ``Dense`` vectors and matrices use multi-threaded kernels
+above ``settings.core["openmp_thresh"]`` non-zero elements.
@@ -0,0 +1 @@
+Added ``Qobj.ptrace_many`` and ``qutip.core.data.ptrace_many`` to compute several partial traces of a state in one pass, and made the partial trace and permutation of ``Dense`` matrices work on strided tensor views.
@@ -0,0 +1,3 @@
+Add the single-precision ``Dense32`` and ``CSR32`` data-layer types and the
+``single_precision`` option of the ``vern7``, ``vern9`` and ``tsit5``
+integrators, which runs the integration in ``complex64``.
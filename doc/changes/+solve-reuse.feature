@@ -0,0 +1 @@
+Added ``reuse`` to ``qutip.core.data.solve`` to keep the LU factorisation of the matrix in a least-recently-used cache and reuse it for later right-hand sides. The power-method steady state and the current noise of ``countstat_current_noise`` use it.
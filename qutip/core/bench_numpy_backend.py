@@ -0,0 +1,141 @@
+"""
+Benchmarks of the post-processing functions which use the NumPy backend set by
+``qutip.settings.core["numpy_backend"]``, comparing NumPy itself with another
+NumPy-compatible module.  Use as::
+
+    from qutip.core.bench_numpy_backend import (
+        ThreadedNumpy, bench_numpy_backend,
+    )
+    bench_numpy_backend(ThreadedNumpy(num_threads=4))
+
+If the backend is found to be faster, it can then be used everywhere with::
+
+    qutip.settings.core["numpy_backend"] = ThreadedNumpy(num_threads=4)
+"""
+import os
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy
+
+from .options import CoreOptions
+
+__all__ = ['ThreadedNumpy', 'bench_numpy_backend']
+
+
+def _min_timer(function, *args, **kwargs):
+    timer = timeit.Timer(lambda: function(*args, **kwargs))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+class ThreadedNumpy:
+    """
+    NumPy, with the element-wise functions applied in parallel on large
+    arrays.
+
+    NumPy releases the GIL in the loops of its universal functions, so that
+    splitting a large array in chunks and applying the function to each chunk
+    in a different thread uses several cores.  Every other attribute is taken
+    from NumPy directly, so that this can be used as
+    ``qutip.settings.core["numpy_backend"]``.
+
+    Parameters
+    ----------
+    num_threads : int, optional
+        The number of threads to use.  Default to the number of cores.
+
+    min_size : int, default: 65536
+        Arrays with fewer elements than this are not split.
+    """
+    _ELEMENTWISE = frozenset([
+        "abs", "conj", "conjugate", "cos", "exp", "log", "log2", "sin", "sqrt",
+    ])
+
+    def __init__(self, num_threads=None, min_size=65536):
+        self.num_threads = num_threads or os.cpu_count() or 1
+        self.min_size = min_size
+        self._pool = None
+
+    def __getattr__(self, name):
+        function = getattr(numpy, name)
+        if name in self._ELEMENTWISE:
+            return partial(self._elementwise, function)
+        return function
+
+    def _elementwise(self, function, x, *args, **kwargs):
+        if (
+            args or kwargs
+            or self.num_threads == 1
+            or not isinstance(x, numpy.ndarray)
+            or x.size < self.min_size
+        ):
+            return function(x, *args, **kwargs)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.num_threads)
+        flat = numpy.ascontiguousarray(x).reshape(-1)
+        out = numpy.empty(flat.size, dtype=function(flat[:1]).dtype)
+        bounds = numpy.linspace(0, flat.size, self.num_threads + 1, dtype=int)
+        chunks = [
+            slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        for _ in self._pool.map(
+            lambda chunk: function(flat[chunk], out=out[chunk]), chunks
+        ):
+            pass
+        return out.reshape(x.shape)
+
+
+def _workloads(size):
+    from ..random_objects import rand_dm, rand_ket
+    from ..wigner import wigner, spin_q_function
+    from ..entropy import entropy_vn
+    from ..distributions import TwoModeQuadratureCorrelation
+
+    xvec = numpy.linspace(-5, 5, size)
+    rho = rand_dm(20, seed=1)
+    spin = rand_dm(11, seed=2)
+    angles = numpy.linspace(0, numpy.pi, size)
+    two_mode = rand_ket([6, 6], seed=3)
+    return {
+        "wigner": partial(wigner, rho, xvec, xvec),
+        "wigner_iterative": partial(
+            wigner, rho, xvec, xvec, method="iterative"
+        ),
+        "spin_q_function": partial(spin_q_function, spin, angles, angles),
+        "entropy_vn": partial(entropy_vn, rand_dm(size, seed=4)),
+        "quadrature_correlation": partial(
+            TwoModeQuadratureCorrelation, two_mode, steps=size
+        ),
+    }
+
+
+def bench_numpy_backend(backend, size=400):
+    """
+    Time the post-processing functions using the NumPy backend with NumPy and
+    with ``backend``.
+
+    Parameters
+    ----------
+    backend : module or object
+        A NumPy-compatible module, such as :class:`ThreadedNumpy`.
+
+    size : int, default: 400
+        The number of points along each axis of the phase space grids, and the
+        dimension of the density matrix for the entropy.
+
+    Returns
+    -------
+    times : dict
+        For each benchmark name, the times in seconds of one call with NumPy
+        and with ``backend``.
+    """
+    times = {}
+    for name, workload in _workloads(size).items():
+        with CoreOptions(numpy_backend=numpy):
+            reference = _min_timer(workload)
+        with CoreOptions(numpy_backend=backend):
+            timed = _min_timer(workload)
+        times[name] = (reference, timed)
+    return times
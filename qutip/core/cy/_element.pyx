@@ -175,7 +175,7 @@ cdef class _BaseElement:
             imatmul_data_dense(data_t, state, total_scale, out)
             return out
         else:
-            return _data.add[type(out), type(state), type(out)](
+            return _data.iadd[type(out), type(state), type(out)](
                 out,
                 _data.matmul[type(data_t), type(state), type(state)](
                     data_t, state, total_scale
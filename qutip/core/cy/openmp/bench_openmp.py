@@ -1,31 +1,48 @@
+"""
+Benchmarks used to choose the number of stored elements above which the
+OpenMP sparse matrix-vector kernels of the data layer are faster than the
+serial ones.  Use as::
+
+    from qutip.core.cy.openmp.bench_openmp import calculate_openmp_thresh
+    qutip.settings.core["openmp_thresh"] = calculate_openmp_thresh()
+"""
+import timeit
 import numpy as np
 from qutip.settings import settings as qset
-from timeit import default_timer as timer
+from qutip.core import data as _data
+from qutip.core.options import CoreOptions
 
+__all__ = ['calculate_openmp_thresh']
 
-def _min_timer(function, *args, **kwargs):
-    min_time = 1e6
-    for kk in range(10000):
-        t0 = timer()
-        function(*args, **kwargs)
-        t1 = timer()
-        min_time = min(min_time, t1-t0)
-    return min_time
+# Threshold which is never reached: disable the OpenMP kernels.
+_NO_OPENMP = int(np.iinfo(_data.base.idxint_dtype).max)
 
 
-def system_bench(func, dims):
+def _min_timer(function, *args, **kwargs):
+    timer = timeit.Timer(lambda: function(*args, **kwargs))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def system_bench(func, dims, num_threads=0):
+    """
+    Time the serial and OpenMP products of the operators ``func(N)`` for
+    ``N`` in ``dims`` with a ket, and interpolate the number of stored
+    elements for which both take the same time.  Returns -1 if the OpenMP
+    kernel is never faster.
+    """
     from qutip.random_objects import rand_ket
     ratio = 0
     ratio_old = 0
     nnz_old = 0
     for N in dims:
-        L = func(N).data
-        vec = rand_ket(L.shape[0], 0.25).full().ravel()
-        nnz = L.nnz
-        out = np.zeros_like(vec)
-        ser = _min_timer(_spmvpy, L.data, L.indices, L.indptr, vec, 1, out)
-        out = np.zeros_like(vec)
-        par = _min_timer(_spmvpy_openmp, L.data, L.indices, L.indptr, vec, 1, out, 2)
+        L = _data.to(_data.CSR, func(N).data)
+        vec = rand_ket(L.shape[0], 0.25, dtype="dense").data
+        nnz = _data.csr.nnz(L)
+        with CoreOptions(openmp_thresh=_NO_OPENMP):
+            ser = _min_timer(_data.matmul_csr_dense_dense, L, vec)
+        with CoreOptions(openmp_thresh=0, openmp_num_threads=num_threads):
+            par = _min_timer(_data.matmul_csr_dense_dense, L, vec)
         ratio = ser/par
         if ratio > 1:
             break
@@ -38,23 +55,41 @@ def system_bench(func, dims):
         return -1
 
 
-def calculate_openmp_thresh():
-    # if qset.num_cpus == 1:
-    #    return qset.openmp_thresh
+def calculate_openmp_thresh(num_threads=0):
+    """
+    Estimate the value of ``qutip.settings.core["openmp_thresh"]`` for this
+    machine, by benchmarking the products of a few typical Liouvillians and
+    Hamiltonians of increasing sizes with kets.
+
+    Parameters
+    ----------
+    num_threads : int, default: 0
+        Number of threads to benchmark the OpenMP kernels with.  The default
+        of 0 lets OpenMP decide, as ``settings.core["openmp_num_threads"]``.
+
+    Returns
+    -------
+    thresh : int
+        The number of stored elements above which the OpenMP kernels should
+        be used.  If they were never found to be faster (or QuTiP was not
+        compiled with OpenMP), this is the largest sparse matrix index.
+    """
+    if not qset.has_openmp:
+        return _NO_OPENMP
     jc_dims = np.unique(np.logspace(0.45, 1.78, 20, dtype=int))
-    jc_result = system_bench(_jc_liouvillian, jc_dims)
+    jc_result = system_bench(_jc_liouvillian, jc_dims, num_threads)
 
     opto_dims = np.unique(np.logspace(0.4, 1.33, 12, dtype=int))
-    opto_result = system_bench(_opto_liouvillian, opto_dims)
+    opto_result = system_bench(_opto_liouvillian, opto_dims, num_threads)
 
     spin_dims = np.unique(np.logspace(0.45, 1.17, 10, dtype=int))
-    spin_result = system_bench(_spin_hamiltonian, spin_dims)
+    spin_result = system_bench(_spin_hamiltonian, spin_dims, num_threads)
 
+    results = [jc_result, opto_result, spin_result]
+    if max(results) < 0:
+        return _NO_OPENMP
     # Double result to be conservative
-    thresh = 2*int(max([jc_result, opto_result, spin_result]))
-    if thresh < 0:
-        thresh = np.iinfo(np.int32).max
-    return thresh
+    return 2*int(max(results))
 
 
 def _jc_liouvillian(N):
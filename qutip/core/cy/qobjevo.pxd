@@ -12,11 +12,14 @@ cdef class QobjEvo:
         int _isoper
         readonly dict _feedback_functions
         readonly dict _solver_only_feedback
+        object _add_plan
 
     cpdef Data _call(QobjEvo self, double t)
 
     cdef object _prepare(QobjEvo self, object t, Data state=*)
 
+    cdef bint _csr_add_plan(QobjEvo self, list datas) except -1
+
     cpdef object expect_data(QobjEvo self, object t, Data state)
 
     cdef double complex _expect_dense(QobjEvo self, double t, Dense state) except *
@@ -362,17 +362,26 @@ cdef class QobjEvo:
             # information.
             return sum(element.qobj(t) for element in self.elements)
 
-        cdef _BaseElement part = self.elements[0]
-        cdef double complex coeff = part.coeff(t)
-        obj = part.qobj(t)
-        cdef Data out = _data.mul(obj.data, coeff)
-        cdef bint isherm = <bint> obj._isherm and coeff.imag == 0
-        for element in self.elements[1:]:
+        cdef _BaseElement part
+        cdef double complex coeff
+        cdef list coeffs = []
+        cdef list datas = []
+        cdef bint isherm = True
+        for element in self.elements:
             part = <_BaseElement> element
             coeff = part.coeff(t)
             obj = part.qobj(t)
             isherm &= <bint> obj._isherm and coeff.imag == 0
-            out = _data.add(out, obj.data, coeff)
+            coeffs.append(coeff)
+            datas.append(obj.data)
+
+        cdef Data out
+        if len(datas) > 1 and self._csr_add_plan(datas):
+            out = self._add_plan.sum(coeffs)
+        else:
+            out = _data.mul(datas[0], coeffs[0])
+            for data, coeff in zip(datas[1:], coeffs[1:]):
+                out = _data.add(out, data, coeff)
 
         return Qobj(out, dims=self._dims, copy=False, isherm=isherm or None)
 
@@ -380,6 +389,15 @@ cdef class QobjEvo:
         t = self._prepare(t, None)
         cdef Data out
         cdef _BaseElement part = self.elements[0]
+        cdef list datas
+        if len(self.elements) > 1:
+            datas = [(<_BaseElement> element).data(t)
+                     for element in self.elements]
+            if self._csr_add_plan(datas):
+                return self._add_plan.sum([
+                    (<_BaseElement> element).coeff(t)
+                    for element in self.elements
+                ])
         out = _data.mul(part.data(t),
                         part.coeff(t))
         for element in self.elements[1:]:
@@ -392,6 +410,25 @@ cdef class QobjEvo:
             )
         return out
 
+    cdef bint _csr_add_plan(QobjEvo self, list datas) except -1:
+        """
+        Whether the sum of the elements can be done with a plan of the
+        additions, which is created or updated if needed.  This is only the
+        case if all the elements are CSR matrices which are constant in time,
+        since the plan is only valid for fixed terms.
+        """
+        if self._add_plan is not None and self._add_plan.matches(datas):
+            return True
+        self._add_plan = None
+        for data in datas:
+            if type(data) is not _data.CSR:
+                return False
+        for element in self.elements:
+            if not isinstance(element, (_ConstantElement, _EvoElement)):
+                return False
+        self._add_plan = _data.CSRAddPlan(datas)
+        return True
+
     cdef object _prepare(QobjEvo self, object t, Data state=None):
         """ Precomputation before computing getting the element at `t`"""
         # We keep the function for feedback eventually
@@ -12,6 +12,7 @@ from .block_operations import *
 from .constant import *
 from .eigen import *
 from .expect import *
+from .expect_many import *
 from .expm import *
 from .inner import *
 from .kron import *
@@ -29,8 +30,21 @@ from .tidyup import *
 from .trace import *
 from .solve import *
 from .extract import *
+from .auto import *
 # For operations with mulitple related versions, we just import the module.
 from . import norm, permute, ode, mean
+# Single-precision types, which register their own specialisations.
+from . import single
+from .single import Dense32, CSR32
+from . import densebatch
+from .densebatch import DenseBatch
+from . import kronproduct
+from .kronproduct import KronProduct
+from . import bsr
+from .bsr import BSR
+from .profiling import *
+from . import cost
+from .cost import *
 
 
 # Set up the data conversions that are known by us.  All types covered by
@@ -44,12 +58,40 @@ to.add_conversions([
     (Dense, Dia, dense.from_dia, 1.2),
     (Dia, CSR, dia.from_csr, 1),
     (CSR, Dia, csr.from_dia, 1),
+    # Conversions to single precision lose accuracy, so the dispatcher should
+    # only choose them when there is no alternative.
+    (Dense, single.Dense32, single.dense_from_dense32, 0.5),
+    (single.Dense32, Dense, single.dense32_from_dense, 2),
+    (CSR, single.CSR32, single.csr_from_csr32, 0.5),
+    (single.CSR32, CSR, single.csr32_from_csr, 2),
+    (single.Dense32, single.CSR32, single.dense32_from_csr32, 1),
+    (single.CSR32, single.Dense32, single.csr32_from_dense32, 1.4),
+    # Reductions of a batch return arrays, so a single state should never be
+    # converted to a batch of one unless it is requested.
+    (Dense, densebatch.DenseBatch, densebatch.dense_from_densebatch, 1),
+    (densebatch.DenseBatch, Dense, densebatch.densebatch_from_dense, 10),
+    # Wrapping a matrix as a single factor never makes it cheaper to use.
+    (CSR, kronproduct.KronProduct, kronproduct.csr_from_kronproduct, 1),
+    (kronproduct.KronProduct, CSR, kronproduct.kronproduct_from_csr, 10),
+    (CSR, bsr.BSR, bsr.csr_from_bsr, 1),
+    (bsr.BSR, CSR, bsr.bsr_from_csr, 1.4),
 ], _defer=True)
 to.register_aliases(['csr', 'CSR'], CSR)
 to.register_aliases(['Dense', 'dense'], Dense)
 to.register_aliases(['DIA', 'Dia', 'dia', 'diag'], Dia)
+to.register_aliases(['Dense32', 'dense32'], single.Dense32)
+to.register_aliases(['CSR32', 'csr32'], single.CSR32)
+to.register_aliases(['DenseBatch', 'densebatch'], densebatch.DenseBatch)
+to.register_aliases(['KronProduct', 'kronproduct'], kronproduct.KronProduct)
+to.register_aliases(['BSR', 'bsr'], bsr.BSR)
 to.register_group(
-    ['core', 'Core', 'cython', 'Cython'],
+    ['single', 'complex64'],
+    dense=single.Dense32, sparse=single.CSR32, _defer=True
+)
+# "auto" behaves as "core" when no matrix is available to inspect, such as in
+# the dispatcher and creation functions; `Qobj` resolves it with `auto_dtype`.
+to.register_group(
+    ['core', 'Core', 'cython', 'Cython', 'auto'],
     dense=Dense, sparse=CSR, diagonal=Dia
 )
 
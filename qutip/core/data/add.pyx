@@ -7,7 +7,10 @@ cimport numpy as cnp
 from scipy.linalg cimport cython_blas as blas
 from qutip.settings import settings
 
-from qutip.core.data.base cimport idxint, Data
+from qutip.core.data.base cimport (
+    idxint, Data, add_checked, copy_properties,
+)
+from qutip.core.data.base import idxint_dtype
 from qutip.core.data.dense cimport Dense
 from qutip.core.data.dia cimport Dia
 from qutip.core.data.tidyup cimport tidyup_dia
@@ -23,6 +26,7 @@ __all__ = [
     'add', 'add_csr', 'add_dense', 'add_dia',
     'iadd', 'iadd_dense', 'iadd_dense_data_dense', 'iadd_data',
     'sub', 'sub_csr', 'sub_dense', 'sub_dia',
+    'CSRAddPlan',
 ]
 
 
@@ -40,6 +44,23 @@ cdef int _check_shape(Data left, Data right) except -1 nogil:
     return 0
 
 
+cdef inline void _add_properties(
+    Data left, Data right, double complex scale, Data out,
+):
+    # `out` may be `left` itself for in-place sums.
+    out._fingerprint = None
+    if scale == 0:
+        copy_properties(left, out)
+        return
+    out._isherm = (
+        True if left._isherm is True and right._isherm is True
+        and scale.imag == 0 else None
+    )
+    out._isdiag = (
+        True if left._isdiag is True and right._isdiag is True else None
+    )
+
+
 cdef idxint _add_csr(Accumulator *acc, CSR a, CSR b, CSR c, double tol) nogil:
     """
     Perform the operation
@@ -143,7 +164,7 @@ cpdef CSR add_csr(CSR left, CSR right, double complex scale=1):
     _check_shape(left, right)
     cdef idxint left_nnz = csr.nnz(left)
     cdef idxint right_nnz = csr.nnz(right)
-    cdef idxint worst_nnz = left_nnz + right_nnz
+    cdef idxint worst_nnz = add_checked(left_nnz, right_nnz)
     cdef idxint i
     cdef CSR out
     cdef Accumulator acc
@@ -159,6 +180,7 @@ cpdef CSR add_csr(CSR left, CSR right, double complex scale=1):
         if scale != 1:
             for i in range(right_nnz):
                 out.data[i] *= scale
+        _add_properties(left, right, scale, out)
         return out
     # Main path.
     out = csr.empty(left.shape[0], left.shape[1], worst_nnz)
@@ -168,6 +190,7 @@ cpdef CSR add_csr(CSR left, CSR right, double complex scale=1):
     else:
         _add_csr_scale(&acc, left, right, out, scale, tol)
     acc_free(&acc)
+    _add_properties(left, right, scale, out)
     return out
 
 
@@ -175,6 +198,7 @@ cdef void add_dense_eq_order_inplace(Dense left, Dense right, double complex sca
     cdef int size = left.shape[0] * left.shape[1]
     with nogil:
         blas.zaxpy(&size, &scale, right.data, &_ONE, left.data, &_ONE)
+    _add_properties(left, right, scale, left)
 
 
 cdef Dense _add_dense_eq_order(Dense left, Dense right, double complex scale):
@@ -182,6 +206,7 @@ cdef Dense _add_dense_eq_order(Dense left, Dense right, double complex scale):
     cdef int size = left.shape[0] * left.shape[1]
     with nogil:
         blas.zaxpy(&size, &scale, right.data, &_ONE, out.data, &_ONE)
+    _add_properties(left, right, scale, out)
     return out
 
 
@@ -197,6 +222,7 @@ cpdef Dense add_dense(Dense left, Dense right, double complex scale=1):
     with nogil:
         for idx in range(dim2):
             blas.zaxpy(&dim1, &scale, right.data + idx, &dim2, out.data + idx*dim1, &_ONE)
+    _add_properties(left, right, scale, out)
     return out
 
 
@@ -215,6 +241,7 @@ cpdef Dense iadd_dense(Dense left, Dense right, double complex scale=1):
             for idx in range(dim2):
                 blas.zaxpy(&dim1, &scale, right.data + idx, &dim2,
                            left.data + idx*dim1, &_ONE)
+    _add_properties(left, right, scale, left)
     return left
 
 
@@ -303,6 +330,7 @@ cpdef Dia add_dia(Dia left, Dia right, double complex scale=1):
         dia.clean_dia(out, True)
     if settings.core['auto_tidyup']:
         tidyup_dia(out, settings.core['auto_tidyup_atol'], True)
+    _add_properties(left, right, scale, out)
     return out
 
 
@@ -318,6 +346,138 @@ cpdef Dia sub_dia(Dia left, Dia right):
     return add_dia(left, right, -1)
 
 
+
+cdef class CSRAddPlan:
+    """
+    Plan for the repeated weighted sums
+        ``out := sum(coeffs[k] * terms[k])``
+    of a fixed list of CSR matrices, with coefficients changing between sums.
+
+    The sparsity pattern of the sum, and the position of each element of each
+    term in it, are found once when the plan is created.  Every sum then only
+    has to scale and scatter the data of the terms into a copy of that
+    pattern, without merging any indices.  This is intended for time-dependent
+    operators, such as those of :obj:`.QobjEvo`, which add up the same terms
+    with different coefficients at every time.
+
+    The plan keeps references to the terms, which must not be modified
+    in-place afterwards.  Elements of the sum which cancel are kept as
+    explicit zeros instead of being removed, even if ``auto_tidyup`` is set.
+
+    Parameters
+    ----------
+    terms : list of CSR
+        The matrices to add up, which must all have the same shape.
+    """
+    cdef readonly tuple terms
+    cdef readonly tuple shape
+    cdef CSR _pattern
+    cdef list _maps
+
+    def __init__(self, terms):
+        cdef CSR term
+        cdef idxint i
+        cdef idxint[::1] row_index, col_index
+        terms = tuple(terms)
+        if not terms:
+            raise ValueError("at least one term is needed")
+        for term in terms:
+            _check_shape(terms[0], term)
+        self.terms = terms
+        self.shape = terms[0].shape
+        rows, cols = self.shape
+        # Elements are identified by their flat index ``row*cols + col``,
+        # which is sorted in the same order as the CSR format stores them.
+        keys = []
+        for term in terms:
+            sci = term.as_scipy()
+            row_of = np.repeat(
+                np.arange(rows, dtype=np.int64), np.diff(sci.indptr)
+            )
+            keys.append(row_of * cols + sci.indices)
+        pattern = np.unique(np.concatenate(keys))
+        self._maps = [
+            np.searchsorted(pattern, key).astype(idxint_dtype)
+            for key in keys
+        ]
+        self._pattern = csr.empty(rows, cols, pattern.shape[0])
+        row_index = np.zeros(rows + 1, dtype=idxint_dtype)
+        np.cumsum(np.bincount(pattern // cols, minlength=rows),
+                  out=np.asarray(row_index)[1:])
+        col_index = (pattern % cols).astype(idxint_dtype)
+        for i in range(rows + 1):
+            self._pattern.row_index[i] = row_index[i]
+        for i in range(pattern.shape[0]):
+            self._pattern.col_index[i] = col_index[i]
+            self._pattern.data[i] = 0
+
+    cpdef bint matches(self, list terms):
+        """
+        Whether ``terms`` are the same objects as those of this plan, in the
+        same order, and still have the same number of stored elements.
+        """
+        cdef idxint k
+        if len(terms) != len(self.terms):
+            return False
+        for k in range(len(terms)):
+            if (
+                terms[k] is not self.terms[k]
+                or csr.nnz(terms[k]) != csr.nnz(self.terms[k])
+                or terms[k].shape != self.shape
+            ):
+                return False
+        return True
+
+    cpdef CSR sum(self, coeffs, CSR out=None):
+        """
+        Compute the weighted sum of the terms.
+
+        Parameters
+        ----------
+        coeffs : sequence of complex
+            The coefficient of each term.
+
+        out : CSR, optional
+            A matrix previously returned by this plan, whose data is
+            overwritten with the new sum.  If not given, a new matrix is
+            allocated with the pattern of the sum.
+
+        Returns
+        -------
+        CSR
+            The weighted sum of the terms.
+        """
+        cdef idxint k, ptr, nnz_out = csr.nnz(self._pattern)
+        cdef double complex coeff
+        cdef CSR term
+        cdef idxint[::1] position
+        cdef bint isherm = True, isdiag = True
+        if len(coeffs) != len(self.terms):
+            raise ValueError(
+                "expected " + str(len(self.terms)) + " coefficients, got "
+                + str(len(coeffs))
+            )
+        if out is None:
+            out = csr.copy_structure(self._pattern)
+        elif out.shape != self.shape or csr.nnz(out) != nnz_out:
+            raise ValueError("out does not have the pattern of this sum")
+        for ptr in range(nnz_out):
+            out.data[ptr] = 0
+        for k in range(len(self.terms)):
+            term = <CSR> self.terms[k]
+            coeff = coeffs[k]
+            position = self._maps[k]
+            with nogil:
+                for ptr in range(csr.nnz(term)):
+                    out.data[position[ptr]] += coeff * term.data[ptr]
+            isherm = isherm and term._isherm is True and coeff.imag == 0
+            isdiag = isdiag and term._isdiag is True
+        out._isherm = True if isherm else None
+        out._isdiag = True if isdiag else None
+        out._fingerprint = None
+        return out
+
+
 from .dispatch import Dispatcher as _Dispatcher
 import inspect as _inspect
 
@@ -5,7 +5,7 @@ from libc.string cimport memset, memcpy
 
 cimport cython
 
-from qutip.core.data.base cimport idxint
+from qutip.core.data.base cimport idxint, copy_properties
 from qutip.core.data.csr cimport CSR
 from qutip.core.data.dense cimport Dense
 from qutip.core.data.dia cimport Dia
@@ -46,6 +46,7 @@ cpdef CSR transpose_csr(CSR matrix):
         for row in range(rows_out, 0, -1):
             out.row_index[row] = out.row_index[row - 1]
         out.row_index[0] = 0
+    copy_properties(matrix, out)
     return out
 
 
@@ -73,6 +74,7 @@ cpdef CSR adjoint_csr(CSR matrix):
         for row in range(rows_out, 0, -1):
             out.row_index[row] = out.row_index[row - 1]
         out.row_index[0] = 0
+    copy_properties(matrix, out)
     return out
 
 
@@ -83,6 +85,7 @@ cpdef CSR conj_csr(CSR matrix):
     with nogil:
         for ptr in range(csr.nnz(matrix)):
             out.data[ptr] = _conj(matrix.data[ptr])
+    copy_properties(matrix, out)
     return out
 
 
@@ -92,6 +95,7 @@ cpdef Dense adjoint_dense(Dense matrix):
     with nogil:
         for ptr in range(matrix.shape[0] * matrix.shape[1]):
             out.data[ptr] = _conj(matrix.data[ptr])
+    copy_properties(matrix, out)
     return out
 
 
@@ -108,6 +112,7 @@ cpdef Dense conj_dense(Dense matrix):
     with nogil:
         for ptr in range(matrix.shape[0] * matrix.shape[1]):
             out.data[ptr] = _conj(matrix.data[ptr])
+    copy_properties(matrix, out)
     return out
 
 
@@ -126,6 +131,7 @@ cpdef Dense iadd_adjoint_dense(Dense matrix, Dense tmp):
             tmp.data[ptr] = _conj(tmp.data[ptr])
     tmp.fortran = not matrix.fortran
     matrix = iadd_dense(matrix, tmp, 1)
+    matrix._isherm = True
     return matrix
 
 
@@ -143,6 +149,7 @@ cpdef Dia adjoint_dia(Dia matrix):
                     out.data[new_i * out.shape[1] + j] = 0.
                 else:
                     out.data[new_i * out.shape[1] + j] = _conj(matrix.data[i * matrix.shape[1] + j - new_offset])
+    copy_properties(matrix, out)
     return out
 
 
@@ -160,6 +167,7 @@ cpdef Dia transpose_dia(Dia matrix):
                     out.data[new_i * out.shape[1] + j] = 0.
                 else:
                     out.data[new_i * out.shape[1] + j] = matrix.data[i * matrix.shape[1] + j - new_offset]
+    copy_properties(matrix, out)
     return out
 
 
@@ -172,6 +180,7 @@ cpdef Dia conj_dia(Dia matrix):
             out.offsets[i] = matrix.offsets[i]
             for j in range(matrix.shape[1]):
                 out.data[i * matrix.shape[1] + j] = _conj(matrix.data[i * matrix.shape[1] + j])
+    copy_properties(matrix, out)
     return out
 
 
@@ -0,0 +1,86 @@
+"""
+Choice of a data-layer type from the structure of a matrix.
+
+This backs the ``"auto"`` data type, which picks between `Dense`, `Dia` and
+`CSR` for each matrix instead of using a fixed type.  The thresholds are the
+``auto_dtype_*`` options of :class:`.CoreOptions`.
+"""
+
+import numpy as np
+
+from .base import Data
+from .dense import Dense
+from .csr import CSR
+from .dia import Dia
+from .convert import to
+from qutip.settings import settings
+
+__all__ = ['structure', 'auto_dtype']
+
+
+def _nonzero_positions(matrix):
+    if isinstance(matrix, Dense):
+        return np.nonzero(matrix.as_ndarray())
+    if not isinstance(matrix, (CSR, Dia)):
+        matrix = to(CSR, matrix)
+    coo = matrix.as_scipy().tocoo()
+    nonzero = coo.data != 0
+    return coo.row[nonzero], coo.col[nonzero]
+
+
+def structure(matrix: Data) -> tuple[int, int]:
+    """
+    Get the number of non-zero elements of a matrix, and the number of its
+    diagonals which contain at least one of them.
+
+    Parameters
+    ----------
+    matrix : Data
+        The matrix to inspect.
+
+    Returns
+    -------
+    nnz : int
+        The number of elements which are not exactly zero.
+
+    num_diag : int
+        The number of occupied diagonals.
+    """
+    rows, cols = _nonzero_positions(matrix)
+    return len(rows), len(np.unique(cols.astype(np.int64) - rows))
+
+
+def auto_dtype(matrix: Data) -> type:
+    """
+    Choose the data-layer type expected to be the fastest for a matrix from
+    its structure.
+
+    Matrices with a fraction of non-zero elements of at least
+    ``settings.core["auto_dtype_dense_fill"]`` are `Dense`.  Square banded
+    matrices, with at most ``settings.core["auto_dtype_max_diags"]`` occupied
+    diagonals which are filled to at least
+    ``settings.core["auto_dtype_dia_fill"]``, are `Dia`.  Every other matrix
+    is `CSR`.
+
+    Parameters
+    ----------
+    matrix : Data
+        The matrix to inspect.
+
+    Returns
+    -------
+    type
+        One of `Dense`, `Dia` or `CSR`.
+    """
+    nnz, num_diag = structure(matrix)
+    size = matrix.shape[0] * matrix.shape[1]
+    if nnz >= settings.core["auto_dtype_dense_fill"] * size:
+        return Dense
+    diag_size = num_diag * matrix.shape[0]
+    if (
+        matrix.shape[0] == matrix.shape[1]
+        and 0 < num_diag <= settings.core["auto_dtype_max_diags"]
+        and nnz >= settings.core["auto_dtype_dia_fill"] * diag_size
+    ):
+        return Dia
+    return CSR
@@ -7,11 +7,35 @@ cdef extern from "src/intdtype.h":
 
 cdef int idxint_DTYPE
 
+cdef idxint size_checked(size_t size) except? -1
+cdef idxint add_checked(idxint a, idxint b) except? -1
+cdef idxint mul_checked(idxint a, idxint b) except? -1
+
 cdef class Data:
     cdef readonly (idxint, idxint) shape
+    # Cached results of `isherm` and `isdiag` with the default tolerance, or
+    # None if not known.  They are set by these functions and by operations
+    # whose output properties follow from those of the inputs, and cleared by
+    # the in-place operations of the data layer.  Modifying the underlying
+    # buffers directly does not clear them.
+    cdef public object _isherm
+    cdef public object _isdiag
+    # Cached result of `fingerprint`, or None if not computed.  It is cleared
+    # by the same operations as the properties above.
+    cdef public object _fingerprint
     cpdef object to_array(self)
     cpdef double complex trace(self)
     cpdef Data adjoint(self)
     cpdef Data conj(self)
     cpdef Data transpose(self)
     cpdef Data copy(self)
+
+
+cdef inline void clear_properties(Data matrix):
+    matrix._isherm = None
+    matrix._isdiag = None
+    matrix._fingerprint = None
+
+cdef inline void copy_properties(Data source, Data out):
+    out._isherm = source._isherm
+    out._isdiag = source._isdiag
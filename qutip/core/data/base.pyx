@@ -1,6 +1,7 @@
 #cython: language_level=3
 #cython: c_api_binop_methods=True
 
+cimport cython
 import numpy as np
 cimport numpy as cnp
 import qutip.core.data as _data
@@ -18,6 +19,56 @@ else:
     idxint_DTYPE = cnp.NPY_INT64
 
 idxint_size = _idxint_size
+_idxint_max = int(np.iinfo(idxint_dtype).max)
+_idxint_overflow_message = (
+    f"The result would need more than {_idxint_max} stored elements or"
+    f" rows, which does not fit in the {_idxint_size}-bit integers used as"
+    " sparse matrix indices.  QuTiP can be compiled with 64-bit indices with"
+    " the `--with-idxint-64` build option."
+)
+
+
+cdef idxint size_checked(size_t size) except? -1:
+    """
+    Convert a size of a sparse matrix to an ``idxint``, raising an
+    ``OverflowError`` suggesting the 64-bit index build if it does not fit.
+    """
+    if size > <size_t> _idxint_max:
+        raise OverflowError(_idxint_overflow_message)
+    return <idxint> size
+
+
+@cython.overflowcheck(True)
+cdef idxint _add(idxint a, idxint b) except? -1:
+    return a + b
+
+
+@cython.overflowcheck(True)
+cdef idxint _mul(idxint a, idxint b) except? -1:
+    return a * b
+
+
+cdef idxint add_checked(idxint a, idxint b) except? -1:
+    """
+    Add two sizes of a sparse matrix, raising an ``OverflowError`` suggesting
+    the 64-bit index build if the result does not fit in an ``idxint``.
+    """
+    try:
+        return _add(a, b)
+    except OverflowError:
+        raise OverflowError(_idxint_overflow_message) from None
+
+
+cdef idxint mul_checked(idxint a, idxint b) except? -1:
+    """
+    Multiply two sizes of a sparse matrix, raising an ``OverflowError``
+    suggesting the 64-bit index build if the result does not fit in an
+    ``idxint``.
+    """
+    try:
+        return _mul(a, b)
+    except OverflowError:
+        raise OverflowError(_idxint_overflow_message) from None
 
 # As this is an abstract base class with C entry points, we have to explicitly
 # stub out methods since we can't mark them as abstract.
@@ -126,7 +126,7 @@ cpdef CSR block_build_csr(
                 blocks_copy = np.array(blocks, dtype=Data, copy=True)
                 copied = True
             blocks_copy[idx] = block
-        nnz += csr.nnz(<CSR>block)
+        nnz = base.add_checked(nnz, csr.nnz(<CSR>block))
 
     if nnz == 0:
         return csr.zeros(shape1, shape2)
@@ -256,7 +256,7 @@ cpdef CSR block_overwrite_csr(CSR data, CSR block,
 
     # the resulting nnz is the sum of the nnz of data and the nnz of block,
     # minus the number of non-zero elements in data that are overwritten
-    cdef base.idxint nnz = csr.nnz(data) + csr.nnz(block)
+    cdef base.idxint nnz = base.add_checked(csr.nnz(data), csr.nnz(block))
     for row in range(above, above + block_height):
         for idx_data in range(data.row_index[row], data.row_index[row + 1]):
             if (
@@ -0,0 +1,166 @@
+#cython: language_level=3
+
+"""
+Cost model used by the dispatchers to choose between specialisations at call
+time, rather than only from the types of the arguments.
+
+The conversion weights in `data.to` do not know the size or the density of
+the matrices.  Sparse kernels are the right choice for the very sparse
+operators typical of quantum systems, but for operators with a fill of a few
+percent or more, multiplied with many columns, converting to `Dense` and using
+BLAS can be several times faster.  The cost functions here estimate the run
+time of both options from the shapes and number of stored elements, using
+per-element rates which can be calibrated for the current machine with
+`CostModel.calibrate`.
+"""
+
+import timeit
+
+import numpy as np
+
+from qutip.core.data.base cimport Data
+from qutip.core.data cimport csr, CSR, Dense
+from qutip.core.data import dense
+from qutip.core.data.convert import to as data_to
+from qutip.core.data.matmul import (
+    matmul, matmul_csr_dense_dense, matmul_dense,
+)
+from qutip.core.data.dispatch import (
+    _cost_dispatch_enabled, _set_cost_dispatch,
+)
+
+__all__ = ['CostModel', 'cost_model']
+
+
+def _min_timer(function, *args):
+    timer = timeit.Timer(lambda: function(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+cdef class CostModel:
+    """
+    Per-element time estimates of the data-layer kernels, used to choose
+    between specialisations.  Only the ratios between the rates matter.  The
+    default values are typical of a recent desktop processor; use `calibrate`
+    to measure them on the current machine.
+
+    The instance used by the dispatchers is ``qutip.core.data.cost_model``.
+
+    Attributes
+    ----------
+    csr_matmul : float
+        Time per stored element of the sparse matrix and per column of the
+        dense matrix of a ``CSR @ Dense`` product.
+
+    dense_matmul : float
+        Time per element of the left matrix and per column of the right matrix
+        of a ``Dense @ Dense`` product.
+
+    csr_to_dense : float
+        Time per element of the output when converting ``CSR`` to ``Dense``.
+
+    conversion : float
+        Fixed time of any conversion, which dominates for small matrices.
+    """
+    cdef public double csr_matmul
+    cdef public double dense_matmul
+    cdef public double csr_to_dense
+    cdef public double conversion
+
+    def __init__(self):
+        self.csr_matmul = 2.5e-9
+        self.dense_matmul = 2e-10
+        self.csr_to_dense = 1.3e-9
+        self.conversion = 3e-7
+
+    @property
+    def enabled(self):
+        """
+        Whether the dispatchers use the cost model.  If not, they always use
+        the specialisation chosen from the conversion weights.
+        """
+        return _cost_dispatch_enabled()
+
+    @enabled.setter
+    def enabled(self, value):
+        _set_cost_dispatch(bool(value))
+
+    def calibrate(self, size=400, density=0.1, ncols=32):
+        """
+        Measure the rates of the kernels on this machine, and update this
+        model with them.
+
+        Parameters
+        ----------
+        size : int, default: 400
+            Dimension of the square operator used in the benchmarks.
+
+        density : float, default: 0.1
+            Fraction of elements stored in the sparse operator.
+
+        ncols : int, default: 32
+            Number of columns of the dense matrix the operator is applied to.
+
+        Returns
+        -------
+        CostModel
+            This model, for chaining.
+        """
+        from qutip.random_objects import rand_herm
+        op = rand_herm(size, density, dtype="CSR").data
+        op_dense = dense.from_csr(op)
+        state = Dense(np.random.rand(size, ncols) + 0j, copy=False)
+        nnz = csr.nnz(op)
+        self.csr_matmul = (
+            _min_timer(matmul_csr_dense_dense, op, state) / (nnz * ncols)
+        )
+        self.dense_matmul = (
+            _min_timer(matmul_dense, op_dense, state) / (size * size * ncols)
+        )
+        self.csr_to_dense = _min_timer(dense.from_csr, op) / (size * size)
+        self.conversion = _min_timer(data_to, Dense, csr.identity(1))
+        return self
+
+    def __repr__(self):
+        return "".join([
+            "CostModel(csr_matmul=", repr(self.csr_matmul),
+            ", dense_matmul=", repr(self.dense_matmul),
+            ", csr_to_dense=", repr(self.csr_to_dense),
+            ", conversion=", repr(self.conversion), ")",
+        ])
+
+
+cdef CostModel _model = CostModel()
+cost_model = _model
+
+
+cdef double _to_dense_cost(Data matrix):
+    if type(matrix) is Dense:
+        return 0
+    return (
+        _model.conversion
+        + _model.csr_to_dense * matrix.shape[0] * matrix.shape[1]
+    )
+
+
+cpdef double matmul_csr_dense_dense_cost(CSR left, Data right) except -1:
+    """Estimated time of ``matmul_csr_dense_dense(left, right)``."""
+    return _model.csr_matmul * csr.nnz(left) * right.shape[1]
+
+
+cpdef double matmul_dense_cost(Data left, Data right) except -1:
+    """
+    Estimated time of converting `left` and `right` to `Dense` and calling
+    ``matmul_dense``.
+    """
+    return (
+        _to_dense_cost(left) + _to_dense_cost(right)
+        + _model.dense_matmul * left.shape[0] * left.shape[1] * right.shape[1]
+    )
+
+
+matmul.add_costs([
+    (CSR, Dense, Dense, matmul_csr_dense_dense_cost),
+    (Dense, Dense, Dense, matmul_dense_cost),
+], _defer=True)
@@ -37,7 +37,7 @@ from qutip.core.data cimport base, Dense, Dia
 from qutip.core.data.adjoint cimport adjoint_csr, transpose_csr, conj_csr
 from qutip.core.data.trace cimport trace_csr
 from qutip.core.data.tidyup cimport tidyup_csr
-from .base import idxint_dtype
+from .base import idxint_dtype, _idxint_max, _idxint_overflow_message
 from qutip.settings import settings
 
 cnp.import_array()
@@ -112,6 +112,17 @@ cdef class CSR(base.Data):
         if np.lib.NumpyVersion(np.__version__) < '2.0.0b1':
             # np2 accept None which act as np1's False
             copy = builtins.bool(copy)
+        elif copy is False:
+            # Only avoid the copy when possible: the index arrays need one
+            # whenever their integer type differs from `idxint`.
+            copy = None
+        row_index = np.asarray(arg[2])
+        if (
+            row_index.ndim == 1 and row_index.size
+            and row_index[row_index.size - 1] > _idxint_max
+        ):
+            # Casting to idxint_dtype would silently wrap around.
+            raise OverflowError(_idxint_overflow_message)
         data = np.array(arg[0], dtype=np.complex128, copy=copy, order='C')
         col_index = np.array(arg[1], dtype=idxint_dtype, copy=copy, order='C')
         row_index = np.array(arg[2], dtype=idxint_dtype, copy=copy, order='C')
@@ -182,6 +193,80 @@ cdef class CSR(base.Data):
     def sparcity(self):
         return "sparse"
 
+    @classmethod
+    def from_memmap(cls, data, col_index, row_index, shape):
+        """
+        Create a `CSR` matrix which uses the memory of the three arrays
+        without copying them.  This is intended for `numpy.memmap` arrays, so
+        that a matrix stored in a file is only read from disk as it is used.
+
+        The arrays must already be contiguous and have the types `CSR` uses
+        internally, ``complex128`` for ``data`` and ``idxint_dtype`` for the
+        indices, since any conversion would copy them.  Only their shapes are
+        checked: the indices are trusted, to not read the whole arrays.  The
+        matrix keeps references to the arrays.  Operations which modify their
+        input in place, such as `Qobj.tidyup`, write to the arrays, so they
+        should be writeable: use ``mode="c"`` to not change the file or
+        ``mode="r+"`` to write the changes through to it.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            The values of the stored elements.
+
+        col_index : numpy.ndarray
+            The column of each stored element.
+
+        row_index : numpy.ndarray
+            The start of each row in ``data`` and ``col_index``, with the
+            number of stored elements as last element.
+
+        shape : tuple of int
+            The shape of the matrix.
+        """
+        arrays = (data, col_index, row_index)
+        dtypes = (np.complex128, idxint_dtype, idxint_dtype)
+        for name, array, dtype in zip(
+            ("data", "col_index", "row_index"), arrays, dtypes
+        ):
+            if not isinstance(array, np.ndarray):
+                raise TypeError(name + " must be a numpy array, not "
+                                + repr(type(array)))
+            if array.dtype != dtype or array.ndim != 1:
+                raise TypeError(name + " must be a 1D array of type "
+                                + str(np.dtype(dtype)) + " to be used without"
+                                " copy, not " + str(array.dtype))
+            if not array.flags.c_contiguous:
+                raise ValueError(name + " must be contiguous to be used"
+                                 " without copy")
+        if not (
+            isinstance(shape, tuple)
+            and len(shape) == 2
+            and isinstance(shape[0], numbers.Integral)
+            and isinstance(shape[1], numbers.Integral)
+            and shape[0] > 0
+            and shape[1] > 0
+        ):
+            raise ValueError("shape must be a 2-tuple of positive ints")
+        if row_index.shape[0] != shape[0] + 1:
+            raise ValueError(
+                "The number of row pointers does not match the shape."
+            )
+        if data.shape[0] != col_index.shape[0]:
+            raise TypeError("data and col_index must have the same shape")
+        if row_index[shape[0]] > data.shape[0]:
+            raise TypeError(
+                "The row_index last elements does not "
+                "match the number of elements"
+            )
+        shape = (int(shape[0]), int(shape[1]))
+        return fast_from_scipy(_csr_matrix(
+            data.view(np.ndarray),
+            col_index.view(np.ndarray),
+            row_index.view(np.ndarray),
+            shape,
+        ))
+
     def __reduce__(self):
         return (fast_from_scipy, (self.as_scipy(),))
 
@@ -203,6 +288,7 @@ cdef class CSR(base.Data):
         memcpy(out.col_index, self.col_index, nnz_*sizeof(base.idxint))
         memcpy(out.row_index, self.row_index,
                (self.shape[0] + 1)*sizeof(base.idxint))
+        base.copy_properties(self, out)
         return out
 
     cpdef object to_array(self):
@@ -622,12 +708,14 @@ cpdef CSR identity(base.idxint dimension, double complex scale=1):
         out.col_index[i] = i
         out.row_index[i] = i
     out.row_index[dimension] = dimension
+    out._isherm = True if scale.imag == 0 else None
+    out._isdiag = True
     return out
 
 cpdef CSR from_dense(Dense matrix):
     # Assume worst-case scenario for non-zero.
     cdef CSR out = empty(matrix.shape[0], matrix.shape[1],
-                         matrix.shape[0]*matrix.shape[1])
+                         base.mul_checked(matrix.shape[0], matrix.shape[1]))
     cdef size_t row, col, ptr_in, ptr_out=0, row_stride, col_stride
     cdef double atol = 0
     cdef double complex value
@@ -707,7 +795,7 @@ cdef CSR from_coo_pointers(
 cpdef CSR from_dia(Dia matrix):
     cdef base.idxint col, diag, i, ptr=0
     cdef base.idxint nrows=matrix.shape[0], ncols=matrix.shape[1]
-    cdef base.idxint nnz = matrix.num_diag * min(matrix.shape)
+    cdef base.idxint nnz = base.mul_checked(matrix.num_diag, min(matrix.shape))
     cdef double complex[:] data = np.zeros(nnz, dtype=complex)
     cdef base.idxint[:] cols = np.zeros(nnz, dtype=idxint_dtype)
     cdef base.idxint[:] rows = np.zeros(nnz, dtype=idxint_dtype)
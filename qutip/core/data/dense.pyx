@@ -90,6 +90,37 @@ cdef class Dense(base.Data):
     def sparcity(self):
         return "dense"
 
+    @classmethod
+    def from_memmap(cls, array):
+        """
+        Create a `Dense` matrix which uses the memory of ``array`` without
+        copying it.  This is intended for `numpy.memmap` arrays, so that a
+        matrix stored in a file is only read from disk as it is used.
+
+        The array must already be contiguous (in either order) and of type
+        ``complex128``, since any conversion would copy it.  The matrix keeps
+        a reference to the array.  Operations which modify their input in
+        place, such as `Qobj.tidyup`, write to the array, so it should be
+        writeable: use ``mode="c"`` to not change the file or ``mode="r+"``
+        to write the changes through to it.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            One- or two-dimensional array.  One-dimensional arrays are kets.
+        """
+        if not isinstance(array, np.ndarray):
+            raise TypeError("array must be a numpy array, not "
+                            + repr(type(array)))
+        if array.dtype != np.complex128:
+            raise TypeError("array must have dtype complex128 to be used "
+                            "without copy, not " + str(array.dtype))
+        if array.ndim not in (1, 2) or array.size == 0:
+            raise ValueError("array must be a non-empty 1D or 2D array")
+        if not (array.flags.c_contiguous or array.flags.f_contiguous):
+            raise ValueError("array must be contiguous to be used without copy")
+        return fast_from_numpy(array.view(np.ndarray))
+
     def __reduce__(self):
         return (fast_from_numpy, (self.as_ndarray(),))
 
@@ -148,6 +179,7 @@ cdef class Dense(base.Data):
         out.data = ptr
         out.fortran = self.fortran
         out._deallocate = True
+        base.copy_properties(self, out)
         return out
 
     cdef void _fix_flags(self, object array, bint make_owner=False):
@@ -324,6 +356,8 @@ cpdef Dense identity(base.idxint dimension, double complex scale=1,
     cdef Dense out = zeros(dimension, dimension, fortran=fortran)
     for row in range(dimension):
         out.data[row*dimension + row] = scale
+    out._isherm = True if scale.imag == 0 else None
+    out._isdiag = True
     return out
 
 
@@ -0,0 +1,430 @@
+"""
+Batches of same-shaped dense states.
+
+Trajectory ensembles, parameter sweeps and runs over many initial conditions
+apply the same operators to many states.  Storing the states together as a
+`DenseBatch` replaces one dispatcher call and one matrix-vector product per
+state with a single call and a single matrix-matrix product over all of them.
+
+The batch has the shape of one of its members, so it can be passed anywhere a
+state is expected.  Operations which reduce a state to a scalar, such as
+`expect`, `inner` and the norms, return a 1D NumPy array with one entry per
+member of the batch.  Operations without a batch specialisation go through
+conversion to `Dense`, which is only possible for a batch of a single state.
+"""
+
+import numpy as np
+
+from .base import Data
+from .dense import Dense
+from .csr import CSR
+from .dia import Dia
+from .add import add, add_dense, iadd, iadd_dense, sub, sub_dense
+from .adjoint import adjoint, transpose, conj, conj_dense
+from .expect import expect
+from .inner import inner
+from .matmul import (
+    matmul, matmul_csr_dense_dense, matmul_dense, matmul_dia_dense_dense,
+)
+from .mul import mul, mul_dense, imul, imul_dense, neg, neg_dense
+from .norm import frobenius, l2
+from .trace import trace
+
+__all__ = ['DenseBatch']
+
+
+class DenseBatch(Data):
+    """
+    A batch of dense states with the same shape.
+
+    The members are stored side by side as the columns of one C-ordered
+    `Dense` matrix, so that applying an operator to the batch is a single
+    sparse-dense or dense-dense matrix product.  The `shape` of the batch is
+    the shape of one member.
+
+    Parameters
+    ----------
+    states : array_like or list of :class:`.Data`
+        The members of the batch, either as a 3D array of shape
+        ``(batch_size, rows, columns)``, a 2D array of shape
+        ``(batch_size, rows)`` of kets, or a sequence of data-layer objects
+        with the same shape.  The values are always copied.
+    """
+    def __init__(self, states):
+        if isinstance(states, Data):
+            states = [states]
+        if not isinstance(states, np.ndarray):
+            states = [
+                state.to_array() if isinstance(state, Data) else state
+                for state in states
+            ]
+        array = np.asarray(states, dtype=np.complex128)
+        if array.ndim == 2:
+            array = array[:, :, None]
+        if array.ndim != 3 or 0 in array.shape:
+            raise ValueError(
+                "states must be a non-empty 3D array or a sequence of states"
+                " with the same shape, but have shape " + str(array.shape)
+            )
+        batch_size, rows, cols = array.shape
+        block = np.ascontiguousarray(array.transpose(1, 0, 2))
+        self._init(Dense(block.reshape(rows, batch_size * cols), copy=False),
+                   batch_size)
+
+    def _init(self, block, batch_size):
+        if block.fortran and block.shape[1] > 1:
+            block = block.reorder(fortran=False)
+        self._block = block
+        self.batch_size = batch_size
+        super().__init__((block.shape[0], block.shape[1] // batch_size))
+
+    @classmethod
+    def sparcity(self):
+        return "dense"
+
+    def __reduce__(self):
+        return (_from_block, (self._block, self.batch_size))
+
+    def __repr__(self):
+        return "".join([
+            "DenseBatch(shape=", str(self.shape),
+            ", batch_size=", str(self.batch_size), ")",
+        ])
+
+    def __str__(self):
+        return self.__repr__()
+
+    def as_ndarray(self):
+        """
+        Get a view onto the members as a 3D `numpy.ndarray` of shape
+        ``(batch_size, rows, columns)``.  Modifications to the array will
+        modify this object too.
+        """
+        return self._block.as_ndarray().reshape(
+            self.shape[0], self.batch_size, self.shape[1]
+        ).transpose(1, 0, 2)
+
+    def to_array(self):
+        """
+        Get a copy of a batch of a single state as a full 2D NumPy array.
+        Use `as_ndarray` to access the values of larger batches.
+        """
+        if self.batch_size != 1:
+            raise ValueError(
+                "a batch of " + str(self.batch_size)
+                + " states cannot be represented as a single matrix"
+            )
+        return self._block.to_array()
+
+    def states(self):
+        """
+        Get a list of copies of the members of the batch, as `Dense`.
+        """
+        return [Dense(state) for state in self.as_ndarray()]
+
+    def trace(self):
+        return trace_densebatch(self)
+
+    def adjoint(self):
+        return adjoint_densebatch(self)
+
+    def conj(self):
+        return conj_densebatch(self)
+
+    def transpose(self):
+        return transpose_densebatch(self)
+
+    def copy(self):
+        return _from_block(self._block.copy(), self.batch_size)
+
+
+def _from_block(block, batch_size):
+    out = DenseBatch.__new__(DenseBatch)
+    out._init(block, batch_size)
+    return out
+
+
+def _check_batches(left, right):
+    if left.shape != right.shape or left.batch_size != right.batch_size:
+        raise ValueError(
+            "incompatible batches of shapes "
+            + str(left.shape) + " and " + str(right.shape)
+            + " with sizes "
+            + str(left.batch_size) + " and " + str(right.batch_size)
+        )
+
+
+def _members(matrix):
+    # A 3D array of the members of a batch, or of the single state `matrix`.
+    if isinstance(matrix, DenseBatch):
+        return matrix.as_ndarray()
+    return matrix.to_array()[None, :, :]
+
+
+# Conversions
+
+def dense_from_densebatch(matrix: DenseBatch) -> Dense:
+    if matrix.batch_size != 1:
+        raise ValueError(
+            "a batch of " + str(matrix.batch_size)
+            + " states cannot be converted to a single matrix"
+        )
+    return matrix._block.copy()
+
+
+def densebatch_from_dense(matrix: Dense) -> DenseBatch:
+    return _from_block(matrix.reorder(fortran=False), 1)
+
+
+# Mathematics
+
+def add_densebatch(
+    left: DenseBatch, right: DenseBatch, scale=1
+) -> DenseBatch:
+    _check_batches(left, right)
+    return _from_block(add_dense(left._block, right._block, scale),
+                       left.batch_size)
+
+
+def iadd_densebatch(
+    left: DenseBatch, right: DenseBatch, scale=1
+) -> DenseBatch:
+    _check_batches(left, right)
+    iadd_dense(left._block, right._block, scale)
+    return left
+
+
+def sub_densebatch(left: DenseBatch, right: DenseBatch) -> DenseBatch:
+    _check_batches(left, right)
+    return _from_block(sub_dense(left._block, right._block), left.batch_size)
+
+
+def mul_densebatch(matrix: DenseBatch, value) -> DenseBatch:
+    return _from_block(mul_dense(matrix._block, value), matrix.batch_size)
+
+
+def imul_densebatch(matrix: DenseBatch, value) -> DenseBatch:
+    imul_dense(matrix._block, value)
+    return matrix
+
+
+def neg_densebatch(matrix: DenseBatch) -> DenseBatch:
+    return _from_block(neg_dense(matrix._block), matrix.batch_size)
+
+
+def conj_densebatch(matrix: DenseBatch) -> DenseBatch:
+    return _from_block(conj_dense(matrix._block), matrix.batch_size)
+
+
+def transpose_densebatch(matrix: DenseBatch) -> DenseBatch:
+    return DenseBatch(matrix.as_ndarray().transpose(0, 2, 1))
+
+
+def adjoint_densebatch(matrix: DenseBatch) -> DenseBatch:
+    return DenseBatch(matrix.as_ndarray().transpose(0, 2, 1).conj())
+
+
+def trace_densebatch(matrix: DenseBatch) -> np.ndarray:
+    """
+    Get the trace of every member of the batch.
+    """
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("cannot compute trace of non-square matrix")
+    return np.trace(matrix.as_ndarray(), axis1=1, axis2=2)
+
+
+def _matmul(kernel, left, right, scale, out):
+    if out is not None:
+        _check_batches(right, out)
+        kernel(left, right._block, scale, out._block)
+        return out
+    return _from_block(kernel(left, right._block, scale), right.batch_size)
+
+
+def matmul_csr_densebatch(
+    left: CSR, right: DenseBatch, scale=1, out: DenseBatch = None
+) -> DenseBatch:
+    """
+    Apply the operator `left` to every member of the batch `right`.  This is
+    one sparse-dense matrix product over all the members.
+
+    If `out` is given, ``scale * (left @ right)`` is added to it in place.
+    """
+    return _matmul(matmul_csr_dense_dense, left, right, scale, out)
+
+
+def matmul_dense_densebatch(
+    left: Dense, right: DenseBatch, scale=1, out: DenseBatch = None
+) -> DenseBatch:
+    """
+    Apply the operator `left` to every member of the batch `right`.  This is
+    one dense matrix product over all the members.
+
+    If `out` is given, ``scale * (left @ right)`` is added to it in place.
+    """
+    return _matmul(matmul_dense, left, right, scale, out)
+
+
+def matmul_dia_densebatch(
+    left: Dia, right: DenseBatch, scale=1, out: DenseBatch = None
+) -> DenseBatch:
+    """
+    Apply the operator `left` to every member of the batch `right`.  This is
+    one diagonal-dense matrix product over all the members.
+
+    If `out` is given, ``scale * (left @ right)`` is added to it in place.
+    """
+    return _matmul(matmul_dia_dense_dense, left, right, scale, out)
+
+
+def _expect(kernel, op, state):
+    if state.shape[1] != 1 and state.shape[0] != state.shape[1]:
+        raise ValueError("state must be a ket or a density matrix")
+    applied = kernel(op, state._block).as_ndarray()
+    if state.shape[1] == 1:
+        return np.einsum('ik,ik->k', state._block.as_ndarray().conj(), applied)
+    # Each member is a density matrix, so take the trace of each `op @ rho`.
+    applied = applied.reshape(state.shape[0], state.batch_size, state.shape[1])
+    return np.einsum('iki->k', applied)
+
+
+def expect_csr_densebatch(op: CSR, state: DenseBatch) -> np.ndarray:
+    """
+    Get the expectation value of the operator `op` over every member of the
+    batch `state`.  The members can be either kets or density matrices.
+    """
+    return _expect(matmul_csr_dense_dense, op, state)
+
+
+def expect_dense_densebatch(op: Dense, state: DenseBatch) -> np.ndarray:
+    """
+    Get the expectation value of the operator `op` over every member of the
+    batch `state`.  The members can be either kets or density matrices.
+    """
+    return _expect(matmul_dense, op, state)
+
+
+def expect_dia_densebatch(op: Dia, state: DenseBatch) -> np.ndarray:
+    """
+    Get the expectation value of the operator `op` over every member of the
+    batch `state`.  The members can be either kets or density matrices.
+    """
+    return _expect(matmul_dia_dense_dense, op, state)
+
+
+def inner_densebatch(
+    left: Data, right: Data, scalar_is_ket=False
+) -> np.ndarray:
+    """
+    Compute the complex inner products <left|right> for every member of the
+    batches.  One of `left` and `right` can be a single state, in which case
+    it is used with every member of the other.  The shape of `left` is used
+    to determine if it has been supplied as kets or bras.
+    """
+    if (
+        right.shape[1] != 1
+        or left.shape[0] * left.shape[1] != right.shape[0]
+        or 1 not in left.shape
+    ):
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(left.shape)
+            + " and "
+            + str(right.shape)
+        )
+    left_members = _members(left).reshape(-1, right.shape[0])
+    right_members = _members(right).reshape(-1, right.shape[0])
+    if (
+        len(left_members) != len(right_members)
+        and 1 not in (len(left_members), len(right_members))
+    ):
+        raise ValueError(
+            "incompatible batch sizes "
+            + str(len(left_members)) + " and " + str(len(right_members))
+        )
+    if left.shape[1] == 1 or (right.shape[0] == 1 and scalar_is_ket):
+        left_members = left_members.conj()
+    return np.einsum('ki,ki->k', left_members, right_members)
+
+
+def frobenius_densebatch(matrix: DenseBatch) -> np.ndarray:
+    """
+    Get the Frobenius norm of every member of the batch.
+    """
+    return np.linalg.norm(matrix.as_ndarray(), axis=(1, 2))
+
+
+def l2_densebatch(vector: DenseBatch) -> np.ndarray:
+    """
+    Get the L2 norm of every member of a batch of kets or bras.
+    """
+    if vector.shape[0] != 1 and vector.shape[1] != 1:
+        raise ValueError("L2 norm is only defined on vectors")
+    return frobenius_densebatch(vector)
+
+
+add.add_specialisations([
+    (DenseBatch, DenseBatch, DenseBatch, add_densebatch),
+], _defer=True)
+
+iadd.add_specialisations([
+    (DenseBatch, DenseBatch, DenseBatch, iadd_densebatch),
+], _defer=True)
+
+sub.add_specialisations([
+    (DenseBatch, DenseBatch, DenseBatch, sub_densebatch),
+], _defer=True)
+
+mul.add_specialisations([
+    (DenseBatch, DenseBatch, mul_densebatch),
+], _defer=True)
+
+imul.add_specialisations([
+    (DenseBatch, DenseBatch, imul_densebatch),
+], _defer=True)
+
+neg.add_specialisations([
+    (DenseBatch, DenseBatch, neg_densebatch),
+], _defer=True)
+
+adjoint.add_specialisations([
+    (DenseBatch, DenseBatch, adjoint_densebatch),
+], _defer=True)
+
+transpose.add_specialisations([
+    (DenseBatch, DenseBatch, transpose_densebatch),
+], _defer=True)
+
+conj.add_specialisations([
+    (DenseBatch, DenseBatch, conj_densebatch),
+], _defer=True)
+
+trace.add_specialisations([
+    (DenseBatch, trace_densebatch),
+], _defer=True)
+
+matmul.add_specialisations([
+    (CSR, DenseBatch, DenseBatch, matmul_csr_densebatch),
+    (Dense, DenseBatch, DenseBatch, matmul_dense_densebatch),
+    (Dia, DenseBatch, DenseBatch, matmul_dia_densebatch),
+], _defer=True)
+
+expect.add_specialisations([
+    (CSR, DenseBatch, expect_csr_densebatch),
+    (Dense, DenseBatch, expect_dense_densebatch),
+    (Dia, DenseBatch, expect_dia_densebatch),
+], _defer=True)
+
+inner.add_specialisations([
+    (DenseBatch, DenseBatch, inner_densebatch),
+    (Dense, DenseBatch, inner_densebatch),
+    (DenseBatch, Dense, inner_densebatch),
+], _defer=True)
+
+frobenius.add_specialisations([
+    (DenseBatch, frobenius_densebatch),
+], _defer=True)
+
+l2.add_specialisations([
+    (DenseBatch, l2_densebatch),
+], _defer=True)
@@ -96,6 +96,10 @@ cdef class Dia(base.Data):
         if np.lib.NumpyVersion(np.__version__) < '2.0.0b1':
             # np2 accept None which act as np1's False
             copy = builtins.bool(copy)
+        elif copy is False:
+            # Only avoid the copy when possible: the index arrays need one
+            # whenever their integer type differs from `idxint`.
+            copy = None
         data = np.array(arg[0], dtype=np.complex128, copy=copy, order='C')
         offsets = np.array(arg[1], dtype=idxint_dtype, copy=copy, order='C')
 
@@ -167,7 +171,7 @@ cdef class Dia(base.Data):
         out.num_diag = self.num_diag
         memcpy(out.data, self.data, self.num_diag * self.shape[1] * sizeof(double complex))
         memcpy(out.offsets, self.offsets, self.num_diag * sizeof(base.idxint))
-
+        base.copy_properties(self, out)
         return out
 
     cpdef object to_array(self):
@@ -280,15 +284,16 @@ cpdef Dia empty(base.idxint rows, base.idxint cols, base.idxint num_diag):
     """
     if num_diag < 0:
         raise ValueError("num_diag must be a positive integer.")
-    cdef Dia out = Dia.__new__(Dia)
-    out.shape = (rows, cols)
-    out.num_diag = 0
     # Python doesn't like allocating nothing.
     if num_diag == 0:
         num_diag += 1
+    cdef size_t size = base.mul_checked(cols, num_diag)
+    cdef Dia out = Dia.__new__(Dia)
+    out.shape = (rows, cols)
+    out.num_diag = 0
     out._max_diag = num_diag
     out.data =\
-        <double complex *> PyDataMem_NEW(cols * num_diag * sizeof(double complex))
+        <double complex *> PyDataMem_NEW(size * sizeof(double complex))
     out.offsets =\
         <base.idxint *> PyDataMem_NEW(num_diag * sizeof(base.idxint))
     if not out.data:
@@ -332,6 +337,8 @@ cpdef Dia identity(base.idxint dimension, double complex scale=1):
         out.data[i] = scale
     out.offsets[0] = 0
     out.num_diag = 1
+    out._isherm = True if scale.imag == 0 else None
+    out._isdiag = True
     return out
 
 
@@ -17,6 +17,39 @@ from qutip import settings
 
 __all__ = ['Dispatcher']
 
+# The active `profiling.DispatchProfile`, if any.  This is only set by
+# `profiling.profile`, and is checked on every call, so it must stay cheap.
+cdef object _profiler = None
+
+
+# Whether `_cost_specialisation` uses the cost functions, or always its default.
+cdef bint _use_costs = True
+
+
+def _cost_dispatch_enabled():
+    """Whether specialisations are chosen using their cost functions."""
+    return _use_costs
+
+
+def _set_cost_dispatch(enabled):
+    """
+    Enable or disable choosing between specialisations with their cost
+    functions.
+    """
+    global _use_costs
+    _use_costs = enabled
+
+
+def _set_profiler(profiler):
+    """
+    Set the object which records dispatcher calls and conversions, returning
+    the previous one.  Pass `None` to disable recording.
+    """
+    global _profiler
+    previous = _profiler
+    _profiler = profiler
+    return previous
+
 
 cdef object _conversion_weight(tuple froms, tuple tos, dict weight_map, bint out):
     """
@@ -53,7 +86,7 @@ cdef class _constructed_specialisation:
     signature of this object.
     """
     cdef readonly bint _output
-    cdef object _call
+    cdef readonly object _call
     cdef readonly Py_ssize_t _n_inputs, _n_dispatch
     cdef readonly tuple types
     cdef readonly tuple _converters
@@ -86,6 +119,8 @@ cdef class _constructed_specialisation:
     def __call__(self, *args, **kwargs):
         cdef int i
         cdef list _args = list(args)
+        if _profiler is not None:
+            return self._profiled_call(_args, kwargs)
         for i in range(self._n_inputs):
             _args[i] = self._converters[i](args[i])
         out = self._call(*_args, **kwargs)
@@ -93,6 +128,19 @@ cdef class _constructed_specialisation:
             out = self._converters[self._n_dispatch - 1](out)
         return out
 
+    cdef object _profiled_call(self, list args, dict kwargs):
+        cdef int i
+        for i in range(self._n_inputs):
+            args[i] = _profiler.convert(
+                self._short_name, self._converters[i], args[i]
+            )
+        out = self._call(*args, **kwargs)
+        if self._output:
+            out = _profiler.convert(
+                self._short_name, self._converters[self._n_dispatch - 1], out
+            )
+        return out
+
     def __repr__(self):
         if len(self.types) == 1:
             spec = self.types[0].__name__
@@ -137,7 +185,12 @@ cdef class _group_specialisation:
 
     @cython.wraparound(False)
     def __call__(self, *args, **kwargs):
-        return _to(self.group, self._call(*args, **kwargs))
+        out = self._call(*args, **kwargs)
+        if _profiler is not None:
+            return _profiler.convert(
+                self._short_name, functools.partial(_to, self.group), out
+            )
+        return _to(self.group, out)
 
     def __repr__(self):
         if len(self.types) == 0:
@@ -149,6 +202,79 @@ cdef class _group_specialisation:
         ])
 
 
+cdef class _cost_specialisation:
+    """
+    Callable object choosing at call time between several specialisations of
+    a data-layer operation for a particular set of input types
+    (`self.types`).  The cost function registered for each candidate is
+    called with the dispatched arguments, and the cheapest candidate is run.
+    If cost dispatch is disabled, `self.default` is always run.
+
+    See `self.__signature__` or `self.__text_signature__` for the call
+    signature of this object.
+    """
+    cdef readonly tuple types
+    cdef readonly object default
+    cdef readonly tuple candidates
+    cdef readonly tuple costs
+    cdef readonly Py_ssize_t _n_inputs
+    cdef readonly str _short_name
+    cdef public str __doc__
+    cdef public str __name__
+    cdef public object __signature__
+    cdef readonly str __text_signature__
+
+    def __init__(self, Dispatcher dispatcher, types, default, candidates,
+                 costs):
+        self.__doc__ = inspect.getdoc(dispatcher)
+        self._short_name = dispatcher.__name__
+        self.__name__ = (
+            self._short_name
+            + "_"
+            + "_".join([x.__name__ for x in types])
+        )
+        self.__signature__ = dispatcher.__signature__
+        self.__text_signature__ = dispatcher.__text_signature__
+        self.types = types
+        self.default = default
+        self.candidates = tuple(candidates)
+        self.costs = tuple(costs)
+        self._n_inputs = len(types)
+
+    @cython.wraparound(False)
+    cdef object _choose(self, tuple args):
+        cdef Py_ssize_t i
+        cdef object best = self.default
+        cdef double cost, best_cost = math.INFINITY
+        if not _use_costs:
+            return self.default
+        if len(args) != self._n_inputs:
+            args = args[:self._n_inputs]
+        for i in range(len(self.candidates)):
+            cost = self.costs[i](*args)
+            if cost < best_cost:
+                best_cost = cost
+                best = self.candidates[i]
+        return best
+
+    def choose(self, *args):
+        """
+        Get the candidate specialisation with the lowest cost for the
+        dispatched arguments `args`.
+        """
+        return self._choose(args)
+
+    def __call__(self, *args, **kwargs):
+        return self._choose(args)(*args, **kwargs)
+
+    def __repr__(self):
+        return "".join([
+            "<cost-based specialisation (",
+            ", ".join(x.__name__ for x in self.types),
+            ") of ", self._short_name, ">"
+        ])
+
+
 cdef class Dispatcher:
     """
     Dispatcher for a data-layer operation.  This object can be called with the
@@ -167,6 +293,7 @@ cdef class Dispatcher:
     type on the end, if this is a dispatcher over the output type.
     """
     cdef readonly dict _specialisations
+    cdef readonly dict _costs
     cdef readonly Py_ssize_t _n_dispatch, _n_inputs
     cdef readonly dict _lookup
     cdef readonly set _dtypes
@@ -257,6 +384,7 @@ cdef class Dispatcher:
             self.__doc__ = inspect.getdoc(signature_source)
         self.output = out
         self._specialisations = {}
+        self._costs = {}
         self._lookup = {}
         self._n_inputs = len(self.inputs)
         self._n_dispatch = len(self.inputs) + self.output
@@ -336,6 +464,48 @@ cdef class Dispatcher:
         if not _defer:
             self.rebuild_lookup()
 
+    def add_costs(self, costs, _defer=False):
+        """
+        Add cost functions to specialisations of this operation, so that the
+        dispatcher can choose between them using the actual arguments rather
+        than only their types.
+
+        When the arguments have a cost-annotated specialisation, every other
+        cost-annotated specialisation which can be reached by converting
+        inputs to dense types only (and with the same output type) is also a
+        candidate.  At call time, the cost function of each candidate is
+        called with the dispatched arguments, and the cheapest is run.  For
+        example, a product of a fairly filled `CSR` matrix with a `Dense` one
+        can be faster by converting the `CSR` matrix to `Dense` and using BLAS.
+
+        Parameters
+        ----------
+        costs : iterable of tuples
+            An iterable where each element is a tuple of the types of an
+            existing specialisation, in the same form as the keys used in
+            `add_specialisations`, followed by the cost function.  The cost
+            function takes the dispatched arguments, which have not been
+            converted, and returns the estimated run time in seconds,
+            including any conversions needed.  It is called on every dispatch,
+            so it must be cheap.
+
+        _defer : bool, optional (False)
+            Only intended for internal library use during initialisation. If
+            `True`, the lookup table is not rebuilt until a manual call to
+            `Dispatcher.rebuild_lookup()` is made.
+        """
+        for arg in costs:
+            arg = tuple(arg)
+            if arg[:-1] not in self._specialisations:
+                raise ValueError(
+                    "no specialisation for types " + str(arg[:-1])
+                )
+            if not callable(arg[-1]):
+                raise TypeError(str(arg[-1]) + " is not callable")
+            self._costs[arg[:-1]] = arg[-1]
+        if not _defer:
+            self.rebuild_lookup()
+
     def register(self, *dtypes, _defer=False):
         """
         Decorator for add_specialisations.
@@ -448,6 +618,47 @@ cdef class Dispatcher:
                 _constructed_specialisation(function, self, displayed_type,
                                             converters, output)
 
+    cdef object _add_cost_specialisation(self, tuple in_types):
+        # Replace the lookup for `in_types` (without an output type) by a
+        # choice between the cost-annotated specialisations, if the one found
+        # by the conversion weights is cost-annotated and has alternatives.
+        cdef tuple types, chosen_types = None
+        default = self._lookup[in_types]
+        if isinstance(default, _constructed_specialisation):
+            if (<_constructed_specialisation> default)._output:
+                return
+            function = (<_constructed_specialisation> default)._call
+        else:
+            function = default
+        for types in self._costs:
+            if self._specialisations[types] is function:
+                chosen_types = types
+        if chosen_types is None:
+            return
+        candidates, costs = [], []
+        for types, cost in self._costs.items():
+            if self.output and types[-1] is not chosen_types[-1]:
+                continue
+            if not all(
+                to_type is from_type or to_type.sparcity() == "dense"
+                for to_type, from_type in zip(types, in_types)
+            ):
+                continue
+            if types[:self._n_inputs] == in_types:
+                candidate = self._specialisations[types]
+            else:
+                converters = tuple(_to[pair] for pair in zip(types, in_types))
+                candidate = _constructed_specialisation(
+                    self._specialisations[types], self,
+                    in_types + types[self._n_inputs:], converters, False,
+                )
+            candidates.append(candidate)
+            costs.append(cost)
+        if len(candidates) > 1:
+            self._lookup[in_types] = _cost_specialisation(
+                self, in_types, default, candidates, costs
+            )
+
     def rebuild_lookup(self, verbose=False):
         """
         Manually trigger a rebuild of the lookup table for this dispatcher.
@@ -474,6 +685,9 @@ cdef class Dispatcher:
                 default_dtype = _to.parse(settings.core["default_dtype"])
             for in_types in itertools.product(self._dtypes, repeat=self._n_dispatch-1):
                 self._find_specialization(in_types, False, default_dtype, verbose)
+        if self._costs:
+            for in_types in itertools.product(self._dtypes, repeat=self._n_inputs):
+                self._add_cost_specialisation(in_types)
         if self.output:
             for in_types in itertools.product(self._dtypes, repeat=self._n_dispatch-1):
                 for group in _to.groups:
@@ -520,4 +734,8 @@ cdef class Dispatcher:
             function = self._lookup[tuple(dispatch)]
         except KeyError:
             raise TypeError("unknown types to dispatch on: " + str(dispatch)) from None
+        if _profiler is not None:
+            if type(function) is _cost_specialisation:
+                function = (<_cost_specialisation> function)._choose(args)
+            return _profiler.call(self.__name__, function, args, kwargs)
         return function(*args, **kwargs)
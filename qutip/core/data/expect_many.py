@@ -0,0 +1,141 @@
+"""
+Expectation values of several operators with the same state.
+
+Calling `expect` once per operator reads the state once per operator and pays
+the dispatch overhead every time.  `ExpectMany` instead stacks the operators
+once into a single matrix, so that all the expectation values with a state are
+obtained from one sparse-dense (or dense-dense) product and a reduction.
+"""
+
+import numpy as np
+import scipy.sparse
+
+from .base import Data
+from .dense import Dense
+from .csr import CSR
+from .dia import Dia
+from .convert import to
+from .expect import expect
+
+__all__ = ['ExpectMany', 'expect_many']
+
+
+class ExpectMany:
+    """
+    The expectation values of a fixed list of square operators, which are
+    evaluated together for any state passed when calling the object.
+
+    The operators are stacked on creation.  `CSR` and `Dia` operators are
+    stacked in a sparse matrix, and `Dense` operators in a dense array; any
+    other combination of types falls back to calling `expect` for each
+    operator.  The operators are not copied for the fallback, and the stacked
+    matrices are not updated if an operator is modified in-place afterwards.
+
+    Parameters
+    ----------
+    ops : list of :class:`.Data`
+        The operators, which must all be square and have the same shape.
+    """
+    def __init__(self, ops):
+        ops = list(ops)
+        if not ops:
+            raise ValueError("at least one operator is needed")
+        for op in ops:
+            if not isinstance(op, Data):
+                raise TypeError(
+                    "operators must be data-layer objects, not "
+                    + repr(type(op))
+                )
+            if op.shape[0] != op.shape[1] or op.shape != ops[0].shape:
+                raise ValueError(
+                    "operators must be square and all of the same shape"
+                )
+        self.ops = ops
+        self.shape = ops[0].shape
+        if all(type(op) is Dense for op in ops):
+            self._kind = "dense"
+            self._stack = np.stack([op.as_ndarray() for op in ops])
+        elif all(type(op) in (CSR, Dia) for op in ops):
+            self._kind = "sparse"
+            self._stack = scipy.sparse.vstack(
+                [op.as_scipy() for op in ops], format="csr",
+            )
+        else:
+            self._kind = None
+            self._stack = None
+        # The flattened operators used with density matrices, only made when
+        # first needed.
+        self._flat = [None, None]
+
+    def __len__(self):
+        return len(self.ops)
+
+    def _flat_stack(self, transpose):
+        # Row ``k`` is operator ``k`` (or its transpose) flattened in row-major
+        # order, so that ``trace(op @ rho) == flat[k] @ rho.T.ravel()``.  The
+        # transposed version is used with row-major states, for which
+        # ``rho.ravel()`` is a view and ``rho.T.ravel()`` would be a copy.
+        if self._flat[transpose] is None:
+            n = self.shape[0]
+            stack = self._stack
+            if self._kind == "dense":
+                if transpose:
+                    stack = stack.transpose(0, 2, 1)
+                flat = np.ascontiguousarray(stack).reshape(len(self), n * n)
+            else:
+                if transpose:
+                    stack = scipy.sparse.vstack(
+                        [op.as_scipy().transpose() for op in self.ops],
+                        format="csr",
+                    )
+                flat = stack.reshape((len(self), n * n)).tocsr()
+            self._flat[transpose] = flat
+        return self._flat[transpose]
+
+    def __call__(self, state):
+        """
+        Get the expectation values of all the operators with ``state``, which
+        can be a ket or a density matrix, as a complex array.
+        """
+        n = self.shape[0]
+        if (
+            state.shape[0] != n
+            or (state.shape[1] != 1 and state.shape[1] != n)
+        ):
+            raise ValueError("incorrect input shapes "
+                             + str(self.shape) + " and " + str(state.shape))
+        if self._kind is None:
+            return np.array([expect(op, state) for op in self.ops],
+                            dtype=np.complex128)
+        array = to(Dense, state).as_ndarray()
+        if state.shape[1] == 1:
+            ket = array[:, 0]
+            op_ket = (self._stack @ ket).reshape(len(self), n)
+            return op_ket @ ket.conj()
+        if array.flags.c_contiguous:
+            flat = self._flat_stack(True) @ array.ravel()
+        else:
+            flat = self._flat_stack(False) @ array.ravel(order="F")
+        return np.asarray(flat, dtype=np.complex128)
+
+
+def expect_many(ops, state):
+    """
+    Get the expectation values of several operators with the same state in
+    one pass.  If the same operators are used with many states, create an
+    `ExpectMany` once and call it with each state instead.
+
+    Parameters
+    ----------
+    ops : list of :class:`.Data`
+        The operators, which must all be square and have the same shape.
+
+    state : :class:`.Data`
+        A ket or density matrix.
+
+    Returns
+    -------
+    np.ndarray
+        The complex expectation values, in the order of ``ops``.
+    """
+    return ExpectMany(ops)(state)
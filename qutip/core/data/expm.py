@@ -15,6 +15,8 @@ from .base import idxint_dtype
 
 __all__ = [
     'expm', 'expm_csr', 'expm_csr_dense', 'expm_dense', 'expm_dia',
+    'expm_multiply', 'expm_multiply_csr_dense', 'expm_multiply_dia_dense',
+    'expm_multiply_dense',
     'logm', 'logm_dense', 'sqrtm', 'sqrtm_dense'
 ]
 
@@ -119,6 +121,84 @@ expm.add_specialisations([
 ], _defer=True)
 
 
+def _check_expm_multiply_shape(matrix, state):
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("can only exponentiate square matrix")
+    if matrix.shape[1] != state.shape[0]:
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(matrix.shape)
+            + " and "
+            + str(state.shape)
+        )
+
+
+def _expm_multiply(matrix, state, t):
+    # scipy implements the truncated Taylor series of Al-Mohy and Higham,
+    # which only needs products of the generator with the state.
+    if t != 1:
+        matrix = matrix * t
+    return Dense(
+        scipy.sparse.linalg.expm_multiply(matrix, state.as_ndarray()),
+        copy=False,
+    )
+
+
+def expm_multiply_csr_dense(matrix: CSR, state: Dense, t=1) -> Dense:
+    _check_expm_multiply_shape(matrix, state)
+    return _expm_multiply(matrix.as_scipy(), state, t)
+
+
+def expm_multiply_dia_dense(matrix: Dia, state: Dense, t=1) -> Dense:
+    _check_expm_multiply_shape(matrix, state)
+    return _expm_multiply(matrix.as_scipy(), state, t)
+
+
+def expm_multiply_dense(matrix: Dense, state: Dense, t=1) -> Dense:
+    _check_expm_multiply_shape(matrix, state)
+    return _expm_multiply(matrix.as_ndarray(), state, t)
+
+
+expm_multiply = _Dispatcher(
+    _inspect.Signature([
+        _inspect.Parameter('matrix', _inspect.Parameter.POSITIONAL_ONLY),
+        _inspect.Parameter('state', _inspect.Parameter.POSITIONAL_ONLY),
+        _inspect.Parameter('t', _inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                           default=1),
+    ]),
+    name='expm_multiply',
+    module=__name__,
+    inputs=('matrix', 'state'),
+    out=True,
+)
+expm_multiply.__doc__ =\
+    """
+    Action of the matrix exponential `e**(t*A) @ B` of a square matrix `A` on
+    a matrix `B`, without forming `e**(t*A)`.
+
+    Only products of `A` with `B` are computed, so the memory cost is that of
+    `A` and `B`, and a sparse `A` stays sparse.  This is the method of
+    Al-Mohy and Higham, SIAM J. Sci. Comput. 33, 488 (2011).
+
+    Parameters
+    ----------
+    matrix : Data
+        The square matrix `A` to exponentiate.
+
+    state : Data
+        The matrix `B` to act on, for example a ket or a vectorised density
+        matrix.  Its number of rows must match the size of `A`.
+
+    t : complex, optional
+        The scale factor of `A` in the exponential.
+    """
+expm_multiply.add_specialisations([
+    (CSR, Dense, Dense, expm_multiply_csr_dense),
+    (Dia, Dense, Dense, expm_multiply_dia_dense),
+    (Dense, Dense, Dense, expm_multiply_dense),
+], _defer=True)
+
+
 def logm_dense(matrix: Dense) -> Dense:
     if matrix.shape[0] != matrix.shape[1]:
         raise ValueError("can only compute logarithm square matrix")
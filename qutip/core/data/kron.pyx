@@ -1,10 +1,9 @@
 #cython: language_level=3
 #cython: boundscheck=False, wraparound=False, initializedcheck=False
 
-cimport cython
 from libc.string cimport memset
 
-from qutip.core.data.base cimport idxint, Data
+from qutip.core.data.base cimport idxint, Data, mul_checked
 from qutip.core.data.csr cimport CSR
 from qutip.core.data.dense cimport Dense
 from .adjoint import transpose
@@ -18,16 +17,30 @@ __all__ = [
     'kron_csr_dense_csr', 'kron_dense_csr_csr',
     'kron_dia_dense_dia', 'kron_dense_dia_dia',
     'kron_transpose', 'kron_transpose_dense', 'kron_transpose_data',
+    'kron_many', 'kron_many_csr', 'kron_many_dense', 'kron_many_dia',
 ]
 
 
-@cython.overflowcheck(True)
-cdef idxint _mul_checked(idxint a, idxint b):
-    return a * b
+cdef inline int _kron_properties(list matrices, Data out) except -1:
+    cdef bint isherm = True, isdiag = True
+    cdef Data matrix
+    for matrix in matrices:
+        isherm = isherm and matrix._isherm is True
+        isdiag = (
+            isdiag and matrix._isdiag is True
+            and matrix.shape[0] == matrix.shape[1]
+        )
+    out._isherm = True if isherm else None
+    out._isdiag = True if isdiag else None
+    return 0
 
 
 cpdef Dense kron_dense(Dense left, Dense right):
-    return Dense(numpy.kron(left.as_ndarray(), right.as_ndarray()), copy=False)
+    cdef Dense out = Dense(
+        numpy.kron(left.as_ndarray(), right.as_ndarray()), copy=False,
+    )
+    _kron_properties([left, right], out)
+    return out
 
 
 cpdef CSR kron_csr(CSR left, CSR right):
@@ -37,9 +50,9 @@ cpdef CSR kron_csr(CSR left, CSR right):
     cdef idxint row_l, row_r, row_out
     cdef idxint ptr_start_l, ptr_end_l, ptr_start_r, ptr_end_r, dist_l, dist_r
     cdef idxint ptr_l, ptr_r, ptr_out, ptr_start_out, ptr_end_out
-    cdef CSR out = csr.empty(_mul_checked(nrows_l, nrows_r),
-                             _mul_checked(ncols_l, ncols_r),
-                             _mul_checked(csr.nnz(left), csr.nnz(right)))
+    cdef CSR out = csr.empty(mul_checked(nrows_l, nrows_r),
+                             mul_checked(ncols_l, ncols_r),
+                             mul_checked(csr.nnz(left), csr.nnz(right)))
     with nogil:
         row_out = 0
         out.row_index[row_out] = 0
@@ -69,6 +82,7 @@ cpdef CSR kron_csr(CSR left, CSR right):
 
                     ptr_start_out += dist_r
                     ptr_end_out += dist_r
+    _kron_properties([left, right], out)
     return out
 
 
@@ -99,9 +113,9 @@ cdef inline void _vec_kron(
 cpdef Dia kron_dia(Dia left, Dia right):
     cdef idxint nrows_l=left.shape[0], nrows_r=right.shape[0]
     cdef idxint ncols_l=left.shape[1], ncols_r=right.shape[1]
-    cdef idxint nrows=_mul_checked(nrows_l, nrows_r)
-    cdef idxint ncols=_mul_checked(ncols_l, ncols_r)
-    cdef idxint max_diag=_mul_checked(right.num_diag, left.num_diag)
+    cdef idxint nrows=mul_checked(nrows_l, nrows_r)
+    cdef idxint ncols=mul_checked(ncols_l, ncols_r)
+    cdef idxint max_diag=mul_checked(right.num_diag, left.num_diag)
     cdef idxint num_diag=0, diag_left, diag_right, delta, col_left, col_right
     cdef idxint start_left, end_left, start_right, end_right
     cdef Dia out
@@ -132,7 +146,7 @@ cpdef Dia kron_dia(Dia left, Dia right):
         out.num_diag = num_diag
 
     else:
-        max_diag = _mul_checked(max_diag, ncols_l)
+        max_diag = mul_checked(max_diag, ncols_l)
         if max_diag < nrows:
             out = dia.empty(nrows, ncols, max_diag)
             delta = right.shape[0] - right.shape[1]
@@ -172,6 +186,7 @@ cpdef Dia kron_dia(Dia left, Dia right):
             out = _to(Dia, out_dense)
 
     out = dia.clean_dia(out, True)
+    _kron_properties([left, right], out)
     return out
 
 
@@ -189,6 +204,66 @@ cpdef Dia kron_dense_dia_dia(Dense left, Dia right):
     return kron_dia(_to(Dia, left), right)
 
 
+cdef object _kron_many_balanced(list matrices, object kron_pair):
+    # The product of the products of the two halves of the factors.  The
+    # intermediate products are then no larger than about the square root of
+    # the output, instead of a fraction of it when folding from the left.
+    if len(matrices) == 1:
+        return matrices[0]
+    cdef Py_ssize_t mid = len(matrices) // 2
+    return kron_pair(
+        _kron_many_balanced(matrices[:mid], kron_pair),
+        _kron_many_balanced(matrices[mid:], kron_pair),
+    )
+
+
+cpdef CSR kron_many_csr(list matrices):
+    """
+    Kronecker product of several CSR matrices.  The product is taken as a
+    balanced tree, so that the only allocation of the size of the output is
+    the output itself, which is allocated with its exact number of stored
+    elements.
+    """
+    if not matrices:
+        raise ValueError("at least one matrix is needed")
+    if len(matrices) == 1:
+        return matrices[0].copy()
+    return _kron_many_balanced(matrices, kron_csr)
+
+
+cpdef Dense kron_many_dense(list matrices):
+    """
+    Kronecker product of several Dense matrices.  The product is taken as a
+    balanced tree, so that the only allocation of the size of the output is
+    the output itself.
+    """
+    if not matrices:
+        raise ValueError("at least one matrix is needed")
+    if len(matrices) == 1:
+        return matrices[0].copy()
+    cdef Dense out = Dense(
+        _kron_many_balanced(
+            [matrix.as_ndarray() for matrix in matrices], numpy.kron,
+        ),
+        copy=False,
+    )
+    _kron_properties(matrices, out)
+    return out
+
+
+cpdef Dia kron_many_dia(list matrices):
+    """
+    Kronecker product of several Dia matrices.  The product is taken as a
+    balanced tree, so that the only allocation of the size of the output is
+    the output itself.
+    """
+    if not matrices:
+        raise ValueError("at least one matrix is needed")
+    if len(matrices) == 1:
+        return matrices[0].copy()
+    return _kron_many_balanced(matrices, kron_dia)
+
+
 from .dispatch import Dispatcher as _Dispatcher
 import inspect as _inspect
 
@@ -218,6 +293,40 @@ kron.add_specialisations([
 ], _defer=True)
 
 
+def kron_many(matrices):
+    """
+    Compute the Kronecker product of several matrices, in order.  This gives
+    the same result as folding `kron` over the matrices, but, if they all
+    have the same type among `CSR`, `Dense` and `Dia`, without building the
+    intermediate products of the size of the output.  Other combinations of
+    types are folded with `kron`.
+
+    Parameters
+    ----------
+    matrices : iterable of Data
+        The factors of the product, of which there must be at least one.
+
+    Returns
+    -------
+    Data
+        The Kronecker product of the matrices.
+    """
+    matrices = list(matrices)
+    if not matrices:
+        raise ValueError("at least one matrix is needed")
+    types = set(type(matrix) for matrix in matrices)
+    if types == {CSR}:
+        return kron_many_csr(matrices)
+    if types == {Dense}:
+        return kron_many_dense(matrices)
+    if types == {Dia}:
+        return kron_many_dia(matrices)
+    out = matrices[0].copy()
+    for matrix in matrices[1:]:
+        out = kron(out, matrix)
+    return out
+
+
 cpdef Data kron_transpose_data(Data left, Data right):
     return kron(transpose(left), right)
 
@@ -0,0 +1,402 @@
+"""
+Lazy Kronecker products of small operators.
+
+Hamiltonians of many-body systems are sums of local terms, each of which is
+the identity on all but a few subsystems.  Forming the full Kronecker product
+of such a term stores the identity explicitly, so the matrix of a local term
+on a chain of 12 qubits has 4096 times more elements than its local factor.
+`KronProduct` instead stores the list of factors, and applies them to a state
+one subsystem at a time with `target_mode_matmul`, skipping the identities.
+
+Any operation without a `KronProduct` specialisation converts it to `CSR`,
+which forms the full product.
+"""
+
+import math
+
+from .base import Data
+from .dense import Dense
+from .csr import CSR
+from .dia import Dia
+from .add import add, iadd_dense, sub
+from .adjoint import adjoint, transpose, conj
+from .constant import identity_like
+from .convert import to
+from .expect import expect
+from .inner import inner_dense
+from .kron import kron, kron_many_csr
+from .local_matmul import target_mode_matmul_data_dense
+from .matmul import matmul
+from .mul import mul, mul_csr, mul_dense, imul, neg
+from .properties import iszero
+from .trace import trace
+
+__all__ = ['KronProduct']
+
+
+def _is_identity(factor):
+    if factor.shape[0] != factor.shape[1]:
+        return False
+    return iszero(sub(factor, identity_like(factor)), 0)
+
+
+class KronProduct(Data):
+    """
+    The Kronecker product of a list of factors, which is never formed
+    explicitly unless the object is converted to another type.
+
+    Parameters
+    ----------
+    factors : list of :class:`.Data`
+        The factors of the product, from the left-most to the right-most.  The
+        factors are not copied, and must not be modified in-place afterwards.
+
+    scale : complex, optional
+        A scalar multiplying the whole product.
+    """
+    def __init__(self, factors, scale=1):
+        factors = tuple(factors)
+        if not factors:
+            raise ValueError("a Kronecker product needs at least one factor")
+        for factor in factors:
+            if not isinstance(factor, Data) or isinstance(factor, KronProduct):
+                raise TypeError(
+                    "factors must be data-layer objects, not "
+                    + repr(type(factor))
+                )
+        self.factors = factors
+        self.scale = complex(scale)
+        self._identity = tuple(_is_identity(factor) for factor in factors)
+        super().__init__((
+            math.prod(factor.shape[0] for factor in factors),
+            math.prod(factor.shape[1] for factor in factors),
+        ))
+
+    @classmethod
+    def sparcity(self):
+        return "sparse"
+
+    def __reduce__(self):
+        return (KronProduct, (self.factors, self.scale))
+
+    def __repr__(self):
+        return "".join([
+            "KronProduct(shape=", str(self.shape),
+            ", factors=[",
+            ", ".join(
+                type(factor).__name__ + str(factor.shape)
+                for factor in self.factors
+            ),
+            "], scale=", str(self.scale), ")",
+        ])
+
+    def __str__(self):
+        return self.__repr__()
+
+    def to_array(self):
+        return csr_from_kronproduct(self).to_array()
+
+    def trace(self):
+        return trace_kronproduct(self)
+
+    def adjoint(self):
+        return adjoint_kronproduct(self)
+
+    def conj(self):
+        return conj_kronproduct(self)
+
+    def transpose(self):
+        return transpose_kronproduct(self)
+
+    def copy(self):
+        return KronProduct([factor.copy() for factor in self.factors],
+                           self.scale)
+
+
+def _factors(matrix):
+    if isinstance(matrix, KronProduct):
+        return matrix.factors, matrix.scale
+    return (matrix,), 1
+
+
+# Conversions
+
+def csr_from_kronproduct(matrix: KronProduct) -> CSR:
+    out = kron_many_csr([to(CSR, factor) for factor in matrix.factors])
+    return mul_csr(out, matrix.scale)
+
+
+def kronproduct_from_csr(matrix: CSR) -> KronProduct:
+    return KronProduct([matrix.copy()])
+
+
+# Mathematics
+
+def kron_kronproduct(left: Data, right: Data) -> KronProduct:
+    """
+    The lazy Kronecker product of `left` and `right`.  Either can be a
+    `KronProduct`, in which case its factors are used directly.
+    """
+    left_factors, left_scale = _factors(left)
+    right_factors, right_scale = _factors(right)
+    return KronProduct(left_factors + right_factors, left_scale * right_scale)
+
+
+def add_kronproduct(
+    left: KronProduct, right: KronProduct, scale=1
+) -> KronProduct:
+    """
+    Sum of two Kronecker products.  If they share the same factors, only the
+    scales are added.  Otherwise the sum is not a Kronecker product, and it is
+    formed as a `CSR` matrix stored as a single factor, so that the type is
+    closed under addition.
+    """
+    if left.shape != right.shape:
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(left.shape)
+            + " and "
+            + str(right.shape)
+        )
+    if len(left.factors) == len(right.factors) and all(
+        factor_l is factor_r
+        for factor_l, factor_r in zip(left.factors, right.factors)
+    ):
+        return KronProduct(left.factors, left.scale + scale * right.scale)
+    return KronProduct([
+        add(csr_from_kronproduct(left), csr_from_kronproduct(right), scale)
+    ])
+
+
+def sub_kronproduct(left: KronProduct, right: KronProduct) -> KronProduct:
+    return add_kronproduct(left, right, -1)
+
+
+def mul_kronproduct(matrix: KronProduct, value) -> KronProduct:
+    return KronProduct(matrix.factors, matrix.scale * value)
+
+
+def imul_kronproduct(matrix: KronProduct, value) -> KronProduct:
+    matrix.scale *= value
+    return matrix
+
+
+def neg_kronproduct(matrix: KronProduct) -> KronProduct:
+    return KronProduct(matrix.factors, -matrix.scale)
+
+
+def adjoint_kronproduct(matrix: KronProduct) -> KronProduct:
+    return KronProduct([adjoint(factor) for factor in matrix.factors],
+                       matrix.scale.conjugate())
+
+
+def transpose_kronproduct(matrix: KronProduct) -> KronProduct:
+    return KronProduct([transpose(factor) for factor in matrix.factors],
+                       matrix.scale)
+
+
+def conj_kronproduct(matrix: KronProduct) -> KronProduct:
+    return KronProduct([conj(factor) for factor in matrix.factors],
+                       matrix.scale.conjugate())
+
+
+def trace_kronproduct(matrix: KronProduct) -> complex:
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("cannot compute trace of non-square matrix")
+    out = matrix.scale
+    for factor, identity in zip(matrix.factors, matrix._identity):
+        out *= factor.shape[0] if identity else trace(factor)
+    return out
+
+
+def _check_matmul_shape(left, right, out):
+    if left.shape[1] != right.shape[0]:
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(left.shape)
+            + " and "
+            + str(right.shape)
+        )
+    if out is not None and out.shape != (left.shape[0], right.shape[1]):
+        raise ValueError(
+            "incompatible output shape, got "
+            + str(out.shape)
+            + " but needed "
+            + str((left.shape[0], right.shape[1]))
+        )
+
+
+def _apply_factors(matrix, state, dual):
+    # Apply every non-identity factor to its own subsystem of the state, on
+    # the left of the state (or on the right if `dual`).
+    index = 0 if dual else 1
+    hilbert = [factor.shape[index] for factor in matrix.factors]
+    for mode, (factor, identity) in enumerate(
+        zip(matrix.factors, matrix._identity)
+    ):
+        if identity:
+            continue
+        new_hilbert = hilbert.copy()
+        new_hilbert[mode] = factor.shape[1 - index]
+        state = target_mode_matmul_data_dense(
+            factor, state, [mode], hilbert, new_hilbert, dual=dual
+        )
+        hilbert = new_hilbert
+    return state
+
+
+def _finish(state, scale, out):
+    if out is not None:
+        iadd_dense(out, state, scale)
+        return out
+    return mul_dense(state, scale)
+
+
+def matmul_kronproduct_dense(
+    left: KronProduct, right: Dense, scale=1, out: Dense = None
+) -> Dense:
+    """
+    Apply the Kronecker product `left` to `right` one factor at a time,
+    without forming the full product.  The cost is proportional to the size
+    of `right` times the sizes of the non-identity factors.
+
+    If `out` is given, ``scale * (left @ right)`` is added to it in place.
+    """
+    _check_matmul_shape(left, right, out)
+    state = _apply_factors(left, right, False)
+    return _finish(state, scale * left.scale, out)
+
+
+def matmul_dense_kronproduct(
+    left: Dense, right: KronProduct, scale=1, out: Dense = None
+) -> Dense:
+    """
+    Apply the Kronecker product `right` from the right of `left` one factor
+    at a time, without forming the full product.
+
+    If `out` is given, ``scale * (left @ right)`` is added to it in place.
+    """
+    _check_matmul_shape(left, right, out)
+    state = _apply_factors(right, left, True)
+    return _finish(state, scale * right.scale, out)
+
+
+def matmul_kronproduct(
+    left: KronProduct, right: KronProduct, scale=1
+) -> KronProduct:
+    """
+    Product of two Kronecker products.  If their factors have compatible
+    shapes, the product is taken factor by factor and stays lazy, otherwise
+    the full product is formed as a single factor.
+    """
+    _check_matmul_shape(left, right, None)
+    if (
+        len(left.factors) == len(right.factors)
+        and all(
+            factor_l.shape[1] == factor_r.shape[0]
+            for factor_l, factor_r in zip(left.factors, right.factors)
+        )
+    ):
+        factors = [
+            factor_r if identity_l else
+            factor_l if identity_r else
+            matmul(factor_l, factor_r)
+            for factor_l, factor_r, identity_l, identity_r in zip(
+                left.factors, right.factors, left._identity, right._identity
+            )
+        ]
+        return KronProduct(factors, scale * left.scale * right.scale)
+    return KronProduct([
+        matmul(csr_from_kronproduct(left), csr_from_kronproduct(right), scale)
+    ])
+
+
+def expect_kronproduct_dense(op: KronProduct, state: Dense) -> complex:
+    """
+    Expectation value of the Kronecker product `op` with the ket or density
+    matrix `state`, without forming the full product.
+    """
+    if state.shape[1] == 1:
+        if op.shape[0] != op.shape[1] or op.shape[1] != state.shape[0]:
+            raise ValueError(
+                "incompatible matrix shapes "
+                + str(op.shape)
+                + " and "
+                + str(state.shape)
+            )
+        return inner_dense(state, matmul_kronproduct_dense(op, state))
+    if state.shape[0] != state.shape[1] or op.shape[1] != state.shape[0]:
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(op.shape)
+            + " and "
+            + str(state.shape)
+        )
+    return trace(matmul_kronproduct_dense(op, state))
+
+
+def iszero_kronproduct(matrix: KronProduct, tol=-1) -> bool:
+    if matrix.scale == 0:
+        return True
+    return any(iszero(factor, tol) for factor in matrix.factors)
+
+
+kron.add_specialisations([
+    (KronProduct, KronProduct, KronProduct, kron_kronproduct),
+    (KronProduct, CSR, KronProduct, kron_kronproduct),
+    (CSR, KronProduct, KronProduct, kron_kronproduct),
+    (KronProduct, Dense, KronProduct, kron_kronproduct),
+    (Dense, KronProduct, KronProduct, kron_kronproduct),
+    (KronProduct, Dia, KronProduct, kron_kronproduct),
+    (Dia, KronProduct, KronProduct, kron_kronproduct),
+], _defer=True)
+
+add.add_specialisations([
+    (KronProduct, KronProduct, KronProduct, add_kronproduct),
+], _defer=True)
+
+sub.add_specialisations([
+    (KronProduct, KronProduct, KronProduct, sub_kronproduct),
+], _defer=True)
+
+mul.add_specialisations([
+    (KronProduct, KronProduct, mul_kronproduct),
+], _defer=True)
+
+imul.add_specialisations([
+    (KronProduct, KronProduct, imul_kronproduct),
+], _defer=True)
+
+neg.add_specialisations([
+    (KronProduct, KronProduct, neg_kronproduct),
+], _defer=True)
+
+adjoint.add_specialisations([
+    (KronProduct, KronProduct, adjoint_kronproduct),
+], _defer=True)
+
+transpose.add_specialisations([
+    (KronProduct, KronProduct, transpose_kronproduct),
+], _defer=True)
+
+conj.add_specialisations([
+    (KronProduct, KronProduct, conj_kronproduct),
+], _defer=True)
+
+trace.add_specialisations([
+    (KronProduct, trace_kronproduct),
+], _defer=True)
+
+matmul.add_specialisations([
+    (KronProduct, Dense, Dense, matmul_kronproduct_dense),
+    (Dense, KronProduct, Dense, matmul_dense_kronproduct),
+    (KronProduct, KronProduct, KronProduct, matmul_kronproduct),
+], _defer=True)
+
+expect.add_specialisations([
+    (KronProduct, Dense, expect_kronproduct_dense),
+], _defer=True)
+
+iszero.add_specialisations([
+    (KronProduct, iszero_kronproduct),
+], _defer=True)
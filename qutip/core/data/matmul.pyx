@@ -18,7 +18,7 @@ cimport numpy as cnp
 from scipy.linalg cimport cython_blas as blas
 
 from qutip.core.data.base import idxint_dtype
-from qutip.core.data.base cimport idxint, Data
+from qutip.core.data.base cimport idxint, Data, size_checked, clear_properties
 from qutip.core.data.dense cimport Dense
 from qutip.core.data.csr cimport CSR
 from qutip.core.data.dia cimport Dia
@@ -76,6 +76,22 @@ cdef extern from "src/matmul_csr_dense.hpp" nogil:
         double complex scale, double complex *out,
         T nrows, T ncols)
 
+cdef extern from "src/matmul_csr_openmp.hpp" nogil:
+    int _has_openmp()
+    void _matmul_csr_vector_openmp[T](
+        double complex *data, T *col_index, T *row_index,
+        double complex *vec, double complex scale, double complex *out,
+        T nrows, int nthr)
+    void _matmul_csr_dense_c_order_openmp[T](
+        double complex *csr_data, T *csr_col_index, T *csr_row_index,
+        double complex *dense, double complex scale, double complex *out,
+        T nrows, T ncols, int nthr)
+
+# Whether the OpenMP kernels were compiled with OpenMP enabled (with the
+# `--with-openmp` build option).  If not, they are never used.
+has_openmp = bool(_has_openmp())
+cdef bint _use_openmp = has_openmp
+
 
 __all__ = [
     'matmul', 'matmul_csr', 'matmul_dense', 'matmul_dia',
@@ -110,13 +126,30 @@ cdef int _check_shape(Data left, Data right, Data out=None) except -1 nogil:
         )
     return 0
 
-cdef idxint _matmul_csr_estimate_nnz(CSR left, CSR right):
+cdef int _openmp_threads(CSR matrix) except -2:
+    """
+    Number of threads to use in a product with the CSR `matrix`, or -1 if the
+    serial kernels should be used.  A value of 0 lets OpenMP decide.  The
+    parallel kernels are only used for matrices with at least
+    ``settings.core["openmp_thresh"]`` stored elements, as the overhead of
+    starting the threads dominates for smaller matrices.
+    """
+    if not _use_openmp:
+        return -1
+    if csr.nnz(matrix) < settings.core["openmp_thresh"]:
+        return -1
+    cdef int nthr = settings.core["openmp_num_threads"]
+    return -1 if nthr == 1 else nthr
+
+
+cdef idxint _matmul_csr_estimate_nnz(CSR left, CSR right) except? -1:
     """
     Produce a sensible upper-bound for the number of non-zero elements that
     will be present in a matrix multiplication between the two matrices.
     """
-    cdef idxint j, k, nnz=0
+    cdef idxint j, k
     cdef idxint ii, jj, kk
+    cdef size_t nnz=0
     cdef idxint nrows=left.shape[0], ncols=right.shape[1]
     # Setup mask array
     cdef idxint *mask = <idxint *> mem.PyMem_Malloc(ncols * sizeof(idxint))
@@ -132,7 +165,7 @@ cdef idxint _matmul_csr_estimate_nnz(CSR left, CSR right):
                         mask[k] = ii
                         nnz += 1
     mem.PyMem_Free(mask)
-    return nnz
+    return size_checked(nnz)
 
 
 cpdef CSR matmul_csr(CSR left, CSR right, double complex scale=1, CSR out=None):
@@ -234,6 +267,8 @@ cpdef Dense matmul_csr_dense_dense(CSR left, Dense right,
     If `out` is not given, it will be allocated as if it were a zero matrix.
     """
     _check_shape(left, right, out)
+    if out is not None:
+        clear_properties(out)
     cdef Dense out_add = None
     if out is None:
         out = dense.zeros(left.shape[0], right.shape[1], right.fortran)
@@ -252,17 +287,31 @@ cpdef Dense matmul_csr_dense_dense(CSR left, Dense right,
         else:
             right = right.reorder()
     cdef idxint idx_r, idx_out, nrows=left.shape[0], ncols=right.shape[1]
+    cdef int nthr = _openmp_threads(left)
     if right.fortran:
         # F-ordered: loop over columns, calling _matmul_csr_vector for each
         idx_r = idx_out = 0
         for _ in range(ncols):
-            _matmul_csr_vector(left.data, left.col_index, left.row_index,
-                               right.data + idx_r,
-                               scale,
-                               out.data + idx_out,
-                               nrows)
+            if nthr >= 0:
+                _matmul_csr_vector_openmp(
+                    left.data, left.col_index, left.row_index,
+                    right.data + idx_r, scale, out.data + idx_out,
+                    nrows, nthr
+                )
+            else:
+                _matmul_csr_vector(left.data, left.col_index, left.row_index,
+                                   right.data + idx_r,
+                                   scale,
+                                   out.data + idx_out,
+                                   nrows)
             idx_out += nrows
             idx_r += right.shape[0]
+    elif nthr >= 0:
+        _matmul_csr_dense_c_order_openmp(
+            left.data, left.col_index, left.row_index,
+            right.data, scale, out.data,
+            nrows, ncols, nthr
+        )
     else:
         _matmul_csr_dense_c_order(left.data, left.col_index, left.row_index,
                                   right.data, scale, out.data,
@@ -282,6 +331,8 @@ cpdef Dense matmul_dense(Dense left, Dense right, double complex scale=1, Dense
     If `out` is not given, it will be allocated as if it were a zero matrix.
     """
     _check_shape(left, right, out)
+    if out is not None:
+        clear_properties(out)
     cdef double complex out_scale
     # If not supplied, it's more efficient from a memory allocation perspective
     # to do the calculation as `a*A.B + 0*C` with arbitrary C.
@@ -428,6 +479,8 @@ cpdef Dia matmul_dia(Dia left, Dia right, double complex scale=1):
 
 cpdef Dense matmul_dia_dense_dense(Dia left, Dense right, double complex scale=1, Dense out=None):
     _check_shape(left, right, out)
+    if out is not None:
+        clear_properties(out)
     # Use tmp buffer when scaling, applying the scaling in a separate pass.
     # This is faster than applying scaling on the fly, likely because the simpler
     # scale-free inner loop vectorizes better. The extra allocation required is
@@ -509,6 +562,8 @@ cpdef Dense matmul_dia_dense_dense(Dia left, Dense right, double complex scale=1
 
 cpdef Dense matmul_dense_dia_dense(Dense left, Dia right, double complex scale=1, Dense out=None):
     _check_shape(left, right, out)
+    if out is not None:
+        clear_properties(out)
     # Use tmp buffer when scaling, applying the scaling in a separate pass.
     # This is faster than applying scaling on the fly, likely because the simpler
     # scale-free inner loop vectorizes better. The extra allocation required is
@@ -618,6 +673,8 @@ cpdef Dense matmul_dag_dense_csr_dense(
             + str((left.shape[0], right.shape[0]))
         )
     cdef Dense out_add = None
+    if out is not None:
+        clear_properties(out)
     if out is None:
         out = dense.zeros(left.shape[0], right.shape[0], left.fortran)
     if bool(left.fortran) != bool(out.fortran):
@@ -691,6 +748,8 @@ cpdef Dense matmul_dag_dense(
     cdef double complex alpha = 1., out_scale = 0.
     cdef int m, n, k = left.shape[1], lda, ldb, ldc
     cdef char left_code, right_code
+    if out is not None:
+        clear_properties(out)
 
     if not right.fortran:
         # Need a conjugate, we compute the transpose of the desired results.
@@ -910,6 +969,8 @@ cpdef Dense matmul_dag_dense_dia_dense(
             f"incompatible matrix shapes ({m}, {k_dim}) and ({right.shape[0]}, {right.shape[1]})"
         )
     
+    if out is not None:
+        clear_properties(out)
     if out is None:
         out = dense.zeros(m, n, left.fortran)
     elif out.shape[0] != m or out.shape[1] != n:
@@ -2,6 +2,8 @@
 #cython: boundscheck=False, wrapround=False, initializedcheck=False
 
 from qutip.core.data cimport idxint, csr, CSR, dense, Dense, Data, Dia, dia
+from qutip.core.data.base cimport copy_properties
+from libc.limits cimport INT_MAX
 from scipy.linalg.cython_blas cimport zscal
 
 __all__ = [
@@ -11,11 +13,31 @@ __all__ = [
 ]
 
 
+cdef void _zscal(size_t n, double complex value, double complex *data) nogil:
+    # BLAS takes `int` sizes, which can be smaller than `idxint` or the
+    # number of elements of a large matrix, so we work in chunks.
+    cdef int ONE=1, chunk
+    cdef size_t start=0
+    while start < n:
+        chunk = <int> min(n - start, <size_t> INT_MAX)
+        zscal(&chunk, &value, data + start, &ONE)
+        start += chunk
+
+
+cdef inline void _scale_properties(Data matrix, double complex value, Data out):
+    # `out` may be `matrix` itself for in-place products.
+    if value.imag != 0 or value.real == 0:
+        out._isherm = None
+    else:
+        out._isherm = matrix._isherm
+    out._isdiag = matrix._isdiag if value != 0 else None
+    out._fingerprint = None
+
+
 cpdef CSR imul_csr(CSR matrix, double complex value):
     """Multiply this CSR `matrix` by a complex scalar `value`."""
-    cdef idxint l = csr.nnz(matrix)
-    cdef int ONE=1
-    zscal(&l, &value, matrix.data, &ONE)
+    _zscal(csr.nnz(matrix), value, matrix.data)
+    _scale_properties(matrix, value, matrix)
     return matrix
 
 cpdef CSR mul_csr(CSR matrix, double complex value):
@@ -27,6 +49,7 @@ cpdef CSR mul_csr(CSR matrix, double complex value):
     with nogil:
         for ptr in range(csr.nnz(matrix)):
             out.data[ptr] = value * matrix.data[ptr]
+    _scale_properties(matrix, value, out)
     return out
 
 cpdef CSR neg_csr(CSR matrix):
@@ -36,14 +59,14 @@ cpdef CSR neg_csr(CSR matrix):
     with nogil:
         for ptr in range(csr.nnz(matrix)):
             out.data[ptr] = -matrix.data[ptr]
+    copy_properties(matrix, out)
     return out
 
 
 cpdef Dia imul_dia(Dia matrix, double complex value):
     """Multiply this Dia `matrix` by a complex scalar `value`."""
-    cdef idxint l = matrix.num_diag * matrix.shape[1]
-    cdef int ONE=1
-    zscal(&l, &value, matrix.data, &ONE)
+    _zscal(<size_t> matrix.num_diag * matrix.shape[1], value, matrix.data)
+    _scale_properties(matrix, value, matrix)
     return matrix
 
 cpdef Dia mul_dia(Dia matrix, double complex value):
@@ -58,6 +81,7 @@ cpdef Dia mul_dia(Dia matrix, double complex value):
         for ptr in range(matrix.num_diag):
             out.offsets[ptr] = matrix.offsets[ptr]
         out.num_diag = matrix.num_diag
+    _scale_properties(matrix, value, out)
     return out
 
 cpdef Dia neg_dia(Dia matrix):
@@ -72,10 +96,8 @@ cpdef Dia neg_dia(Dia matrix):
 
 cpdef Dense imul_dense(Dense matrix, double complex value):
     """Multiply this Dense `matrix` by a complex scalar `value`."""
-    cdef size_t ptr
-    cdef int ONE=1
-    cdef idxint l = matrix.shape[0]*matrix.shape[1]
-    zscal(&l, &value, matrix.data, &ONE)
+    _zscal(<size_t> matrix.shape[0] * matrix.shape[1], value, matrix.data)
+    _scale_properties(matrix, value, matrix)
     return matrix
 
 cpdef Dense mul_dense(Dense matrix, double complex value):
@@ -85,6 +107,7 @@ cpdef Dense mul_dense(Dense matrix, double complex value):
     with nogil:
         for ptr in range(matrix.shape[0]*matrix.shape[1]):
             out.data[ptr] = value * matrix.data[ptr]
+    _scale_properties(matrix, value, out)
     return out
 
 cpdef Dense neg_dense(Dense matrix):
@@ -94,6 +117,7 @@ cpdef Dense neg_dense(Dense matrix):
     with nogil:
         for ptr in range(matrix.shape[0]*matrix.shape[1]):
             out.data[ptr] = -matrix.data[ptr]
+    copy_properties(matrix, out)
     return out
 
 
@@ -304,15 +304,33 @@ cpdef CSR dimensions_csr(CSR matrix, object dimensions, object order):
 
 @cython.cdivision(True)
 cpdef Dense dimensions_dense(Dense matrix, object dimensions, object order):
-    cdef _Indexer index = _Indexer(np.asarray(dimensions, dtype=idxint_dtype),
-                                   np.asarray(order, dtype=idxint_dtype))
-    cdef idxint[:] permutation = index.all()
-    row_perm, col_perm = None, None
-    if matrix.shape[0] != 1:
-        row_perm = permutation
-    if matrix.shape[1] != 1:
-        col_perm = permutation
-    return indices_dense(matrix, row_perm, col_perm)
+    # Only used to check the inputs: the permutation is applied as a transpose
+    # of the tensor form of the matrix, which copies the data only once.
+    _Indexer(np.asarray(dimensions, dtype=idxint_dtype),
+             np.asarray(order, dtype=idxint_dtype))
+    dims = [int(dim) for dim in np.asarray(dimensions).ravel()]
+    order = [int(axis) for axis in np.asarray(order).ravel()]
+    array = matrix.as_ndarray()
+    if matrix.fortran and not array.flags.c_contiguous:
+        # The transpose of a Fortran-ordered matrix can be reshaped without a
+        # copy, so permute it and transpose back.
+        return dense.fast_from_numpy(_permute_array(array.T, dims, order).T)
+    return dense.fast_from_numpy(
+        _permute_array(np.ascontiguousarray(array), dims, order)
+    )
+
+
+cdef object _permute_array(object array, list dims, list order):
+    cdef Py_ssize_t n = len(dims)
+    if array.shape[0] != 1 and array.shape[1] != 1:
+        tensor = array.reshape(dims + dims)
+        axes = order + [n + axis for axis in order]
+    elif array.shape[0] != 1 or array.shape[1] != 1:
+        tensor = array.reshape(dims)
+        axes = order
+    else:
+        return array.copy()
+    return np.ascontiguousarray(tensor.transpose(axes)).reshape(array.shape)
 
 
 from .dispatch import Dispatcher as _Dispatcher
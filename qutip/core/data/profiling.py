@@ -0,0 +1,190 @@
+"""
+Opt-in instrumentation of the data-layer dispatchers.
+
+When a dispatcher has no specialisation for the exact types of its inputs, it
+silently converts them to types it does have a specialisation for.  These
+conversions can dominate the cost of a calculation, for example if a CSR
+operator is converted to Dense on every step of an ODE solver.  While a
+`DispatchProfile` is active, every dispatcher call and every implicit
+conversion is recorded, so these hot spots can be found.
+
+>>> with qutip.core.data.profile() as prof:
+...     qutip.mesolve(H, rho0, tlist, c_ops)
+>>> print(prof.report())
+
+Only calls made through a dispatcher are recorded; direct calls to a
+specialisation (such as `matmul_csr_dense_dense`) and explicit conversions
+with `data.to` are not.  Profiling is process-wide and is not thread-safe.
+"""
+
+import time
+
+from . import dispatch
+
+__all__ = ['profile', 'DispatchProfile']
+
+
+def _name(function):
+    # Indirect specialisations wrap the function which actually runs.
+    base = getattr(function, "_call", function)
+    return getattr(base, "__name__", repr(base))
+
+
+def _nbytes(matrix):
+    if hasattr(matrix, "as_ndarray"):
+        return matrix.as_ndarray().nbytes
+    if hasattr(matrix, "as_scipy"):
+        matrix = matrix.as_scipy()
+        return sum(
+            getattr(matrix, attribute).nbytes
+            for attribute in ["data", "indices", "indptr", "offsets"]
+            if hasattr(matrix, attribute)
+        )
+    return 0
+
+
+class DispatchProfile:
+    """
+    Record of the data-layer dispatcher calls and implicit conversions made
+    while this object is active as a context manager.  Use `profile` to
+    create one.
+
+    Nested profiles are allowed; calls made while an inner profile is active
+    are recorded in the outer profiles as well.
+
+    Attributes
+    ----------
+    calls : dict
+        Map of ``(dispatcher, specialisation)`` names to a list
+        ``[count, time]`` of the number of calls and the cumulative time in
+        seconds spent in them, including any conversions.
+
+    conversions : dict
+        Map of ``(dispatcher, from_type, to_type)`` names to a list
+        ``[count, nbytes, time]`` of the number of implicit conversions, the
+        total size in bytes of the converted data and the cumulative time in
+        seconds spent converting.
+    """
+    def __init__(self):
+        self.calls = {}
+        self.conversions = {}
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = dispatch._set_profiler(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        dispatch._set_profiler(self._previous)
+        self._previous = None
+
+    def reset(self):
+        """Clear all the recorded calls and conversions."""
+        self.calls.clear()
+        self.conversions.clear()
+
+    def call(self, name, function, args, kwargs):
+        """
+        Call `function`, the specialisation of the dispatcher `name` chosen
+        for `args`, and record it.
+        """
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self._record_call((name, _name(function)),
+                              time.perf_counter() - start)
+
+    def convert(self, name, converter, arg):
+        """
+        Apply the conversion `converter` to `arg` inside the dispatcher `name`
+        and record it, if it did anything.
+        """
+        start = time.perf_counter()
+        out = converter(arg)
+        elapsed = time.perf_counter() - start
+        if out is not arg:
+            self._record_conversion(
+                (name, type(arg).__name__, type(out).__name__),
+                _nbytes(out), elapsed,
+            )
+        return out
+
+    def _record_call(self, key, elapsed):
+        stats = self.calls.setdefault(key, [0, 0.])
+        stats[0] += 1
+        stats[1] += elapsed
+        if self._previous is not None:
+            self._previous._record_call(key, elapsed)
+
+    def _record_conversion(self, key, nbytes, elapsed):
+        stats = self.conversions.setdefault(key, [0, 0, 0.])
+        stats[0] += 1
+        stats[1] += nbytes
+        stats[2] += elapsed
+        if self._previous is not None:
+            self._previous._record_conversion(key, nbytes, elapsed)
+
+    def report(self, limit=None):
+        """
+        Get a human-readable summary of the recorded calls and conversions,
+        sorted by the time spent in them.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum number of entries to show in each section.
+        """
+        calls = sorted(self.calls.items(), key=lambda x: -x[1][1])[:limit]
+        conversions = sorted(
+            self.conversions.items(), key=lambda x: -x[1][2]
+        )[:limit]
+        lines = [
+            "Dispatcher calls",
+            f"{'calls':>10} {'time (s)':>12}  specialisation",
+        ]
+        for (name, function), (count, elapsed) in calls:
+            lines.append(
+                f"{count:>10} {elapsed:>12.6f}  {name}: {function}"
+            )
+        lines += [
+            "",
+            "Implicit conversions",
+            f"{'count':>10} {'MB':>10} {'time (s)':>12}  conversion",
+        ]
+        for (name, from_, to_), (count, nbytes, elapsed) in conversions:
+            lines.append(
+                f"{count:>10} {nbytes / 1e6:>10.3f} {elapsed:>12.6f}"
+                f"  {name}: {from_} -> {to_}"
+            )
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return "".join([
+            "<DispatchProfile with ",
+            str(sum(count for count, _ in self.calls.values())),
+            " calls and ",
+            str(sum(stats[0] for stats in self.conversions.values())),
+            " conversions>",
+        ])
+
+
+def profile():
+    """
+    Record the data-layer dispatcher calls and implicit conversions made in a
+    ``with`` block.
+
+    Returns
+    -------
+    DispatchProfile
+        The record of calls, to be used as a context manager.  Its `report`
+        method summarises which specialisations ran, how many implicit
+        conversions happened, their size and the time spent in each.
+
+    Examples
+    --------
+    >>> with qutip.core.data.profile() as prof:
+    ...     qutip.sesolve(H, psi0, tlist)
+    >>> print(prof.report(limit=5))
+    """
+    return DispatchProfile()
@@ -6,9 +6,10 @@ from cpython cimport mem
 
 from qutip.settings import settings
 
-from qutip.core.data.base cimport idxint
+from qutip.core.data.base cimport idxint, Data
 from qutip.core.data cimport csr, dense, dia, CSR, Dense, Dia
 from qutip.core.data.adjoint cimport transpose_csr
+import hashlib
 import numpy as np
 
 cdef extern from *:
@@ -20,6 +21,7 @@ __all__ = [
     'isdiag', 'isdiag_csr', 'isdiag_dense', 'isdiag_dia',
     'iszero', 'iszero_csr', 'iszero_dense', 'iszero_dia',
     'isequal', 'isequal_csr', 'isequal_dense', 'isequal_dia',
+    'fingerprint', 'fingerprint_csr', 'fingerprint_dense', 'fingerprint_dia',
 ]
 
 cdef inline bint _conj_feq(double complex a, double complex b, double tol) nogil:
@@ -106,32 +108,7 @@ cdef bint _isherm_csr_full(CSR matrix, double tol) except 2:
     return True
 
 
-cpdef bint isherm_csr(CSR matrix, double tol=-1):
-    """
-    Determine whether an input CSR matrix is Hermitian up to a given
-    floating-point tolerance.
-
-    Parameters
-    ----------
-    matrix : CSR
-        Input matrix to test
-    tol : double, optional
-        Absolute tolerance value to use.  Defaults to
-        :obj:`settings.core['atol']`.
-
-    Returns
-    -------
-    bint
-        Boolean True if it is Hermitian, False if not.
-
-    Notes
-    -----
-    The implementation is effectively just taking the adjoint, but rather than
-    actually allocating and creating a new matrix, we just check whether the
-    output would match the input matrix.  If we cannot be certain of Hermicity
-    because the sizes of some elements are within tolerance of 0, we have to
-    resort to a complete adjoint calculation.
-    """
+cdef bint _isherm_csr(CSR matrix, double tol) except 2:
     tol = tol if tol >= 0 else settings.core["atol"]
     cdef size_t row, col, ptr, ptr_t, nrows=matrix.shape[0]
     if matrix.shape[0] != matrix.shape[1]:
@@ -171,7 +148,7 @@ cpdef bint isherm_csr(CSR matrix, double tol=-1):
         mem.PyMem_Free(out_row_index)
 
 
-cpdef bint isherm_dia(Dia matrix, double tol=-1) nogil:
+cdef bint _isherm_dia(Dia matrix, double tol) nogil:
     cdef double complex val, valT
     cdef size_t diag, other_diag, col, start, end, other_start
     if tol < 0:
@@ -215,24 +192,7 @@ cpdef bint isherm_dia(Dia matrix, double tol=-1) nogil:
     return True
 
 
-cpdef bint isherm_dense(Dense matrix, double tol=-1):
-    """
-    Determine whether an input Dense matrix is Hermitian up to a given
-    floating-point tolerance.
-
-    Parameters
-    ----------
-    matrix : Dense
-        Input matrix to test
-    tol : double, optional
-        Absolute tolerance value to use.  Defaults to
-        :obj:`settings.core['atol']`.
-
-    Returns
-    -------
-    bint
-        Boolean True if it is Hermitian, False if not.
-    """
+cdef bint _isherm_dense(Dense matrix, double tol):
     if matrix.shape[0] != matrix.shape[1]:
         return False
     tol = tol if tol >= 0 else settings.core["atol"]
@@ -248,7 +208,7 @@ cpdef bint isherm_dense(Dense matrix, double tol=-1):
     return True
 
 
-cpdef bint isdiag_dia(Dia matrix, double tol=-1) nogil:
+cdef bint _isdiag_dia(Dia matrix, double tol) nogil:
     cdef size_t diag, start, end, col
     if tol < 0:
         with gil:
@@ -265,7 +225,7 @@ cpdef bint isdiag_dia(Dia matrix, double tol=-1) nogil:
     return True
 
 
-cpdef bint isdiag_csr(CSR matrix) nogil:
+cdef bint _isdiag_csr(CSR matrix) nogil:
     cdef size_t row, ptr_start, ptr_end=matrix.row_index[0]
     for row in range(matrix.shape[0]):
         ptr_start, ptr_end = ptr_end, matrix.row_index[row + 1]
@@ -277,7 +237,7 @@ cpdef bint isdiag_csr(CSR matrix) nogil:
     return True
 
 
-cpdef bint isdiag_dense(Dense matrix) nogil:
+cdef bint _isdiag_dense(Dense matrix) nogil:
     cdef size_t row, row_stride = 1 if matrix.fortran else matrix.shape[1]
     cdef size_t col, col_stride = matrix.shape[0] if matrix.fortran else 1
     for row in range(matrix.shape[0]):
@@ -287,6 +247,92 @@ cpdef bint isdiag_dense(Dense matrix) nogil:
     return True
 
 
+cpdef bint isherm_csr(CSR matrix, double tol=-1):
+    """
+    Determine whether an input CSR matrix is Hermitian up to a given
+    floating-point tolerance.
+
+    Parameters
+    ----------
+    matrix : CSR
+        Input matrix to test
+    tol : double, optional
+        Absolute tolerance value to use.  Defaults to
+        :obj:`settings.core['atol']`.
+
+    Returns
+    -------
+    bint
+        Boolean True if it is Hermitian, False if not.
+
+    Notes
+    -----
+    The implementation is effectively just taking the adjoint, but rather than
+    actually allocating and creating a new matrix, we just check whether the
+    output would match the input matrix.  If we cannot be certain of Hermicity
+    because the sizes of some elements are within tolerance of 0, we have to
+    resort to a complete adjoint calculation.
+    """
+    if tol >= 0:
+        return _isherm_csr(matrix, tol)
+    if matrix._isherm is None:
+        matrix._isherm = _isherm_csr(matrix, settings.core["atol"])
+    return matrix._isherm
+
+
+cpdef bint isherm_dia(Dia matrix, double tol=-1):
+    if tol >= 0:
+        return _isherm_dia(matrix, tol)
+    if matrix._isherm is None:
+        matrix._isherm = _isherm_dia(matrix, settings.core["atol"])
+    return matrix._isherm
+
+
+cpdef bint isherm_dense(Dense matrix, double tol=-1):
+    """
+    Determine whether an input Dense matrix is Hermitian up to a given
+    floating-point tolerance.
+
+    Parameters
+    ----------
+    matrix : Dense
+        Input matrix to test
+    tol : double, optional
+        Absolute tolerance value to use.  Defaults to
+        :obj:`settings.core['atol']`.
+
+    Returns
+    -------
+    bint
+        Boolean True if it is Hermitian, False if not.
+    """
+    if tol >= 0:
+        return _isherm_dense(matrix, tol)
+    if matrix._isherm is None:
+        matrix._isherm = _isherm_dense(matrix, settings.core["atol"])
+    return matrix._isherm
+
+
+cpdef bint isdiag_dia(Dia matrix, double tol=-1):
+    if tol >= 0:
+        return _isdiag_dia(matrix, tol)
+    if matrix._isdiag is None:
+        matrix._isdiag = _isdiag_dia(matrix, settings.core["atol"])
+    return matrix._isdiag
+
+
+cpdef bint isdiag_csr(CSR matrix):
+    if matrix._isdiag is None:
+        matrix._isdiag = _isdiag_csr(matrix)
+    return matrix._isdiag
+
+
+cpdef bint isdiag_dense(Dense matrix):
+    if matrix._isdiag is None:
+        matrix._isdiag = _isdiag_dense(matrix)
+    return matrix._isdiag
+
+
 cpdef bint iszero_dia(Dia matrix, double tol=-1) nogil:
     cdef size_t diag, start, end, col
     if tol < 0:
@@ -448,6 +494,68 @@ cpdef bint isequal_csr(CSR A, CSR B, double atol=-1, double rtol=-1):
     return True
 
 
+cdef object _fingerprint_hash(str kind, Data matrix):
+    hash_ = hashlib.blake2b(digest_size=16)
+    hash_.update(f"{kind}({matrix.shape[0]}, {matrix.shape[1]})".encode())
+    return hash_
+
+
+cdef int _fingerprint_update(object hash_, void *ptr, size_t nbytes) except -1:
+    if nbytes:
+        hash_.update(<unsigned char[:nbytes]> <unsigned char *> ptr)
+    return 0
+
+
+cpdef str fingerprint_csr(CSR matrix):
+    if matrix._fingerprint is not None:
+        return matrix._fingerprint
+    matrix.sort_indices()
+    cdef size_t nnz = csr.nnz(matrix)
+    hash_ = _fingerprint_hash("CSR", matrix)
+    _fingerprint_update(
+        hash_, matrix.row_index, (matrix.shape[0] + 1) * sizeof(idxint),
+    )
+    _fingerprint_update(hash_, matrix.col_index, nnz * sizeof(idxint))
+    _fingerprint_update(hash_, matrix.data, nnz * sizeof(double complex))
+    matrix._fingerprint = hash_.hexdigest()
+    return matrix._fingerprint
+
+
+cpdef str fingerprint_dense(Dense matrix):
+    if matrix._fingerprint is not None:
+        return matrix._fingerprint
+    hash_ = _fingerprint_hash("Dense", matrix)
+    if matrix.fortran and matrix.shape[0] > 1 and matrix.shape[1] > 1:
+        # Hash the elements in row-major order for both layouts.
+        hash_.update(np.ascontiguousarray(matrix.as_ndarray()))
+    else:
+        _fingerprint_update(
+            hash_, matrix.data,
+            matrix.shape[0] * matrix.shape[1] * sizeof(double complex),
+        )
+    matrix._fingerprint = hash_.hexdigest()
+    return matrix._fingerprint
+
+
+cpdef str fingerprint_dia(Dia matrix):
+    if matrix._fingerprint is not None:
+        return matrix._fingerprint
+    cdef size_t diag, start, end
+    hash_ = _fingerprint_hash("Dia", matrix)
+    for diag in range(matrix.num_diag):
+        # Only the elements of each diagonal inside the matrix are set.
+        start = max(0, matrix.offsets[diag])
+        end = min(matrix.shape[1], matrix.shape[0] + matrix.offsets[diag])
+        _fingerprint_update(hash_, &matrix.offsets[diag], sizeof(idxint))
+        if end > start:
+            _fingerprint_update(
+                hash_, &matrix.data[diag * matrix.shape[1] + start],
+                (end - start) * sizeof(double complex),
+            )
+    matrix._fingerprint = hash_.hexdigest()
+    return matrix._fingerprint
+
+
 from .dispatch import Dispatcher as _Dispatcher
 import inspect as _inspect
 
@@ -589,4 +697,41 @@ isequal.add_specialisations([
     (Dense, Dense, isequal_dense),
 ], _defer=True)
 
+fingerprint = _Dispatcher(
+    _inspect.Signature([
+        _inspect.Parameter('matrix', _inspect.Parameter.POSITIONAL_ONLY),
+    ]),
+    name='fingerprint',
+    module=__name__,
+    inputs=('matrix',),
+    out=False,
+)
+fingerprint.__doc__ =\
+    """
+    Get a hash of the type, shape and stored values of the matrix, which can
+    be used as a dictionary key to recognise the same matrix in a later call.
+
+    Matrices with the same fingerprint have the same type and are bitwise
+    equal.  Equal matrices may still have different fingerprints if they are
+    of different types or store a different set of elements, such as explicit
+    zeros in a sparse matrix.  The result is cached on the matrix; it is
+    cleared by the in-place operations of the data layer, but not by writing
+    into the buffers exposed by ``as_ndarray`` or ``as_scipy``.
+
+    Parameters
+    ----------
+    matrix : Data
+        The matrix to fingerprint.
+
+    Returns
+    -------
+    str
+        A hexadecimal digest of 32 characters.
+    """
+fingerprint.add_specialisations([
+    (Dense, fingerprint_dense),
+    (Dia, fingerprint_dia),
+    (CSR, fingerprint_csr),
+], _defer=True)
+
 del _inspect, _Dispatcher
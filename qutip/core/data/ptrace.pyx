@@ -10,12 +10,14 @@ cimport cython
 
 from qutip.core.data cimport csr, dense, idxint, CSR, Dense, Data, Dia, dia
 from qutip.core.data.base import idxint_dtype
+from qutip.core.data.convert import to as _to
 from qutip.settings import settings
 
 cnp.import_array()
 
 __all__ = [
     'ptrace', 'ptrace_csr', 'ptrace_dense', 'ptrace_csr_dense', 'ptrace_dia',
+    'ptrace_many',
 ]
 
 cdef tuple _parse_inputs(object dims, object sel, tuple shape):
@@ -174,26 +176,126 @@ cpdef Dense ptrace_csr_dense(CSR matrix, object dims, object sel):
     return out
 
 
+cdef tuple _merge_subsystems(object dims, object sel):
+    """
+    Merge the neighbouring subsystems which are either all kept or all traced
+    out.  This gives the same partial trace with fewer (and larger) tensor
+    indices.  Return the merged dimensions and whether each one is kept.
+    """
+    cdef list merged = [], kept = []
+    cdef set keep = set(sel.tolist())
+    cdef Py_ssize_t i, last = -1
+    for i in range(len(dims)):
+        if last >= 0 and kept[last] == (i in keep):
+            merged[last] *= int(dims[i])
+        else:
+            last += 1
+            merged.append(int(dims[i]))
+            kept.append(i in keep)
+    return merged, kept
+
+
+cdef object _ptrace_dense_array(object array, list dims, list kept):
+    """
+    Partial trace of the square matrix `array`, as a single contraction of a
+    strided view of its tensor form.  The input is never copied if it is
+    contiguous in either order.
+    """
+    cdef Py_ssize_t n = len(dims), q
+    rows = list(range(n))
+    cols = [n + q if kept[q] else q for q in range(n)]
+    out = [q for q in range(n) if kept[q]] + [n + q for q in range(n) if kept[q]]
+    if array.flags.f_contiguous and not array.flags.c_contiguous:
+        # The transpose of a Fortran-ordered matrix can be reshaped without a
+        # copy; its first indices are then the columns.
+        tensor = array.T.reshape(dims + dims)
+        labels = cols + rows
+    else:
+        tensor = np.ascontiguousarray(array).reshape(dims + dims)
+        labels = rows + cols
+    size = np.prod([dims[q] for q in range(n) if kept[q]], dtype=int)
+    return np.ascontiguousarray(
+        np.einsum(tensor, labels, out).reshape(size, size)
+    )
+
+
+cdef object _ptrace_ket_array(object vector, list dims, list kept):
+    """
+    Partial trace of the projector of the ket `vector`, without forming the
+    projector.  The contraction over the traced subsystems is done by BLAS.
+    """
+    cdef Py_ssize_t q
+    tensor = vector.reshape(dims)
+    traced = [q for q in range(len(dims)) if not kept[q]]
+    size = np.prod([dims[q] for q in range(len(dims)) if kept[q]], dtype=int)
+    return np.ascontiguousarray(
+        np.tensordot(tensor, tensor.conj(), axes=(traced, traced))
+        .reshape(size, size)
+    )
+
+
 cpdef Dense ptrace_dense(Dense matrix, object dims, object sel):
     dims, sel = _parse_inputs(dims, sel, matrix.shape)
 
     if len(sel) == len(dims):
         return matrix.copy()
-    nd = dims.shape[0]
-    dkeep = [dims[x] for x in sel]
-    qtrace = list(set(np.arange(nd)) - set(sel))
-    dtrace = [dims[x] for x in qtrace]
-    dims = list(dims)
-    sel = list(sel)
-    rhomat = np.trace(matrix.as_ndarray()
-                      .reshape(dims + dims)
-                      .transpose(qtrace + [nd + q for q in qtrace] +
-                                 sel + [nd + q for q in sel])
-                      .reshape([np.prod(dtrace, dtype=int),
-                                np.prod(dtrace, dtype=int),
-                                np.prod(dkeep, dtype=int),
-                                np.prod(dkeep, dtype=int)]))
-    return dense.fast_from_numpy(rhomat)
+    merged, kept = _merge_subsystems(dims, sel)
+    return dense.fast_from_numpy(
+        _ptrace_dense_array(matrix.as_ndarray(), merged, kept)
+    )
+
+
+def ptrace_many(Data matrix, object dims, object selections):
+    """
+    Compute several partial traces of the same matrix, for example all the
+    single-subsystem reduced density matrices of a state.
+
+    For `Dense` matrices, all the partial traces are contractions of the same
+    tensor view of the matrix, which is never copied.  The input can also be
+    a ket, in which case the partial traces of its projector are computed
+    without forming the projector.  Other types use `ptrace` for each
+    selection.
+
+    Parameters
+    ----------
+    matrix : Data
+        The density matrix or ket to be partially traced.
+
+    dims : array_like of integer
+        The dimensions of the subspaces, as for `ptrace`.
+
+    selections : iterable of (integer or array_like of integer)
+        The indices of the subspaces to keep for each partial trace.
+
+    Returns
+    -------
+    list of Data
+        The reduced density matrices, in the order of ``selections``.  They
+        are `Dense` if the input is `Dense` or a ket.
+    """
+    cdef bint ket = matrix.shape[1] == 1 and matrix.shape[0] != 1
+    cdef tuple shape = (matrix.shape[0], matrix.shape[0])
+    if not ket and type(matrix) is not Dense:
+        return [ptrace(matrix, dims, sel) for sel in selections]
+    if ket:
+        array = _to(Dense, matrix).as_ndarray()[:, 0]
+    else:
+        array = matrix.as_ndarray()
+    out = []
+    for sel in selections:
+        parsed_dims, sel = _parse_inputs(dims, sel, shape)
+        merged, kept = _merge_subsystems(parsed_dims, sel)
+        if ket:
+            out.append(dense.fast_from_numpy(
+                _ptrace_ket_array(array, merged, kept)
+            ))
+        elif len(sel) == len(parsed_dims):
+            out.append(matrix.copy())
+        else:
+            out.append(dense.fast_from_numpy(
+                _ptrace_dense_array(array, merged, kept)
+            ))
+    return out
 
 
 from .dispatch import Dispatcher as _Dispatcher
@@ -7,7 +7,7 @@ cimport cython
 
 import warnings
 
-from qutip.core.data.base cimport idxint
+from qutip.core.data.base cimport idxint, clear_properties
 from qutip.core.data cimport csr, dense, CSR, Dense, Data, Dia
 
 __all__ = [
@@ -62,6 +62,7 @@ cpdef Dense reshape_dense(Dense matrix, idxint n_rows_out, idxint n_cols_out):
     if not matrix.fortran:
         out = matrix.copy()
         out.shape = (n_rows_out, n_cols_out)
+        clear_properties(out)
         return out
     out = dense.zeros(n_rows_out, n_cols_out)
     cdef size_t idx_in=0, idx_out=0
@@ -93,20 +94,23 @@ cpdef Dense column_stack_dense(Dense matrix, bint inplace=False):
     cdef Dense out
     if inplace and matrix.fortran:
         matrix.shape = (matrix.shape[0] * matrix.shape[1], 1)
+        clear_properties(matrix)
         return matrix
     if matrix.fortran:
         out = matrix.copy()
         out.shape = (matrix.shape[0]*matrix.shape[1], 1)
+        clear_properties(out)
         return out
     if inplace:
         warnings.warn("cannot stack columns inplace for C-ordered matrix")
     out = dense.zeros(matrix.shape[0] * matrix.shape[1], 1)
     cdef idxint col
-    cdef int ONE=1
+    # BLAS takes `int`, which may be smaller than `idxint`.
+    cdef int ONE=1, nrows=matrix.shape[0], ncols=matrix.shape[1]
     for col in range(matrix.shape[1]):
         blas.zcopy(
-            &matrix.shape[0],
-            &matrix.data[col], &matrix.shape[1],
+            &nrows,
+            &matrix.data[col], &ncols,
             &out.data[col * matrix.shape[0]], &ONE
         )
     return out
@@ -138,6 +142,7 @@ cpdef Dense column_unstack_dense(Dense matrix, idxint rows, bint inplace=False):
     cdef idxint cols = matrix.shape[0] // rows
     if inplace and matrix.fortran:
         matrix.shape = (rows, cols)
+        clear_properties(matrix)
         return matrix
     elif inplace:
         warnings.warn("cannot unstack columns inplace for C-ordered matrix")
@@ -0,0 +1,588 @@
+"""
+Single-precision (``complex64``) data-layer types.
+
+The first-class types `Dense`, `CSR` and `Dia` all store ``double complex``
+values.  Large simulations, such as trajectory ensembles, are often limited by
+memory bandwidth rather than floating-point throughput, and can accept an
+accuracy of ~1e-6.  `Dense32` and `CSR32` store their values as ``complex64``,
+halving the memory traffic of most operations.
+
+These types are backed by NumPy and SciPy objects, and only the operations
+needed to run the ODE integrators have direct specialisations.  Every other
+operation works through conversion to the double-precision types.  Conversions
+to single precision lose accuracy, so they are weighted such that the
+dispatcher prefers to promote mixed-precision inputs to double precision.
+"""
+
+import numbers
+
+import numpy as np
+import scipy.sparse
+
+from .base import Data
+from .dense import Dense
+from .csr import CSR
+from .add import add, iadd, sub
+from .adjoint import adjoint, transpose, conj
+from .constant import zeros, identity
+from .expect import expect
+from .inner import inner
+from .kron import kron
+from .matmul import matmul
+from .mul import mul, imul, neg
+from .norm import frobenius, l2
+from .ode import wrmn_error
+from .trace import trace
+
+__all__ = ['Dense32', 'CSR32']
+
+
+def _check_shape(left, right):
+    if left.shape[0] != right.shape[0] or left.shape[1] != right.shape[1]:
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(left.shape)
+            + " and "
+            + str(right.shape)
+        )
+
+
+def _check_shape_matmul(left, right):
+    if left.shape[1] != right.shape[0]:
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(left.shape)
+            + " and "
+            + str(right.shape)
+        )
+
+
+class Dense32(Data):
+    """
+    Dense matrix stored as a C- or Fortran-ordered ``complex64`` NumPy array.
+
+    Parameters
+    ----------
+    data : array_like
+        The matrix elements.  1D input is promoted to a ket.
+
+    shape : (int, int), optional
+        The shape of the matrix.  Defaults to the shape of ``data``.
+
+    copy : bool, default: True
+        Whether to copy ``data``.  If ``False``, a copy is still made if
+        ``data`` is not already a contiguous ``complex64`` array.
+    """
+    def __init__(self, data, shape=None, copy=True):
+        array = np.array(data, dtype=np.complex64, order='K', copy=copy or None)
+        if not (array.flags.c_contiguous or array.flags.f_contiguous):
+            array = array.copy()
+        if shape is None:
+            shape = array.shape
+            if len(shape) == 0:
+                shape = (1, 1)
+            if len(shape) == 1:
+                shape = (shape[0], 1)
+        if not (
+            len(shape) == 2
+            and isinstance(shape[0], numbers.Integral)
+            and isinstance(shape[1], numbers.Integral)
+            and shape[0] > 0
+            and shape[1] > 0
+        ):
+            raise ValueError(
+                "shape must be a 2-tuple of positive ints, but is "
+                + repr(shape)
+            )
+        if shape[0] * shape[1] != array.size:
+            raise ValueError(
+                "invalid shape " + str(shape)
+                + " for input data with size " + str(array.size)
+            )
+        self._array = array.reshape(shape, order='A')
+        super().__init__((shape[0], shape[1]))
+
+    @classmethod
+    def sparcity(self):
+        return "dense"
+
+    @property
+    def fortran(self):
+        return (
+            self._array.flags.f_contiguous
+            and not self._array.flags.c_contiguous
+        )
+
+    def __reduce__(self):
+        return (Dense32, (self._array, None, False))
+
+    def __repr__(self):
+        return "".join([
+            "Dense32(shape=", str(self.shape),
+            ", fortran=", str(self.fortran), ")",
+        ])
+
+    def __str__(self):
+        return self.__repr__()
+
+    def to_array(self):
+        """
+        Get a copy of this data as a full 2D NumPy array.  Like all data-layer
+        types, the array is of dtype ``complex128``; use `as_ndarray` for the
+        single-precision values.
+        """
+        return self._array.astype(np.complex128, order='K')
+
+    def as_ndarray(self):
+        """
+        Get a view onto this object as a ``complex64`` `numpy.ndarray`.
+        Modifications to the array will modify this object too.
+        """
+        return self._array
+
+    def trace(self):
+        return trace_dense32(self)
+
+    def adjoint(self):
+        return adjoint_dense32(self)
+
+    def conj(self):
+        return conj_dense32(self)
+
+    def transpose(self):
+        return transpose_dense32(self)
+
+    def copy(self):
+        return Dense32(self._array, copy=True)
+
+
+class CSR32(Data):
+    """
+    Compressed sparse row matrix with ``complex64`` values, backed by a
+    `scipy.sparse.csr_matrix`.
+
+    Parameters
+    ----------
+    arg : scipy.sparse matrix or (data, col_index, row_index) tuple
+        The matrix.
+
+    shape : (int, int), optional
+        The shape of the matrix.  Required if it cannot be inferred from
+        ``arg``.
+
+    copy : bool, default: True
+        Whether to copy the input arrays.  If ``False``, they are still
+        copied if their types need to be converted.
+    """
+    def __init__(self, arg, shape=None, copy=True):
+        if not (isinstance(arg, tuple) or scipy.sparse.issparse(arg)):
+            raise TypeError("arg must be a scipy matrix or tuple")
+        self._scipy = scipy.sparse.csr_matrix(
+            arg, shape=shape, dtype=np.complex64, copy=copy
+        )
+        super().__init__(self._scipy.shape)
+
+    @classmethod
+    def sparcity(self):
+        return "sparse"
+
+    def __reduce__(self):
+        return (CSR32, (self._scipy, None, False))
+
+    def __repr__(self):
+        return "".join([
+            "CSR32(shape=", str(self.shape),
+            ", nnz=", str(self._scipy.nnz), ")",
+        ])
+
+    def __str__(self):
+        return self.__repr__()
+
+    def to_array(self):
+        """
+        Get a copy of this data as a full 2D NumPy array.  Like all data-layer
+        types, the array is of dtype ``complex128``; use `as_scipy` for the
+        single-precision values.
+        """
+        return self._scipy.toarray().astype(np.complex128)
+
+    def as_scipy(self):
+        """
+        Get a view onto this object as a ``complex64`` scipy CSR matrix.
+        Modifications to its data will modify this object too.
+        """
+        return self._scipy
+
+    def trace(self):
+        return trace_csr32(self)
+
+    def adjoint(self):
+        return adjoint_csr32(self)
+
+    def conj(self):
+        return conj_csr32(self)
+
+    def transpose(self):
+        return transpose_csr32(self)
+
+    def copy(self):
+        return CSR32(self._scipy, copy=True)
+
+
+def _dense32(array):
+    # Wrap a complex64 array created here without another copy.
+    return Dense32(array, copy=False)
+
+
+def _csr32(matrix):
+    return CSR32(matrix.tocsr(), copy=False)
+
+
+# Conversions
+
+def dense32_from_dense(matrix: Dense) -> Dense32:
+    return _dense32(matrix.as_ndarray().astype(np.complex64, order='K'))
+
+
+def dense_from_dense32(matrix: Dense32) -> Dense:
+    return Dense(matrix._array, copy=True)
+
+
+def csr32_from_csr(matrix: CSR) -> CSR32:
+    return CSR32(matrix.as_scipy(), copy=True)
+
+
+def csr_from_csr32(matrix: CSR32) -> CSR:
+    return CSR(matrix._scipy, copy=True)
+
+
+def dense32_from_csr32(matrix: CSR32) -> Dense32:
+    return _dense32(matrix._scipy.toarray())
+
+
+def csr32_from_dense32(matrix: Dense32) -> CSR32:
+    return CSR32(scipy.sparse.csr_matrix(matrix._array), copy=False)
+
+
+# Creation
+
+def zeros_dense32(rows, cols) -> Dense32:
+    return _dense32(np.zeros((rows, cols), dtype=np.complex64, order='F'))
+
+
+def zeros_csr32(rows, cols) -> CSR32:
+    return CSR32(
+        scipy.sparse.csr_matrix((rows, cols), dtype=np.complex64), copy=False
+    )
+
+
+def identity_dense32(dimension, scale=1) -> Dense32:
+    return _dense32(np.eye(dimension, dtype=np.complex64) * complex(scale))
+
+
+def identity_csr32(dimension, scale=1) -> CSR32:
+    return _csr32(scipy.sparse.identity(dimension, dtype=np.complex64)
+                  * complex(scale))
+
+
+# Mathematics
+#
+# Scales are passed through `complex` so that NumPy treats them as Python
+# scalars, which do not promote the arrays to double precision.
+
+def add_dense32(left: Dense32, right: Dense32, scale=1) -> Dense32:
+    _check_shape(left, right)
+    return _dense32(left._array + complex(scale) * right._array)
+
+
+def add_csr32(left: CSR32, right: CSR32, scale=1) -> CSR32:
+    _check_shape(left, right)
+    return _csr32(left._scipy + complex(scale) * right._scipy)
+
+
+def iadd_dense32(left: Dense32, right: Dense32, scale=1) -> Dense32:
+    _check_shape(left, right)
+    if scale == 0:
+        return left
+    if scale == 1:
+        left._array += right._array
+    else:
+        left._array += complex(scale) * right._array
+    return left
+
+
+def sub_dense32(left: Dense32, right: Dense32) -> Dense32:
+    _check_shape(left, right)
+    return _dense32(left._array - right._array)
+
+
+def sub_csr32(left: CSR32, right: CSR32) -> CSR32:
+    _check_shape(left, right)
+    return _csr32(left._scipy - right._scipy)
+
+
+def mul_dense32(matrix: Dense32, value) -> Dense32:
+    return _dense32(matrix._array * complex(value))
+
+
+def mul_csr32(matrix: CSR32, value) -> CSR32:
+    return _csr32(matrix._scipy * complex(value))
+
+
+def imul_dense32(matrix: Dense32, value) -> Dense32:
+    matrix._array *= complex(value)
+    return matrix
+
+
+def imul_csr32(matrix: CSR32, value) -> CSR32:
+    matrix._scipy.data *= complex(value)
+    return matrix
+
+
+def neg_dense32(matrix: Dense32) -> Dense32:
+    return _dense32(-matrix._array)
+
+
+def neg_csr32(matrix: CSR32) -> CSR32:
+    return _csr32(-matrix._scipy)
+
+
+def adjoint_dense32(matrix: Dense32) -> Dense32:
+    return Dense32(matrix._array.T.conj())
+
+
+def transpose_dense32(matrix: Dense32) -> Dense32:
+    return Dense32(matrix._array.T)
+
+
+def conj_dense32(matrix: Dense32) -> Dense32:
+    return _dense32(matrix._array.conj())
+
+
+def adjoint_csr32(matrix: CSR32) -> CSR32:
+    return _csr32(matrix._scipy.T.conj())
+
+
+def transpose_csr32(matrix: CSR32) -> CSR32:
+    return _csr32(matrix._scipy.T)
+
+
+def conj_csr32(matrix: CSR32) -> CSR32:
+    return _csr32(matrix._scipy.conj())
+
+
+def matmul_dense32(left: Dense32, right: Dense32, scale=1) -> Dense32:
+    _check_shape_matmul(left, right)
+    out = left._array @ right._array
+    if scale != 1:
+        out *= complex(scale)
+    return _dense32(out)
+
+
+def matmul_csr32_dense32_dense32(
+    left: CSR32, right: Dense32, scale=1
+) -> Dense32:
+    _check_shape_matmul(left, right)
+    out = left._scipy @ right._array
+    if scale != 1:
+        out *= complex(scale)
+    return _dense32(out)
+
+
+def matmul_csr32(left: CSR32, right: CSR32, scale=1) -> CSR32:
+    _check_shape_matmul(left, right)
+    out = left._scipy @ right._scipy
+    if scale != 1:
+        out *= complex(scale)
+    return _csr32(out)
+
+
+def kron_dense32(left: Dense32, right: Dense32) -> Dense32:
+    return _dense32(np.kron(left._array, right._array))
+
+
+def kron_csr32(left: CSR32, right: CSR32) -> CSR32:
+    return _csr32(scipy.sparse.kron(left._scipy, right._scipy, format='csr'))
+
+
+def trace_dense32(matrix: Dense32) -> complex:
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("cannot compute trace of non-square matrix")
+    return complex(np.trace(matrix._array))
+
+
+def trace_csr32(matrix: CSR32) -> complex:
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("cannot compute trace of non-square matrix")
+    return complex(matrix._scipy.diagonal().sum())
+
+
+def _expect(op_state, state):
+    # `op_state` is `op @ state` as an array.
+    if state.shape[1] == 1:
+        return complex(np.vdot(state, op_state))
+    return complex(np.trace(op_state))
+
+
+def expect_dense32(op: Dense32, state: Dense32) -> complex:
+    """
+    Get the expectation value of the operator `op` over the state `state`.
+    The state can be either a ket or a density matrix.
+    """
+    _check_shape_matmul(op, state)
+    if state.shape[1] != 1 and state.shape[0] != state.shape[1]:
+        raise ValueError("state must be a ket or a density matrix")
+    return _expect(op._array @ state._array, state._array)
+
+
+def expect_csr32_dense32(op: CSR32, state: Dense32) -> complex:
+    """
+    Get the expectation value of the operator `op` over the state `state`.
+    The state can be either a ket or a density matrix.
+    """
+    _check_shape_matmul(op, state)
+    if state.shape[1] != 1 and state.shape[0] != state.shape[1]:
+        raise ValueError("state must be a ket or a density matrix")
+    return _expect(op._scipy @ state._array, state._array)
+
+
+def inner_dense32(
+    left: Dense32, right: Dense32, scalar_is_ket=False
+) -> complex:
+    """
+    Compute the complex inner product <left|right>.  The shape of `left` is
+    used to determine if it has been supplied as a ket or a bra.
+    """
+    if (
+        right.shape[1] != 1
+        or left.shape[0] * left.shape[1] != right.shape[0]
+        or 1 not in left.shape
+    ):
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(left.shape)
+            + " and "
+            + str(right.shape)
+        )
+    if left.shape[0] == 1 and not (right.shape[0] == 1 and scalar_is_ket):
+        return complex(np.dot(left._array.ravel(), right._array.ravel()))
+    return complex(np.vdot(left._array, right._array))
+
+
+def frobenius_dense32(matrix: Dense32) -> float:
+    return float(np.linalg.norm(matrix._array))
+
+
+def frobenius_csr32(matrix: CSR32) -> float:
+    return float(np.linalg.norm(matrix._scipy.data))
+
+
+def l2_dense32(vector: Dense32) -> float:
+    if vector.shape[0] != 1 and vector.shape[1] != 1:
+        raise ValueError("L2 norm is only defined on vectors")
+    return frobenius_dense32(vector)
+
+
+def wrmn_error_dense32(
+    diff: Dense32, state: Dense32, atol: float, rtol: float
+) -> float:
+    """
+    Compute the weighted root mean square error norm, see `ode.wrmn_error`.
+    The sum is done in double precision.
+    """
+    _check_shape(diff, state)
+    weight = atol + rtol * np.abs(state._array).astype(np.float64)
+    return float(np.sqrt(np.mean((np.abs(diff._array) / weight)**2)))
+
+
+zeros.add_specialisations([
+    (Dense32, zeros_dense32),
+    (CSR32, zeros_csr32),
+], _defer=True)
+
+identity.add_specialisations([
+    (Dense32, identity_dense32),
+    (CSR32, identity_csr32),
+], _defer=True)
+
+add.add_specialisations([
+    (Dense32, Dense32, Dense32, add_dense32),
+    (CSR32, CSR32, CSR32, add_csr32),
+], _defer=True)
+
+iadd.add_specialisations([
+    (Dense32, Dense32, Dense32, iadd_dense32),
+], _defer=True)
+
+sub.add_specialisations([
+    (Dense32, Dense32, Dense32, sub_dense32),
+    (CSR32, CSR32, CSR32, sub_csr32),
+], _defer=True)
+
+mul.add_specialisations([
+    (Dense32, Dense32, mul_dense32),
+    (CSR32, CSR32, mul_csr32),
+], _defer=True)
+
+imul.add_specialisations([
+    (Dense32, Dense32, imul_dense32),
+    (CSR32, CSR32, imul_csr32),
+], _defer=True)
+
+neg.add_specialisations([
+    (Dense32, Dense32, neg_dense32),
+    (CSR32, CSR32, neg_csr32),
+], _defer=True)
+
+adjoint.add_specialisations([
+    (Dense32, Dense32, adjoint_dense32),
+    (CSR32, CSR32, adjoint_csr32),
+], _defer=True)
+
+transpose.add_specialisations([
+    (Dense32, Dense32, transpose_dense32),
+    (CSR32, CSR32, transpose_csr32),
+], _defer=True)
+
+conj.add_specialisations([
+    (Dense32, Dense32, conj_dense32),
+    (CSR32, CSR32, conj_csr32),
+], _defer=True)
+
+matmul.add_specialisations([
+    (Dense32, Dense32, Dense32, matmul_dense32),
+    (CSR32, Dense32, Dense32, matmul_csr32_dense32_dense32),
+    (CSR32, CSR32, CSR32, matmul_csr32),
+], _defer=True)
+
+kron.add_specialisations([
+    (Dense32, Dense32, Dense32, kron_dense32),
+    (CSR32, CSR32, CSR32, kron_csr32),
+], _defer=True)
+
+trace.add_specialisations([
+    (Dense32, trace_dense32),
+    (CSR32, trace_csr32),
+], _defer=True)
+
+expect.add_specialisations([
+    (Dense32, Dense32, expect_dense32),
+    (CSR32, Dense32, expect_csr32_dense32),
+], _defer=True)
+
+inner.add_specialisations([
+    (Dense32, Dense32, inner_dense32),
+], _defer=True)
+
+frobenius.add_specialisations([
+    (Dense32, frobenius_dense32),
+    (CSR32, frobenius_csr32),
+], _defer=True)
+
+l2.add_specialisations([
+    (Dense32, l2_dense32),
+], _defer=True)
+
+wrmn_error.add_specialisations([
+    (Dense32, Dense32, wrmn_error_dense32),
+], _defer=True)
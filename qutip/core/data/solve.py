@@ -1,7 +1,10 @@
 from qutip.core.data import CSR, Data, csr, Dense, Dia
 import qutip.core.data as _data
 import scipy.sparse.linalg as splinalg
+import scipy.linalg
 import numpy as np
+import hashlib
+from collections import OrderedDict
 from qutip.settings import settings
 import warnings
 from typing import Union
@@ -12,7 +15,10 @@ else:
     mkl_spsolve = None
 
 
-__all__ = ["solve_csr_dense", "solve_dia_dense", "solve_dense", "solve"]
+__all__ = [
+    "solve_csr_dense", "solve_dia_dense", "solve_dense", "solve",
+    "FactorisationCache", "factorisation_cache",
+]
 
 
 def _splu(A, B, **kwargs):
@@ -20,8 +26,76 @@ def _splu(A, B, **kwargs):
     return lu.solve(B)
 
 
+class FactorisationCache:
+    """
+    Least-recently-used cache of the LU factorisations made by ``solve`` when
+    called with ``reuse=True``.
+
+    Factorisations are keyed on a hash of the contents of the matrix, so a
+    matrix which is rebuilt with the same entries will still find its
+    factors, and one modified in-place will not use stale ones.  Hashing is
+    linear in the number of stored elements, which is negligible compared to
+    the factorisation itself.
+
+    Parameters
+    ----------
+    maxsize : int, default: 8
+        The maximum number of factorisations kept.  Sparse LU factors can be
+        much larger than the matrix, so this should be kept small.
+    """
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._factors = OrderedDict()
+
+    def __len__(self):
+        return len(self._factors)
+
+    def clear(self):
+        """Remove all the stored factorisations."""
+        self._factors.clear()
+
+    def get(self, key, factorise):
+        """
+        Get the factorisation stored under ``key``, calling ``factorise()``
+        to create and store it if there is none.
+        """
+        try:
+            self._factors.move_to_end(key)
+            return self._factors[key]
+        except KeyError:
+            pass
+        factors = factorise()
+        if self.maxsize > 0:
+            self._factors[key] = factors
+            while len(self._factors) > self.maxsize:
+                self._factors.popitem(last=False)
+        return factors
+
+
+factorisation_cache = FactorisationCache()
+
+
+def _content_key(*items):
+    hasher = hashlib.blake2b(digest_size=20)
+    for item in items:
+        if isinstance(item, np.ndarray):
+            hasher.update(str((item.dtype, item.shape)).encode())
+            hasher.update(np.ascontiguousarray(item).data)
+        else:
+            hasher.update(repr(item).encode())
+    return hasher.digest()
+
+
+def _splu_factorise(M, options):
+    try:
+        return splinalg.splu(M, **options)
+    except RuntimeError as err:
+        # SuperLU reports exactly singular matrices as RuntimeError.
+        raise ValueError("Matrix is singular") from err
+
+
 def solve_csr_dense(matrix: Union[CSR, Dia], target: Dense, method=None,
-                    options: dict={}) -> Dense:
+                    options: dict={}, reuse: bool=False) -> Dense:
     """
     Solve ``Ax=b`` for ``x``.
 
@@ -45,6 +119,12 @@ def solve_csr_dense(matrix: Union[CSR, Dia], target: Dense, method=None,
         The keyword "csc" can be set to ``True`` to convert the sparse matrix
         before passing it to the solver.
 
+    reuse : bool, default=False
+        Whether to store the LU factorisation of ``A`` in
+        ``factorisation_cache`` and reuse it in later calls with the same
+        matrix.  Only the direct solvers "spsolve", "solve" and "splu" use the
+        factorisation, other methods ignore this option.
+
     .. note::
         Options for ``mkl_spsolve`` are presently only found in the source
         code.
@@ -63,6 +143,24 @@ def solve_csr_dense(matrix: Union[CSR, Dia], target: Dense, method=None,
 
     method = method or "spsolve"
 
+    if reuse and method in ["spsolve", "solve", "splu"]:
+        # spsolve and splu both use SuperLU, so the factors are the same.
+        options = {
+            key: val for key, val in options.items()
+            if method == "splu" or key == "permc_spec"
+        }
+        M = matrix.as_scipy()
+        if isinstance(matrix, CSR):
+            key = (M.data, M.indices, M.indptr)
+        else:
+            key = (M.data, M.offsets)
+        key = _content_key(type(matrix).__name__, matrix.shape,
+                           sorted(options.items()), *key)
+        lu = factorisation_cache.get(
+            key, lambda: _splu_factorise(M.tocsc(), options)
+        )
+        return Dense(lu.solve(b), copy=False)
+
     if method == "splu":
         solver = _splu
     elif method == "lstsq":
@@ -120,7 +218,7 @@ solve_dia_dense = solve_csr_dense
 
 
 def solve_dense(matrix: Dense, target: Data, method=None,
-                options: dict={}) -> Dense:
+                options: dict={}, reuse: bool=False) -> Dense:
     """
     Solve ``Ax=b`` for ``x``.
 
@@ -140,6 +238,11 @@ def solve_dense(matrix: Dense, target: Data, method=None,
         Options to pass to the solver. "lstsq" use "rcond" while, "solve" do
         not use any.
 
+    reuse : bool, default=False
+        Whether to store the LU factorisation of ``A`` in
+        ``factorisation_cache`` and reuse it in later calls with the same
+        matrix.  Only used by the "solve" method.
+
     Returns:
     --------
     x : Dense
@@ -155,7 +258,23 @@ def solve_dense(matrix: Dense, target: Data, method=None,
     else:
         b = target.to_array()
 
-    if method in ["solve", None]:
+    if reuse and method in ["solve", None]:
+        array = matrix.as_ndarray()
+        key = _content_key("Dense", array)
+
+        def factorise():
+            with warnings.catch_warnings():
+                # Singular matrices are reported below.
+                warnings.simplefilter("ignore", scipy.linalg.LinAlgWarning)
+                lu, piv = scipy.linalg.lu_factor(array, check_finite=False)
+            if np.any(np.diag(lu) == 0):
+                raise ValueError("Matrix is singular")
+            return lu, piv
+
+        out = scipy.linalg.lu_solve(
+            factorisation_cache.get(key, factorise), b, check_finite=False
+        )
+    elif method in ["solve", None]:
         try:
             out = np.linalg.solve(matrix.as_ndarray(), b)
         except np.linalg.LinAlgError:
@@ -184,6 +303,8 @@ solve = _Dispatcher(
                            default=None),
         _inspect.Parameter('options', _inspect.Parameter.POSITIONAL_OR_KEYWORD,
                            default={}),
+        _inspect.Parameter('reuse', _inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                           default=False),
     ]),
     name='solve',
     module=__name__,
@@ -214,6 +335,13 @@ solve.__doc__ = """
         The keyword "csc" can be set to ``True`` to convert the sparse matrix
         in sparse cases.
 
+    reuse : bool, default=False
+        Whether to keep the LU factorisation of ``A`` and reuse it when
+        solving again with a matrix of the same content, for example with
+        different right-hand sides.  The factorisations are kept in the
+        least-recently-used ``factorisation_cache``.  Only direct solvers
+        ("spsolve", "splu" and "solve") use it, other methods ignore it.
+
     .. note::
         Options for ``mkl_spsolve`` are presently only found in the source
         code.
@@ -0,0 +1,171 @@
+#include <complex>
+
+#ifdef _OPENMP
+# include <omp.h>
+#endif
+
+#include "matmul_csr_openmp.hpp"
+
+int _has_openmp(void)
+{
+#ifdef _OPENMP
+    return 1;
+#else
+    return 0;
+#endif
+}
+
+static inline int _num_threads(const int nthr)
+{
+#ifdef _OPENMP
+    return (nthr > 0) ? nthr : omp_get_max_threads();
+#else
+    return 1;
+#endif
+}
+
+/**
+ * Each row of the output is only written by the thread which owns the
+ * corresponding row of the sparse matrix, so no synchronisation is needed.
+ * The static schedule keeps the partition (and so the summation order)
+ * identical between calls, making the results reproducible.
+ */
+template <typename IntT>
+void _matmul_csr_vector_openmp(
+        const std::complex<double> * _RESTRICT data,
+        const IntT * _RESTRICT col_index,
+        const IntT * _RESTRICT row_index,
+        const std::complex<double> * _RESTRICT vec,
+        const std::complex<double> scale,
+        std::complex<double> * _RESTRICT out,
+        const IntT nrows,
+        const int nthr)
+{
+    const double scale_re = std::real(scale);
+    const double scale_im = std::imag(scale);
+    const int nthreads = _num_threads(nthr);
+    IntT row;
+
+    #pragma omp parallel for schedule(static) num_threads(nthreads)
+    for (row = 0; row < nrows; row++)
+    {
+        double dot_re = 0.0;
+        double dot_im = 0.0;
+        double data_re, data_im, vec_re, vec_im;
+        double *out_ptr;
+        for (IntT ptr = row_index[row]; ptr < row_index[row + 1]; ptr++)
+        {
+            data_re = std::real(data[ptr]);
+            data_im = std::imag(data[ptr]);
+            vec_re = std::real(vec[col_index[ptr]]);
+            vec_im = std::imag(vec[col_index[ptr]]);
+            dot_re += data_re * vec_re - data_im * vec_im;
+            dot_im += data_re * vec_im + data_im * vec_re;
+        }
+        out_ptr = reinterpret_cast<double*>(&out[row]);
+        out_ptr[0] += scale_re * dot_re - scale_im * dot_im;
+        out_ptr[1] += scale_re * dot_im + scale_im * dot_re;
+    }
+}
+
+template <typename IntT>
+void _matmul_csr_dense_c_order_openmp(
+        const std::complex<double> * _RESTRICT csr_data,
+        const IntT * _RESTRICT csr_col_index,
+        const IntT * _RESTRICT csr_row_index,
+        const std::complex<double> * _RESTRICT dense,
+        const std::complex<double> scale,
+        std::complex<double> * _RESTRICT out,
+        const IntT nrows,
+        const IntT ncols,
+        const int nthr)
+{
+    const int nthreads = _num_threads(nthr);
+    IntT row;
+
+    #pragma omp parallel for schedule(static) num_threads(nthreads)
+    for (row = 0; row < nrows; row++)
+    {
+        std::complex<double> scaled_val;
+        double val_re, val_im, dense_re, dense_im;
+        double *out_ptr = reinterpret_cast<double*>(out + row * ncols);
+        const double *dense_ptr;
+        for (IntT ptr = csr_row_index[row]; ptr < csr_row_index[row + 1]; ptr++)
+        {
+            scaled_val = scale * csr_data[ptr];
+            val_re = std::real(scaled_val);
+            val_im = std::imag(scaled_val);
+            dense_ptr = reinterpret_cast<const double*>(
+                dense + csr_col_index[ptr] * ncols
+            );
+            for (IntT col = 0; col < ncols; col++) {
+                dense_re = dense_ptr[2*col];
+                dense_im = dense_ptr[2*col + 1];
+                out_ptr[2*col] += val_re * dense_re - val_im * dense_im;
+                out_ptr[2*col + 1] += val_re * dense_im + val_im * dense_re;
+            }
+        }
+    }
+}
+
+/* See `matmul_csr_vector.cpp` for why the specialisations are over `int`,
+ * `long` and `long long`, rather than the sized types.
+ */
+template void _matmul_csr_vector_openmp<>(
+        const std::complex<double> * _RESTRICT,
+        const int * _RESTRICT,
+        const int * _RESTRICT,
+        const std::complex<double> * _RESTRICT,
+        const std::complex<double>,
+        std::complex<double> * _RESTRICT,
+        const int,
+        const int);
+template void _matmul_csr_vector_openmp<>(
+        const std::complex<double> * _RESTRICT,
+        const long * _RESTRICT,
+        const long * _RESTRICT,
+        const std::complex<double> * _RESTRICT,
+        const std::complex<double>,
+        std::complex<double> * _RESTRICT,
+        const long,
+        const int);
+template void _matmul_csr_vector_openmp<>(
+        const std::complex<double> * _RESTRICT,
+        const long long * _RESTRICT,
+        const long long * _RESTRICT,
+        const std::complex<double> * _RESTRICT,
+        const std::complex<double>,
+        std::complex<double> * _RESTRICT,
+        const long long,
+        const int);
+
+template void _matmul_csr_dense_c_order_openmp<>(
+        const std::complex<double> * _RESTRICT,
+        const int * _RESTRICT,
+        const int * _RESTRICT,
+        const std::complex<double> * _RESTRICT,
+        const std::complex<double>,
+        std::complex<double> * _RESTRICT,
+        const int,
+        const int,
+        const int);
+template void _matmul_csr_dense_c_order_openmp<>(
+        const std::complex<double> * _RESTRICT,
+        const long * _RESTRICT,
+        const long * _RESTRICT,
+        const std::complex<double> * _RESTRICT,
+        const std::complex<double>,
+        std::complex<double> * _RESTRICT,
+        const long,
+        const long,
+        const int);
+template void _matmul_csr_dense_c_order_openmp<>(
+        const std::complex<double> * _RESTRICT,
+        const long long * _RESTRICT,
+        const long long * _RESTRICT,
+        const std::complex<double> * _RESTRICT,
+        const std::complex<double>,
+        std::complex<double> * _RESTRICT,
+        const long long,
+        const long long,
+        const int);
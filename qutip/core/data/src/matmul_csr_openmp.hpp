@@ -0,0 +1,51 @@
+#ifndef MATMUL_CSR_OPENMP_HPP
+#define MATMUL_CSR_OPENMP_HPP
+
+#include <complex>
+
+#if defined(__GNUC__) || defined(_MSC_VER)
+# define _RESTRICT __restrict
+#else
+# define _RESTRICT
+#endif
+
+/**
+ * Whether this file was compiled with OpenMP support.  If not, the functions
+ * below are still valid, but run on a single thread.
+ */
+int _has_openmp(void);
+
+/**
+ * Compute out += scale * (csr @ vec), splitting the rows of the sparse matrix
+ * between `nthr` threads.  If `nthr` is 0, the OpenMP default number of
+ * threads is used.
+ */
+template <typename IntT>
+void _matmul_csr_vector_openmp(
+        const std::complex<double> * _RESTRICT data,
+        const IntT * _RESTRICT col_index,
+        const IntT * _RESTRICT row_index,
+        const std::complex<double> * _RESTRICT vec,
+        const std::complex<double> scale,
+        std::complex<double> * _RESTRICT out,
+        const IntT nrows,
+        const int nthr);
+
+/**
+ * Compute out += scale * (csr @ dense) for C-ordered dense matrices,
+ * splitting the rows of the sparse matrix between `nthr` threads.  If `nthr`
+ * is 0, the OpenMP default number of threads is used.
+ */
+template <typename IntT>
+void _matmul_csr_dense_c_order_openmp(
+        const std::complex<double> * _RESTRICT csr_data,
+        const IntT * _RESTRICT csr_col_index,
+        const IntT * _RESTRICT csr_row_index,
+        const std::complex<double> * _RESTRICT dense,
+        const std::complex<double> scale,
+        std::complex<double> * _RESTRICT out,
+        const IntT nrows,
+        const IntT ncols,
+        const int nthr);
+
+#endif
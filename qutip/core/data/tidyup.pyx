@@ -17,6 +17,16 @@ __all__ = [
 ]
 
 
+cdef inline void _tidyup_properties(base.Data matrix):
+    # Removing small elements keeps a matrix Hermitian or diagonal, but may
+    # make it so.
+    if matrix._isherm is False:
+        matrix._isherm = None
+    if matrix._isdiag is False:
+        matrix._isdiag = None
+    matrix._fingerprint = None
+
+
 cpdef CSR tidyup_csr(CSR matrix, double tol, bint inplace=True):
     cdef bint re, im
     cdef size_t row, ptr, ptr_start, ptr_end=0, nnz
@@ -40,6 +50,7 @@ cpdef CSR tidyup_csr(CSR matrix, double tol, bint inplace=True):
                 out.col_index[nnz] = matrix.col_index[ptr]
                 nnz += 1
         out.row_index[row + 1] = nnz
+    _tidyup_properties(out)
     return out
 
 
@@ -53,15 +64,17 @@ cpdef Dense tidyup_dense(Dense matrix, double tol, bint inplace=True):
             matrix.data[ptr].real = 0
         if fabs(value.imag) < tol:
             matrix.data[ptr].imag = 0
+    _tidyup_properties(matrix)
+    _tidyup_properties(out)
     return out
 
 
 cpdef Dia tidyup_dia(Dia matrix, double tol, bint inplace=True):
     cdef Dia out = matrix if inplace else matrix.copy()
-    cdef base.idxint diag=0, new_diag=0, ONE=1, start, end, col
+    cdef base.idxint diag=0, new_diag=0, start, end, col
     cdef bint re, im, has_data
     cdef double complex value
-    cdef int length
+    cdef int length, ONE=1
 
     while diag < out.num_diag:
         start = max(0, out.offsets[diag])
@@ -94,6 +107,7 @@ cpdef Dia tidyup_dia(Dia matrix, double tol, bint inplace=True):
     if out._scipy is not None:
         out._scipy.data = out._scipy.data[:new_diag]
         out._scipy.offsets = out._scipy.offsets[:new_diag]
+    _tidyup_properties(out)
     return out
 
 
@@ -6,25 +6,34 @@ class NumpyBackend:
         "_qt_np",
         "abs",
         "angle",
+        "arange",
         "arccos",
         "array",
         "ceil",
         "conj",
+        "conjugate",
+        "copy",
         "cos",
         "cumsum",
         "diff",
+        "dot",
         "e",
+        "empty",
+        "exp",
         "histogram",
         "imag",
         "inf",
         "inner",
         "linalg",
+        "linspace",
         "log",
         "log2",
         "max",
         "maximum",
+        "meshgrid",
         "ones",
         "pi",
+        "polyval",
         "prod",
         "real",
         "searchsorted",
@@ -40,8 +49,15 @@ class NumpyBackend:
     def _qutip_setting_backend(self, np):
         self._qt_np = np
         for slot in self.__slots__:
-            if slot != "_qt_np":
+            if slot == "_qt_np":
+                continue
+            try:
                 setattr(self, slot, getattr(np, slot))
+            except AttributeError:
+                # Backends do not need to implement every function: a missing
+                # one only raises when it is used.
+                if hasattr(self, slot):
+                    delattr(self, slot)
 
     def __getattr__(self, name):
         return getattr(self._qt_np, name)
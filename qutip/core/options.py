@@ -159,7 +159,11 @@ class CoreOptions(QutipOptions):
         functions determined by the "default_dtype_scope" options. Any
         data-layer known to ``qutip.data.to`` is accepted. The default `core``,
         refers to any format available in the qutip package and
-        functions will default to a sensible data type.
+        functions will default to a sensible data type. With ``"auto"``, the
+        type of each :obj:`.Qobj` covered by the scope is chosen from the
+        structure of its matrix, between ``Dense``, ``Dia`` and ``CSR``, using
+        the ``auto_dtype_*`` thresholds.  With the "full" scope, this is
+        repeated for the result of every operation.
 
     default_dtype_scope : str {"creation"}
         Control where the default_dtype apply.
@@ -176,6 +180,37 @@ class CoreOptions(QutipOptions):
         - "full": "default_dtype" is used for the output of Qobj operations and
           forced when creating any Qobj. Be careful as it can affect the speed
           of operation greatly.
+
+    auto_dtype_dense_fill : float {0.4}
+        Fraction of non-zero elements from which the ``"auto"`` data type
+        stores a matrix as ``Dense``.
+
+    auto_dtype_max_diags : int {8}
+        Maximum number of occupied diagonals for the ``"auto"`` data type to
+        store a matrix as ``Dia``.
+
+    auto_dtype_dia_fill : float {0.5}
+        Minimum fraction of non-zero elements in the occupied diagonals for
+        the ``"auto"`` data type to store a matrix as ``Dia``.
+
+    openmp_thresh : int {10000}
+        Minimum number of stored elements of a ``CSR`` matrix for its products
+        with ``Dense`` matrices and vectors to use the multi-threaded OpenMP
+        kernels. Only used if qutip was compiled with OpenMP support (see
+        ``qutip.settings.has_openmp``). A value suited to the current machine
+        can be obtained with
+        ``qutip.core.cy.openmp.bench_openmp.calculate_openmp_thresh()``.
+
+    openmp_num_threads : int {0}
+        Number of threads used by the OpenMP kernels. With ``0``, OpenMP
+        chooses, usually following the ``OMP_NUM_THREADS`` environment
+        variable.
+
+    numpy_backend : module {numpy}
+        NumPy-compatible module used for the array operations of ``expect``,
+        the metrics, the entropies, the Wigner and Q functions, the
+        distributions and the averages of multi-trajectory results.  See
+        ``qutip.core.bench_numpy_backend`` to compare one with NumPy.
     """
 
     _options = {
@@ -198,11 +233,19 @@ class CoreOptions(QutipOptions):
         # - "missing": Missing specialisation output use default.
         # - "full": All data layer operation output that type.
         "default_dtype_scope": "creation",
+        # Structure thresholds used by the "auto" default_dtype.
+        "auto_dtype_dense_fill": 0.4,
+        "auto_dtype_max_diags": 8,
+        "auto_dtype_dia_fill": 0.5,
         # Expect, trace, etc. will return real for hermitian matrices.
         # Hermiticity checks can be slow, stop jitting, etc.
         "auto_real_casting": True,
         # Default backend is numpy
-        "numpy_backend": numpy
+        "numpy_backend": numpy,
+        # Minimum nnz of CSR operators for matmul to use OpenMP kernels.
+        "openmp_thresh": 10000,
+        # Number of threads used by OpenMP kernels, 0 for OpenMP default.
+        "openmp_num_threads": 0,
     }
     _settings_name = "core"
     _properties = {
@@ -217,7 +260,11 @@ class CoreOptions(QutipOptions):
 
     @overload
     def __getitem__(
-        self, key: Literal["atol", "rtol", "auto_tidyup_atol"]
+        self,
+        key: Literal[
+            "atol", "rtol", "auto_tidyup_atol",
+            "auto_dtype_dense_fill", "auto_dtype_dia_fill",
+        ],
     ) -> float: ...
 
     @overload
@@ -228,6 +275,14 @@ class CoreOptions(QutipOptions):
     @overload
     def __getitem__(self, key: Literal["default_dtype"]) -> str | None: ...
 
+    @overload
+    def __getitem__(
+        self,
+        key: Literal[
+            "openmp_thresh", "openmp_num_threads", "auto_dtype_max_diags"
+        ],
+    ) -> int: ...
+
     def __getitem__(self, key: str) -> Any:
         # Let the dict catch the KeyError
         return self.options[key]
@@ -241,7 +296,12 @@ class CoreOptions(QutipOptions):
 
     @overload
     def __setitem__(
-        self, key: Literal["atol", "rtol", "auto_tidyup_atol"], value: float
+        self,
+        key: Literal[
+            "atol", "rtol", "auto_tidyup_atol",
+            "auto_dtype_dense_fill", "auto_dtype_dia_fill",
+        ],
+        value: float,
     ) -> None: ...
 
     @overload
@@ -256,6 +316,15 @@ class CoreOptions(QutipOptions):
         self, key: Literal["default_dtype"], value: str | None
     ) -> None: ...
 
+    @overload
+    def __setitem__(
+        self,
+        key: Literal[
+            "openmp_thresh", "openmp_num_threads", "auto_dtype_max_diags"
+        ],
+        value: int,
+    ) -> None: ...
+
     def __setitem__(self, key: str, value: Any) -> None:
         # Let the dict catch the KeyError
         super().__setitem__(key, value)
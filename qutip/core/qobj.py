@@ -4,6 +4,7 @@ operators, and related functions.
 from __future__ import annotations
 
 import functools
+import hashlib
 import numbers
 import warnings
 from typing import Any, Literal, TypeVar, Union, overload
@@ -203,6 +204,8 @@ class Qobj:
         Returns eigenenergies and eigenstates of quantum object.
     expm()
         Matrix exponential of quantum object.
+    expm_multiply(other, t=1)
+        Action of the matrix exponential of quantum object on `other`.
     full(order='C')
         Returns dense array of quantum object `data` attribute.
     groundstate(sparse=False, tol=0, maxiter=100000)
@@ -229,6 +232,8 @@ class Qobj:
     ptrace(sel)
         Returns quantum object for selected dimensions after performing
         partial trace.
+    ptrace_many(selections)
+        Returns the partial traces for several selections of dimensions.
     purity()
         Calculates the purity of a quantum object.
     sinm()
@@ -296,6 +301,8 @@ class Qobj:
             or settings.core["default_dtype_scope"] == "full"
         ):
             dtype = dtype or settings.core["default_dtype"]
+            if dtype == "auto":
+                dtype = _data.auto_dtype(self._data)
             if dtype is None or isinstance(self._data, _data.to.parse(dtype)):
                 return
             self._data = _data.to(dtype, self._data)
@@ -309,6 +316,29 @@ class Qobj:
                     dtype=self.dtype,
                     copy=True)
 
+    def fingerprint(self) -> str:
+        """
+        Hash of the dimensions, data type and stored values of the object,
+        usable as a dictionary key to recognise the same operator or state
+        when it is rebuilt, for example between the steps of a parameter
+        sweep.
+
+        Objects with the same fingerprint are equal.  Equal objects stored
+        with different data types, or as sparse matrices with a different set
+        of stored elements, have different fingerprints.  The hash of the
+        data is cached on the data object and only recomputed after it is
+        modified in-place.
+
+        Returns
+        -------
+        str
+            A hexadecimal digest of 32 characters.
+        """
+        hash_ = hashlib.blake2b(digest_size=16)
+        hash_.update(repr(self._dims).encode())
+        hash_.update(_data.fingerprint(self._data).encode())
+        return hash_.hexdigest()
+
     @property
     def dims(self) -> list[list[int]] | list[list[list[int]]]:
         return self._dims.as_list()
@@ -367,7 +397,9 @@ class Qobj:
         ----------
         data_type : type, str
             The data-layer type or its string alias that the data of this
-            :class:`Qobj` should be converted to.
+            :class:`Qobj` should be converted to.  With ``"auto"``, the type
+            is chosen from the structure of the matrix, see
+            :func:`qutip.core.data.auto_dtype`.
 
         copy : Bool
             If the data store is already in the format requested, whether the
@@ -378,6 +410,8 @@ class Qobj:
         Qobj
             A :class:`Qobj` with the data stored in the requested format.
         """
+        if data_type == "auto":
+            data_type = _data.auto_dtype(self._data)
         data_type = _data.to.parse(data_type)
         if type(self._data) is data_type and copy:
             return self.copy()
@@ -962,6 +996,41 @@ class Qobj:
                     copy=False,
                     dtype=dtype)
 
+    def expm_multiply(self, other: Qobj, t: complex = 1) -> Qobj:
+        """Action of the matrix exponential of this operator on ``other``.
+
+        Computes ``(t * self).expm() @ other`` without forming the
+        exponential, so a sparse operator stays sparse.  This is the most
+        efficient way to propagate a ket, or an operator-ket with a
+        superoperator, by a constant generator.
+
+        Parameters
+        ----------
+        other : :class:`.Qobj`
+            The object acted on, typically a ket or an operator-ket.
+
+        t : complex, optional
+            Scale factor of this operator in the exponential.
+
+        Returns
+        -------
+        :class:`.Qobj`
+            The result of ``exp(t * self) @ other``.
+
+        Raises
+        ------
+        TypeError
+            Quantum operator is not square or the dimensions do not match.
+        """
+        if not self._dims.issquare:
+            raise TypeError("expm is only valid for square operators")
+        if not isinstance(other, Qobj):
+            raise TypeError("can only act on a Qobj")
+        new_dims = self._dims @ other._dims
+        return Qobj(_data.expm_multiply(self._data, other._data, t),
+                    dims=new_dims,
+                    copy=False)
+
     def logm(self) -> Qobj:
         """Matrix logarithm of quantum operator.
 
@@ -1217,6 +1286,55 @@ class Qobj:
             return qutip.operator_to_vector(out).dag()
         return out
 
+    def ptrace_many(
+        self,
+        selections: list[int | list[int]],
+        dtype: LayerType = None,
+    ) -> list[Qobj]:
+        """
+        Take several partial traces of the same ket or operator, for example
+        to get the reduced density matrix of every subsystem.  This gives the
+        same result as ``[self.ptrace(sel) for sel in selections]``, but the
+        tensor form of the state is only built once, and kets are never
+        promoted to density matrices.
+
+        Parameters
+        ----------
+        selections : list of (int or list of int)
+            The components to keep for each partial trace, as for `ptrace`.
+
+        dtype : type or str, optional
+            The data-layer type of the outputs.
+
+        Returns
+        -------
+        list of :class:`.Qobj`
+            The reduced density matrices, in the order of ``selections``.
+        """
+        self._dims._require_pure_dims("partial trace")
+        if not (self.isket or self.isoper) or self.isoper and (
+            self.dims[0] != self.dims[1]
+        ):
+            return [self.ptrace(sel, dtype=dtype) for sel in selections]
+        sels = []
+        for sel in selections:
+            try:
+                sels.append(sorted(sel))
+            except TypeError:
+                if not isinstance(sel, numbers.Integral):
+                    raise TypeError(
+                        "selection must be an integer or list of integers"
+                    ) from None
+                sels.append([sel])
+        dims = flatten(self.dims[0])
+        out = []
+        for sel, data in zip(sels, _data.ptrace_many(self.data, dims, sels)):
+            if dtype is not None:
+                data = _data.to(dtype, data)
+            new_dims = [[dims[x] for x in sel]] * 2 if sel else None
+            out.append(Qobj(data, dims=new_dims, copy=False))
+        return out
+
     def contract(self, inplace: bool = False) -> Qobj:
         """
         Contract subspaces of the tensor structure which are 1D.  Not defined
@@ -97,11 +97,9 @@ shape = [4, 4], type = oper, isHerm = True
 
     isherm = args[0]._isherm
     isunitary = args[0]._isunitary
-    out_data = args[0].data
     dims_l = [args[0]._dims[0]]
     dims_r = [args[0]._dims[1]]
     for arg in args[1:]:
-        out_data = _data.kron(out_data, arg.data)
         # If both _are_ Hermitian and/or unitary, then so is the output, but if
         # both _aren't_, then output still can be.
         isherm = (isherm and arg._isherm) or None
@@ -109,6 +107,7 @@ shape = [4, 4], type = oper, isHerm = True
         dims_l.append(arg._dims[0])
         dims_r.append(arg._dims[1])
 
+    out_data = _data.kron_many([arg.data for arg in args])
     return Qobj(out_data,
                 dims=[dims_l, dims_r],
                 isherm=isherm,
@@ -497,6 +496,16 @@ def expand_operator(
     targets = _targets_to_list(targets, oper=oper, N=N)
     _check_oper_dims(oper, dims=dims, targets=targets)
 
+    if targets == list(range(targets[0], targets[0] + len(targets))):
+        # The operator already acts on neighbouring subsystems in order, so
+        # the identities are put around it and no permutation is needed.
+        return tensor(
+            [identity(dims[i], dtype=dtype) for i in range(targets[0])]
+            + [oper]
+            + [identity(dims[i], dtype=dtype)
+               for i in range(targets[-1] + 1, N)]
+        ).to(dtype)
+
     # Generate the correct order for permutation,
     # eg. if N = 5, targets = [3,0], the order is [1,2,3,0,4].
     # If the operator is cnot,
@@ -510,5 +519,5 @@ def expand_operator(
     rest_qubits = list(range(len(targets), N))
     for i, ind in enumerate(rest_pos):
         new_order[ind] = rest_qubits[i]
-    id_list = [identity(dims[i]) for i in rest_pos]
+    id_list = [identity(dims[i], dtype=dtype) for i in rest_pos]
     return tensor([oper] + id_list).permute(new_order).to(dtype)
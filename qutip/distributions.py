@@ -11,13 +11,12 @@ distributions, such as Wigner distributions, etc.
 __all__ = ['Distribution', 'HarmonicOscillatorWaveFunction',
            'HarmonicOscillatorProbabilityFunction']
 
-import numpy as np
 from numpy.typing import ArrayLike
-from numpy import pi, exp, sqrt
 
 from scipy.special import hermite, factorial
 
 from . import isket, ket2dm, state_number_index, Qobj
+from .core.numpy_backend import np
 from .wigner import wigner, qfunc
 from ._distributions import psi_n_single_fock_multiple_position_complex
 
@@ -318,14 +317,14 @@ class TwoModeQuadratureCorrelation(Distribution):
         N = psi.dims[0][0]
 
         for n1 in range(N):
-            kn1 = exp(-1j * self.theta1 * n1) / \
-                sqrt(sqrt(pi) * 2 ** n1 * factorial(n1)) * \
-                exp(-X1 ** 2 / 2.0) * np.polyval(hermite(n1), X1)
+            kn1 = np.exp(-1j * self.theta1 * n1) / \
+                np.sqrt(np.sqrt(np.pi) * 2 ** n1 * factorial(n1)) * \
+                np.exp(-X1 ** 2 / 2.0) * np.polyval(hermite(n1), X1)
 
             for n2 in range(N):
-                kn2 = exp(-1j * self.theta2 * n2) / \
-                    sqrt(sqrt(pi) * 2 ** n2 * factorial(n2)) * \
-                    exp(-X2 ** 2 / 2.0) * np.polyval(hermite(n2), X2)
+                kn2 = np.exp(-1j * self.theta2 * n2) / \
+                    np.sqrt(np.sqrt(np.pi) * 2 ** n2 * factorial(n2)) * \
+                    np.exp(-X2 ** 2 / 2.0) * np.polyval(hermite(n2), X2)
                 i = state_number_index([N, N], [n1, n2])
                 p += kn1 * kn2 * psi.full()[i, 0]
 
@@ -354,13 +353,15 @@ class TwoModeQuadratureCorrelation(Distribution):
 
         for m in range(N):
             for n in range(N):
-                M1[m, n] = exp(-1j * self.theta1 * (m - n)) / \
-                    sqrt(pi * 2 ** (m + n) * factorial(n) * factorial(m)) * \
-                    exp(-X1 ** 2) * np.polyval(
+                M1[m, n] = np.exp(-1j * self.theta1 * (m - n)) / \
+                    np.sqrt(np.pi * 2 ** (m + n)
+                            * factorial(n) * factorial(m)) * \
+                    np.exp(-X1 ** 2) * np.polyval(
                         hermite(m), X1) * np.polyval(hermite(n), X1)
-                M2[m, n] = exp(-1j * self.theta2 * (m - n)) / \
-                    sqrt(pi * 2 ** (m + n) * factorial(n) * factorial(m)) * \
-                    exp(-X2 ** 2) * np.polyval(
+                M2[m, n] = np.exp(-1j * self.theta2 * (m - n)) / \
+                    np.sqrt(np.pi * 2 ** (m + n)
+                            * factorial(n) * factorial(m)) * \
+                    np.exp(-X2 ** 2) * np.polyval(
                         hermite(m), X2) * np.polyval(hermite(n), X2)
 
         for n1 in range(N):
@@ -516,15 +517,15 @@ class HarmonicOscillatorProbabilityFunction(Distribution):
         M, N = rho.shape
 
         for m in range(M):
-            k_m = pow(self.omega / pi, 0.25) / \
-                sqrt(2 ** m * factorial(m)) * \
-                exp(-self.xvecs[0] ** 2 / 2.0) * \
+            k_m = pow(self.omega / np.pi, 0.25) / \
+                np.sqrt(2 ** m * factorial(m)) * \
+                np.exp(-self.xvecs[0] ** 2 / 2.0) * \
                 np.polyval(hermite(m), self.xvecs[0])
 
             for n in range(N):
-                k_n = pow(self.omega / pi, 0.25) / \
-                    sqrt(2 ** n * factorial(n)) * \
-                    exp(-self.xvecs[0] ** 2 / 2.0) * \
+                k_n = pow(self.omega / np.pi, 0.25) / \
+                    np.sqrt(2 ** n * factorial(n)) * \
+                    np.exp(-self.xvecs[0] ** 2 / 2.0) * \
                     np.polyval(hermite(n), self.xvecs[0])
 
                 self.data += np.conjugate(k_n) * k_m * rho.full()[m, n]
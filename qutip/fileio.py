@@ -1,9 +1,20 @@
-__all__ = ['file_data_store', 'file_data_read', 'qsave', 'qload']
-
+__all__ = [
+    'file_data_store', 'file_data_read', 'qsave', 'qload',
+    'save_memmap', 'load_memmap',
+]
+
+import json
+import math
+import numbers
 import pickle
+import struct
+import zlib
 import numpy as np
 import sys
 from .core import Qobj
+from .core import data as _data
+from .core.dimensions import Dimensions
+from .solver.result import Result, _BaseResult, ExpectOp
 from pathlib import Path
 
 
@@ -209,7 +220,7 @@ def file_data_read(filename, sep=None):
     return data
 
 
-def qsave(data, filename='qutip_data'):
+def qsave(data, filename='qutip_data', *, binary=False, compress=False):
     """
     Saves given data to file named 'filename.qu' in current directory.
 
@@ -219,18 +230,39 @@ def qsave(data, filename='qutip_data'):
         Input Python object to be stored.
     filename : str or pathlib.Path, default: "qutip_data"
         Name of output data file.
-
+    binary : bool, default: False
+        Use QuTiP's binary format instead of a pickle.  The arrays of
+        :class:`.Qobj` data, of :class:`.Result` times, states and expectation
+        values, and numpy arrays, are stored as raw sections of the file.
+        This is faster for large objects, and allows :func:`qload` to load
+        only part of a result, or to memory-map the file.  Only :class:`.Qobj`,
+        data-layer matrices (stored as `Dense` or `CSR`), :class:`.Result`,
+        numpy arrays, numbers, strings, and lists, tuples and dictionaries of
+        these can be stored.  Function ``e_ops`` of results are not stored,
+        and values of their ``stats`` and ``options`` which are not one of
+        these types are replaced by their ``repr``.
+    compress : bool, default: False
+        Compress the arrays of the binary format with zlib.  Compressed
+        arrays are smaller, but cannot be memory-mapped.
     """
     # open the file for writing
     path = Path(filename)
     path = path.with_suffix(path.suffix + ".qu")
 
+    if binary:
+        writer = _BinaryWriter(compress=compress)
+        node = writer.encode(data)
+        writer.write(path, node)
+        return
+    if compress:
+        raise ValueError("only the binary format can be compressed")
+
     with open(path, "wb") as fileObject:
         # this writes the object a to the file named 'filename.qu'
         pickle.dump(data, fileObject)
 
 
-def qload(filename):
+def qload(filename, *, mmap=False, fields=None, states=None):
     """
     Loads data file from file ``filename`` in current directory.
 
@@ -238,6 +270,19 @@ def qload(filename):
     ----------
     filename : str or pathlib.Path
         Name of data file to be loaded.
+    mmap : bool, default: False
+        Map the file into memory instead of reading it, so that the arrays
+        are only read from disk as they are used.  Changes to the loaded
+        objects never modify the file.  Only possible with files saved with
+        ``binary=True``; compressed arrays are still read.
+    fields : list of str, optional
+        Only load these fields of a :class:`.Result`, among ``"times"``,
+        ``"states"``, ``"final_state"``, ``"expect"``, ``"e_ops"``,
+        ``"stats"``, ``"options"`` and ``"solver"``.  The others are left
+        empty.  Only possible with files saved with ``binary=True``.
+    states : slice or list of int, optional
+        Only load these states of a :class:`.Result`, or these elements of a
+        list.  Only possible with files saved with ``binary=True``.
 
     Returns
     -------
@@ -248,6 +293,16 @@ def qload(filename):
     path = Path(filename)
     path = path.with_suffix(path.suffix + ".qu")
 
+    if _is_binary(path):
+        return _load_binary(
+            path, mmap="c" if mmap else None, fields=fields, states=states,
+        )
+    if mmap or fields is not None or states is not None:
+        raise ValueError(
+            "`mmap`, `fields` and `states` can only be used with files saved"
+            " with `binary=True`"
+        )
+
     with open(path, "rb") as fileObject:
         if sys.version_info >= (3, 0):
             out = pickle.load(fileObject, encoding='latin1')
@@ -255,3 +310,409 @@ def qload(filename):
             out = pickle.load(fileObject)
 
     return out
+
+
+# -----------------------------------------------------------------------------
+# Binary files of raw arrays
+#
+# The file starts with `_MAGIC` and the little-endian 64-bit position of the
+# first array, followed by a JSON header.  The header records the format
+# version, a tree of nodes describing the stored object, and, for each array,
+# its dtype, shape, memory order, compression, and position relative to the
+# first array.  Every array starts on a multiple of `_ALIGNMENT` bytes from
+# the start of the file, so that uncompressed arrays can be used directly from
+# a memory map of the file.  Only the arrays needed are read when loading part
+# of the object.
+#
+_MAGIC = b"QUTIPBIN"
+_VERSION = 1
+_ALIGNMENT = 64
+_RESULT_FIELDS = {
+    "times", "states", "final_state", "expect", "e_ops", "stats", "options",
+    "solver",
+}
+
+
+def _aligned(size):
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _optional_bool(value):
+    # The cached properties of Qobj can be numpy booleans.
+    return None if value is None else bool(value)
+
+
+class _BinaryWriter:
+    """
+    Encode an object as a tree of JSON nodes, keeping aside the arrays, and
+    write them to a file.
+    """
+    def __init__(self, compress=False):
+        self.compress = compress
+        self.arrays = []
+
+    def array(self, array):
+        if not (array.flags.c_contiguous or array.flags.f_contiguous):
+            array = np.ascontiguousarray(array)
+        self.arrays.append(array)
+        return len(self.arrays) - 1
+
+    def encode(self, obj, strict=True):
+        if isinstance(obj, np.generic) and not isinstance(obj, np.object_):
+            obj = obj.item()
+        if obj is None or isinstance(obj, (bool, str)):
+            return {"type": "value", "value": obj}
+        if isinstance(obj, numbers.Integral):
+            return {"type": "value", "value": int(obj)}
+        if isinstance(obj, numbers.Real):
+            return {"type": "value", "value": float(obj)}
+        if isinstance(obj, numbers.Complex):
+            return {"type": "complex", "value": [obj.real, obj.imag]}
+        if isinstance(obj, Qobj):
+            return self.qobj(obj)
+        if isinstance(obj, _data.Data):
+            return self.data(obj)
+        if isinstance(obj, np.ndarray) and obj.dtype != object:
+            return {"type": "ndarray", "array": self.array(obj)}
+        if isinstance(obj, (list, tuple)):
+            return {
+                "type": type(obj).__name__,
+                "items": [self.encode(item, strict) for item in obj],
+            }
+        if isinstance(obj, dict):
+            return {
+                "type": "dict",
+                "keys": [self.encode(key, strict) for key in obj],
+                "values": [self.encode(value, strict) for value in obj.values()],
+            }
+        if type(obj) is Result:
+            return self.result(obj)
+        if not strict:
+            return {"type": "value", "value": repr(obj)}
+        raise TypeError(
+            f"objects of type {type(obj)!r} cannot be saved in the binary"
+            " format; save them with `binary=False` instead"
+        )
+
+    def data(self, matrix):
+        node = {"type": "data", "dtype": type(matrix).__name__,
+                "shape": list(matrix.shape)}
+        if isinstance(matrix, _data.Dense):
+            node["format"] = "Dense"
+            node["arrays"] = {"data": self.array(matrix.as_ndarray())}
+            return node
+        node["format"] = "CSR"
+        matrix = _data.to(_data.CSR, matrix).as_scipy()
+        nnz = matrix.indptr[-1]
+        node["arrays"] = {
+            "data": self.array(matrix.data[:nnz]),
+            "col_index": self.array(matrix.indices[:nnz]),
+            "row_index": self.array(matrix.indptr),
+        }
+        return node
+
+    def qobj(self, qobj):
+        return {
+            "type": "qobj",
+            "dims": qobj.dims,
+            "superrep": qobj.superrep,
+            "isherm": _optional_bool(qobj._isherm),
+            "isunitary": _optional_bool(qobj._isunitary),
+            "data": self.data(qobj.data),
+        }
+
+    def result(self, result):
+        e_data = {}
+        for key, values in result.e_data.items():
+            values = np.asarray(values)
+            e_data[key] = values if values.dtype != object else list(values)
+        states = self.encode(list(result.states))
+        if result._final_state is None and result.states:
+            # The final state is the last state: its arrays are only stored
+            # once, but it is kept even if only some states are loaded.
+            final_state = states["items"][-1]
+        else:
+            final_state = self.encode(result._final_state)
+        return {
+            "type": "result",
+            "solver": self.encode(result.solver, False),
+            "times": self.encode(np.asarray(result.times, dtype=float)),
+            "states": states,
+            "final_state": final_state,
+            "expect": self.encode(e_data),
+            "e_ops": self.encode({
+                key: e_op.op if isinstance(e_op.op, Qobj) else None
+                for key, e_op in result.e_ops.items()
+            }),
+            "stats": self.encode(dict(result.stats), strict=False),
+            "options": self.encode(dict(result.options), strict=False),
+        }
+
+    def write(self, path, node):
+        specs = []
+        position = 0
+        sections = []
+        for array in self.arrays:
+            # The raw memory is written as is, in either order.
+            fortran = array.flags.f_contiguous and not array.flags.c_contiguous
+            buffer = (array.T if fortran else array).reshape(-1).view(np.uint8)
+            spec = {
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "order": "F" if fortran else "C",
+                "offset": position,
+                "compression": None,
+            }
+            if self.compress:
+                buffer = zlib.compress(buffer)
+                spec["compression"] = "zlib"
+            spec["nbytes"] = len(buffer)
+            specs.append(spec)
+            sections.append(buffer)
+            position += _aligned(len(buffer))
+        header = json.dumps(
+            {"version": _VERSION, "object": node, "arrays": specs}
+        ).encode("utf-8")
+        start = _aligned(len(_MAGIC) + 8 + len(header))
+        with open(path, "wb") as file:
+            file.write(_MAGIC)
+            file.write(struct.pack("<Q", start))
+            file.write(header)
+            file.write(bytes(start - len(_MAGIC) - 8 - len(header)))
+            for buffer in sections:
+                file.write(buffer)
+                file.write(bytes(_aligned(len(buffer)) - len(buffer)))
+
+
+def _is_binary(path):
+    with open(path, "rb") as file:
+        return file.read(len(_MAGIC)) == _MAGIC
+
+
+class _BinaryReader:
+    """
+    Read the header of a binary file, and decode the objects from it, reading
+    only the arrays which are needed from the open ``file``.  If ``mmap`` is a
+    `numpy.memmap` mode, the uncompressed arrays are views of a memory map of
+    the whole file instead.
+    """
+    def __init__(self, file, mmap=None):
+        self._file = file
+        path = file.name
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a QuTiP binary data file")
+        self.start, = struct.unpack("<Q", file.read(8))
+        header = json.loads(
+            file.read(self.start - len(_MAGIC) - 8)
+            .rstrip(b"\0").decode("utf-8")
+        )
+        if header["version"] > _VERSION:
+            raise ValueError(
+                f"{path} was written with a newer version"
+                f" ({header['version']}) of the format than this version of"
+                " QuTiP can read"
+            )
+        self.header = header
+        self.mmap = mmap
+        self._dims = {}
+        self._buffer = None
+        if mmap is not None and any(
+            spec["nbytes"] for spec in header["arrays"]
+        ):
+            self._buffer = np.memmap(path, dtype=np.uint8, mode=mmap)
+
+    def array(self, index):
+        spec = self.header["arrays"][index]
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        order = spec["order"]
+        size = math.prod(shape)
+        position = self.start + spec["offset"]
+        if size == 0:
+            return np.zeros(shape, dtype=dtype, order=order)
+        if spec["compression"] == "zlib":
+            self._file.seek(position)
+            raw = bytearray(zlib.decompress(self._file.read(spec["nbytes"])))
+            return np.frombuffer(raw, dtype=dtype).reshape(shape, order=order)
+        if self._buffer is not None:
+            raw = self._buffer[position:position + spec["nbytes"]]
+            return raw.view(dtype).reshape(shape, order=order)
+        out = np.empty(size, dtype=dtype)
+        self._file.seek(position)
+        self._file.readinto(out.view(np.uint8))
+        return out.reshape(shape, order=order)
+
+    def decode(self, node, states=None):
+        kind = node["type"]
+        if kind == "value":
+            return node["value"]
+        if kind == "complex":
+            return complex(*node["value"])
+        if kind == "ndarray":
+            return self.array(node["array"])
+        if kind in ("list", "tuple"):
+            items = _select(node["items"], states)
+            out = [self.decode(item) for item in items]
+            return out if kind == "list" else tuple(out)
+        if kind == "dict":
+            return {
+                self.decode(key): self.decode(value)
+                for key, value in zip(node["keys"], node["values"])
+            }
+        if kind == "data":
+            return self.data(node)
+        if kind == "qobj":
+            return Qobj(
+                self.data(node["data"]), dims=self.dims(node),
+                isherm=node["isherm"], isunitary=node["isunitary"],
+                copy=False,
+            )
+        if kind == "result":
+            return self.result(node, states)
+        raise ValueError(f"unknown stored object {kind!r}")
+
+    def dims(self, node):
+        # Results usually have many states with the same dimensions, which
+        # are only parsed once.
+        key = json.dumps([node["dims"], node["superrep"]])
+        if key not in self._dims:
+            dims = Dimensions(node["dims"])
+            if node["superrep"] is not None:
+                dims = dims.replace_superrep(node["superrep"])
+            self._dims[key] = dims
+        return self._dims[key]
+
+    def data(self, node):
+        arrays = {
+            name: self.array(index) for name, index in node["arrays"].items()
+        }
+        if node["format"] == "Dense":
+            matrix = _data.Dense.from_memmap(arrays["data"])
+        else:
+            # The indices are only copied if they were written with another
+            # integer type than this build of QuTiP uses.
+            idxint_dtype = _data.base.idxint_dtype
+            matrix = _data.CSR.from_memmap(
+                arrays["data"],
+                arrays["col_index"].astype(idxint_dtype, copy=False),
+                arrays["row_index"].astype(idxint_dtype, copy=False),
+                tuple(node["shape"]),
+            )
+        if self.mmap is None and node["dtype"] != node["format"]:
+            # Converting would defeat the memory map.
+            matrix = _data.to(node["dtype"], matrix)
+        return matrix
+
+    def result(self, node, states=None, fields=None):
+        if fields is None:
+            fields = _RESULT_FIELDS
+
+        def field(name, default, **kwargs):
+            if name not in fields:
+                return default
+            return self.decode(node[name], **kwargs)
+
+        result = Result.__new__(Result)
+        _BaseResult.__init__(
+            result, field("options", {}),
+            solver=field("solver", None), stats=field("stats", {}),
+        )
+        result.times = list(field("times", np.zeros(0)).tolist())
+        result.states = field("states", [], states=states)
+        result._final_state = field("final_state", None)
+        result.e_data = {
+            key: list(values.tolist()) if isinstance(values, np.ndarray)
+            else values
+            for key, values in field("expect", {}).items()
+        }
+        result.e_ops = {}
+        for key, op in field("e_ops", {}).items():
+            if key not in result.e_data:
+                continue
+            f = result._e_op_func(op) if op is not None else None
+            result.e_ops[key] = ExpectOp(op, f, result.e_data[key].append)
+        return result
+
+
+def _select(items, selection):
+    if selection is None:
+        return items
+    if isinstance(selection, slice):
+        return items[selection]
+    return [items[index] for index in selection]
+
+
+def _load_binary(path, mmap=None, fields=None, states=None):
+    # Unbuffered, as the arrays are read straight into their memory.
+    with open(path, "rb", buffering=0) as file:
+        return _load_from_reader(
+            _BinaryReader(file, mmap), fields=fields, states=states,
+        )
+
+
+def _load_from_reader(reader, fields=None, states=None):
+    node = reader.header["object"]
+    if fields is not None:
+        if node["type"] != "result":
+            raise ValueError("`fields` can only be used to load a Result")
+        unknown = set(fields) - _RESULT_FIELDS
+        if unknown:
+            raise ValueError(f"unknown Result fields {sorted(unknown)}")
+        return reader.result(node, states=states, fields=set(fields))
+    if states is not None and node["type"] not in ("result", "list", "tuple"):
+        raise ValueError("`states` can only be used to load a Result or a list")
+    return reader.decode(node, states=states)
+
+
+def save_memmap(data, filename):
+    """
+    Saves a :class:`.Qobj` or data-layer matrix to a binary file from which
+    :func:`load_memmap` maps it back into memory without reading or copying
+    it.
+
+    The raw arrays of `Dense` matrices are stored as they are.  Every other
+    data-layer type is stored as `CSR`.
+
+    Parameters
+    ----------
+    data : :class:`.Qobj` or :class:`.Data`
+        The object to store.
+    filename : str or pathlib.Path
+        Name of the output file, used as is.
+    """
+    if not isinstance(data, (Qobj, _data.Data)):
+        raise TypeError(
+            "only Qobj and data-layer objects can be stored, not "
+            + repr(type(data))
+        )
+    writer = _BinaryWriter()
+    node = writer.encode(data)
+    writer.write(Path(filename), node)
+
+
+def load_memmap(filename, mode="c"):
+    """
+    Maps a file written by :func:`save_memmap` into memory.  The arrays of
+    the matrix are backed by the file with `numpy.memmap`, so they are only
+    read from disk as they are used, and several processes mapping the same
+    file share its memory.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        Name of the file to map.
+    mode : {"c", "r+"}, default: "c"
+        With ``"c"`` (copy-on-write), changes to the matrix stay in memory
+        and never modify the file.  With ``"r+"``, they are written through
+        to the file.
+
+    Returns
+    -------
+    :class:`.Qobj` or :class:`.Data`
+        The stored object, backed by the file.
+    """
+    if mode not in ("c", "r+"):
+        # Read-only maps are not allowed: in-place operations of the data
+        # layer write through raw pointers without checking.
+        raise ValueError("mode must be 'c' or 'r+', not " + repr(mode))
+    return _load_binary(Path(filename), mmap=mode)
@@ -304,10 +304,14 @@ class Settings:
         return os.access(self.coeffroot, os.W_OK)
 
     @property
-    def _has_openmp(self) -> bool:
-        return False
-        # We keep this as a reminder for when openmp is restored: see Pull #652
-        # os.environ['KMP_DUPLICATE_LIB_OK'] = 'True'
+    def has_openmp(self) -> bool:
+        """
+        Whether qutip was compiled with OpenMP support (``--with-openmp``).
+        When True, products of large ``CSR`` matrices with ``Dense`` ones are
+        multi-threaded, see ``qutip.settings.core["openmp_thresh"]``.
+        """
+        from .core.data.matmul import has_openmp
+        return has_openmp
 
     @property
     def idxint_size(self) -> int:
@@ -68,8 +68,9 @@ def countstat_current(L, c_ops=None, rhoss=None, J_ops=None):
 
 
 def _solve(A, V):
+    # The same matrix is solved for many vectors at each frequency.
     try:
-        return _data.solve(A, V)
+        return _data.solve(A, V, reuse=True)
     except ValueError:
         return _data.solve(A, V, "lstsq")
 
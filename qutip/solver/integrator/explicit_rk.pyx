@@ -8,6 +8,7 @@ from qutip.core.data.add cimport iadd_dense
 from qutip.core.data.add import iadd
 from qutip.core.data.mul cimport imul_data
 from qutip.core.data.tidyup import tidyup_csr
+from qutip.core.data.single import Dense32
 from qutip.core.data.norm import frobenius_data
 from qutip.core.data.ode cimport cy_wrmn_error
 from cpython.exc cimport PyErr_CheckSignals
@@ -26,6 +27,9 @@ cdef Data copy_to(Data in_, Data out):
         for ptr in range(in_.shape[0] * in_.shape[1]):
             (<Dense> out).data[ptr] = (<Dense> in_).data[ptr]
         return out
+    elif type(in_) is Dense32 and type(out) is Dense32:
+        np.copyto(out.as_ndarray(), in_.as_ndarray())
+        return out
     else:
         return in_.copy()
 
@@ -56,6 +56,7 @@ class IntegratorVern7(Integrator):
         'max_step': 0,
         'min_step': 0,
         'interpolate': True,
+        'single_precision': False,
     }
     support_time_dependant = True
     supports_blackbox = True
@@ -63,18 +64,33 @@ class IntegratorVern7(Integrator):
     tableau = vern7_coeff
 
     def _prepare(self):
+        options = self.options.copy()
+        system = self.system
+        self._state_dtype = None
+        if options.pop('single_precision'):
+            system = system.to("single")
+            self._state_dtype = _data.Dense32
         self._ode_solver = Explicit_RungeKutta(
-            self.system, self.tableau,
-            **self.options
+            system, self.tableau,
+            **options
         )
         self.name = self.method
 
     def get_state(self, copy=True):
         state = self._ode_solver.y
+        if self._state_dtype is not None:
+            # Return the state in the type it was given, the conversion is
+            # already a copy.
+            return self._ode_solver.t, _data.to(self._input_dtype, state)
         return self._ode_solver.t, state.copy() if copy else state
 
     def set_state(self, t, state):
-        self._ode_solver.set_initial_value(state.copy(), t)
+        if self._state_dtype is not None:
+            self._input_dtype = type(state)
+            state = _data.to(self._state_dtype, state)
+        else:
+            state = state.copy()
+        self._ode_solver.set_initial_value(state, t)
         self._is_set = True
 
     def integrate(self, t, copy=True):
@@ -119,6 +135,13 @@ class IntegratorVern7(Integrator):
 
         interpolate : bool, default: True
             Whether to use interpolation step, faster most of the time.
+
+        single_precision : bool, default: False
+            Whether to integrate in single precision (``complex64``), using
+            the :obj:`.Dense32` and :obj:`.CSR32` data types.  This halves the
+            memory traffic of the integration, but limits the accuracy to
+            ~1e-6; ``atol`` and ``rtol`` should not be set below ~1e-6.  The
+            states are returned in double precision.
         """
         return self._options
 
@@ -150,6 +173,7 @@ class IntegratorVern9(IntegratorVern7):
         'max_step': 0,
         'min_step': 0,
         'interpolate': True,
+        'single_precision': False,
     }
     method = 'vern9'
     tableau = vern9_coeff
@@ -179,6 +203,7 @@ class IntegratorTsit5(IntegratorVern7):
         'max_step': 0,
         'min_step': 0,
         'interpolate': True,
+        'single_precision': False,
     }
     method = 'tsit5'
     tableau = tsit5_coeff
@@ -7,6 +7,8 @@ from typing import TypedDict, Any, Callable
 from ..core.numpy_backend import np
 from numpy.typing import ArrayLike
 from ..core import Qobj, QobjEvo, expect
+from ..core import data as _data
+from ..settings import settings
 
 __all__ = ["Result"]
 
@@ -29,6 +31,51 @@ class _QobjExpectEop:
         return expect(self.op, state)
 
 
+class _QobjExpectMany:
+    """
+    Pickable state processor that calculates the expectation values of
+    several operators, which share the same data type and dimensions, in one
+    pass with :obj:`.data.ExpectMany`.  Each value is stored with its own
+    ``append`` function.
+
+    Parameters
+    ----------
+    ops : list of :obj:`.Qobj`
+        The expectation value operators.
+
+    appends : list of functions
+        The function ``append(value)`` storing the value of each operator.
+    """
+
+    def __init__(self, ops, appends):
+        self.ops = ops
+        self.appends = appends
+        self._expect = _data.ExpectMany([op.data for op in ops])
+        self._isherm = [op.isherm for op in ops]
+
+    def __call__(self, t, state):
+        if (
+            not isinstance(state, Qobj)
+            or not (state.isket or state.isoper)
+            or state._dims[0] != self.ops[0]._dims[1]
+        ):
+            # Let ``expect`` handle, or raise an error for, anything else.
+            values = [expect(op, state) for op in self.ops]
+        else:
+            real = (
+                settings.core["auto_real_casting"]
+                and (state.isket or state.isherm)
+            )
+            values = [
+                value.real if real and isherm else value
+                for value, isherm in zip(
+                    map(complex, self._expect(state.data)), self._isherm
+                )
+            ]
+        for append, value in zip(self.appends, values):
+            append(value)
+
+
 class ExpectOp:
     """
     A result e_op (expectation operation).
@@ -238,10 +285,26 @@ class Result(_BaseResult):
         raw_ops = self._e_ops_to_dict(e_ops)
         self.e_data = {k: [] for k in raw_ops}
         self.e_ops = {}
+        groups = {}
         for k, op in raw_ops.items():
             f = self._e_op_func(op)
             self.e_ops[k] = ExpectOp(op, f, self.e_data[k].append)
-            self.add_processor(self.e_ops[k]._store)
+            if isinstance(f, _QobjExpectEop) and op.isoper:
+                groups.setdefault((type(op.data), op._dims), []).append(k)
+        # Operators sharing a data type and dimensions are evaluated together,
+        # which is faster than one at a time as soon as there are two of them.
+        group_of = {
+            keys[0]: keys for keys in groups.values() if len(keys) > 1
+        }
+        grouped = {k for keys in group_of.values() for k in keys}
+        for k in raw_ops:
+            if k in group_of:
+                self.add_processor(_QobjExpectMany(
+                    [raw_ops[key] for key in group_of[k]],
+                    [self.e_data[key].append for key in group_of[k]],
+                ))
+            elif k not in grouped:
+                self.add_processor(self.e_ops[k]._store)
 
         self.times = []
         self.states = []
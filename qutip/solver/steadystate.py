@@ -348,7 +348,7 @@ def _steadystate_power(A, **kw):
     tol = kw.pop("power_tol", 1e-12)
     method = kw.pop("method", None)
     while it < maxiter and _data.norm.max(L @ y) > tol:
-        y = _data.solve(L, y, method, options=kw)
+        y = _data.solve(L, y, method, options=kw, reuse=True)
         y = y / _data.norm.max(y)
         it += 1
 
@@ -14,13 +14,10 @@ def run(full=False):
     # Call about to get all version info printed with tests
     about()
     import pytest
-    # real_num_cpu = qset.num_cpus
-    # real_thresh = qset.openmp_thresh
-    # if qset.has_openmp:
-        # For travis which VMs have only 1 cpu.
+    real_thresh = qset.core["openmp_thresh"]
+    if qset.has_openmp:
         # Make sure the openmp version of the functions are tested.
-    #     qset.num_cpus = 2
-    #     qset.openmp_thresh = 100
+        qset.core["openmp_thresh"] = 100
 
     test_options = ["--verbosity=1", "--disable-pytest-warnings", "--pyargs"]
     if not full:
@@ -29,6 +26,4 @@ def run(full=False):
     # runs tests in qutip.tests module only
 
     # Restore previous settings
-    # if qset.has_openmp:
-    #     qset.num_cpus = real_num_cpu
-    #     qset.openmp_thresh = real_thresh
+    qset.core["openmp_thresh"] = real_thresh
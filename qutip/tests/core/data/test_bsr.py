@@ -0,0 +1,135 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from qutip.core import data
+from qutip.core.data import BSR
+
+from . import conftest
+
+
+def _block_matrix(blocksize=(3, 2), shape=(4, 3), density=0.5):
+    mask = np.random.rand(*shape) < density
+    mask[0, 0] = True
+    rows, cols = np.nonzero(mask)
+    blocks = np.array([
+        conftest.random_dense(blocksize, False) for _ in rows
+    ], dtype=data.Data)
+    args = (
+        rows.astype(data.base.idxint_dtype),
+        cols.astype(data.base.idxint_dtype),
+        blocks,
+        np.full(shape[0], blocksize[0], dtype=data.base.idxint_dtype),
+        np.full(shape[1], blocksize[1], dtype=data.base.idxint_dtype),
+    )
+    return data.block_build(*args, dtype=BSR), data.block_build_dense(*args)
+
+
+class TestType:
+    def test_block_build(self):
+        matrix, expected = _block_matrix()
+        assert isinstance(matrix, BSR)
+        assert matrix.blocksize == (3, 2)
+        assert matrix.shape == expected.shape
+        np.testing.assert_array_equal(matrix.to_array(), expected.to_array())
+
+    def test_block_build_bad(self):
+        block = data.Dense(np.ones((2, 2)))
+        idx = data.base.idxint_dtype
+        with pytest.raises(ValueError):
+            data.block_build(
+                np.array([0, 0], dtype=idx), np.array([1, 0], dtype=idx),
+                np.array([block, block], dtype=data.Data),
+                np.array([2, 2], dtype=idx), np.array([2, 2], dtype=idx),
+                dtype=BSR,
+            )
+        with pytest.raises(ValueError):
+            data.block_build(
+                np.array([0], dtype=idx), np.array([2], dtype=idx),
+                np.array([block], dtype=data.Data),
+                np.array([2, 2], dtype=idx), np.array([2, 2], dtype=idx),
+                dtype=BSR,
+            )
+
+    def test_conversion(self):
+        matrix, expected = _block_matrix()
+        for dtype in [data.CSR, data.Dense, data.Dia]:
+            out = data.to(dtype, matrix)
+            assert isinstance(out, dtype)
+            np.testing.assert_array_equal(out.to_array(), expected.to_array())
+            back = data.to(BSR, out)
+            assert isinstance(back, BSR)
+            np.testing.assert_array_equal(back.to_array(),
+                                          expected.to_array())
+
+    def test_pickle_and_copy(self):
+        matrix, expected = _block_matrix()
+        out = pickle.loads(pickle.dumps(matrix))
+        np.testing.assert_array_equal(out.to_array(), expected.to_array())
+        copy = matrix.copy()
+        data.imul(copy, 2)
+        np.testing.assert_array_equal(matrix.to_array(), expected.to_array())
+        np.testing.assert_array_equal(copy.to_array(),
+                                      2 * expected.to_array())
+
+    def test_unary(self):
+        matrix, expected = _block_matrix()
+        expected = expected.to_array()
+        for op, result in [
+            (data.adjoint, expected.T.conj()),
+            (data.transpose, expected.T),
+            (data.conj, expected.conj()),
+            (data.neg, -expected),
+            (lambda x: data.mul(x, 0.5j), 0.5j * expected),
+        ]:
+            out = op(matrix)
+            assert isinstance(out, BSR)
+            np.testing.assert_allclose(out.to_array(), result, atol=1e-12)
+
+    def test_add(self):
+        left, left_expected = _block_matrix()
+        right, right_expected = _block_matrix()
+        out = data.add(left, right, 2j)
+        assert isinstance(out, BSR)
+        np.testing.assert_allclose(
+            out.to_array(),
+            left_expected.to_array() + 2j * right_expected.to_array(),
+            atol=1e-12,
+        )
+        np.testing.assert_allclose(
+            data.sub(left, right).to_array(),
+            left_expected.to_array() - right_expected.to_array(),
+            atol=1e-12,
+        )
+
+
+@pytest.mark.parametrize("ncols", [1, 3])
+def test_matmul(ncols):
+    matrix, expected = _block_matrix()
+    right = conftest.random_dense((matrix.shape[1], ncols), True)
+    result = 0.5 * expected.to_array() @ right.to_array()
+    out = data.matmul(matrix, right, 0.5)
+    assert isinstance(out, data.Dense)
+    np.testing.assert_allclose(out.to_array(), result, atol=1e-12)
+    previous = out.to_array()
+    assert data.matmul(matrix, right, 0.5, out=out) is out
+    np.testing.assert_allclose(out.to_array(), previous + result, atol=1e-12)
+
+    other, other_expected = _block_matrix((2, 3), (3, 4))
+    out = data.matmul(matrix, other)
+    assert isinstance(out, BSR)
+    np.testing.assert_allclose(
+        out.to_array(), expected.to_array() @ other_expected.to_array(),
+        atol=1e-12,
+    )
+
+
+def test_trace_and_expect():
+    matrix, expected = _block_matrix((3, 3), (4, 4))
+    assert data.trace(matrix) == pytest.approx(data.trace(expected))
+    for shape in [(12, 1), (12, 12)]:
+        state = conftest.random_dense(shape, False)
+        assert data.expect(matrix, state) == pytest.approx(
+            data.expect(expected, state)
+        )
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import qutip
+from qutip.core import data
+from qutip.core.data.dispatch import _cost_specialisation
+
+
+def _operands(size, density, ncols):
+    op = qutip.rand_herm(size, density, dtype="CSR", seed=1).data
+    state = data.Dense(np.random.rand(size, ncols) + 0j)
+    return op, state
+
+
+@pytest.mark.parametrize(["density", "ncols", "expected"], [
+    pytest.param(0.01, 32, data.matmul_csr_dense_dense, id="sparse"),
+    pytest.param(0.5, 32, data.matmul_dense, id="dense"),
+    pytest.param(0.5, 1, data.matmul_csr_dense_dense, id="vector"),
+])
+def test_matmul_choice(density, ncols, expected):
+    op, state = _operands(100, density, ncols)
+    choice = data.matmul[data.CSR, data.Dense]
+    assert isinstance(choice, _cost_specialisation)
+    chosen = choice.choose(op, state)
+    assert getattr(chosen, "_call", chosen) is expected
+    np.testing.assert_allclose(
+        data.matmul(op, state).to_array(),
+        op.to_array() @ state.to_array(),
+        atol=1e-12,
+    )
+
+
+def test_disabled():
+    op, state = _operands(100, 0.5, 32)
+    data.cost_model.enabled = False
+    try:
+        assert (
+            data.matmul[data.CSR, data.Dense].choose(op, state)
+            is data.matmul_csr_dense_dense
+        )
+    finally:
+        data.cost_model.enabled = True
+    assert data.cost_model.enabled
+
+
+def test_calibrate():
+    model = data.CostModel().calibrate(size=50, density=0.2, ncols=4)
+    for rate in [model.csr_matmul, model.dense_matmul, model.csr_to_dense]:
+        assert 0 < rate < 1e-3
+    assert "csr_matmul" in repr(model)
@@ -416,3 +416,100 @@ def test_tidyup():
         auto_tidyup_atol=1e-3, auto_tidyup=False, default_dtype=csr.CSR
     ):
         assert (small + small).tr() == 2e-5
+
+
+
+class TestCSRAddPlan:
+    def test_sum(self):
+        terms = [
+            conftest.random_csr((6, 5), density, True)
+            for density in [0.2, 0.5, 1, 0]
+        ]
+        plan = data.CSRAddPlan(terms)
+        assert plan.shape == (6, 5)
+        assert plan.matches(terms)
+        for coeffs in [(1, 2j, -0.5, 3), (0, 0, 0, 0)]:
+            expected = sum(
+                coeff * term.to_array() for coeff, term in zip(coeffs, terms)
+            )
+            out = plan.sum(coeffs)
+            assert isinstance(out, data.CSR)
+            np.testing.assert_allclose(out.to_array(), expected, atol=1e-14)
+        # The output can be reused, and only its data is overwritten.
+        assert plan.sum((1, 1, 1, 1), out=out) is out
+        np.testing.assert_allclose(
+            out.to_array(), sum(term.to_array() for term in terms),
+            atol=1e-14,
+        )
+
+    def test_matches(self):
+        terms = [conftest.random_csr((5, 5), 0.5, True) for _ in range(2)]
+        plan = data.CSRAddPlan(terms)
+        assert not plan.matches(terms[:1])
+        assert not plan.matches([terms[0], terms[1].copy()])
+
+    def test_bad(self):
+        with pytest.raises(ValueError):
+            data.CSRAddPlan([])
+        with pytest.raises(ValueError):
+            data.CSRAddPlan([csr.identity(2), csr.identity(3)])
+        plan = data.CSRAddPlan([csr.identity(2), csr.identity(2)])
+        with pytest.raises(ValueError):
+            plan.sum([1])
+        with pytest.raises(ValueError):
+            plan.sum([1, 1], out=csr.zeros(2, 2))
+
+
+@pytest.mark.skipif(
+    data.base.idxint_size == 64, reason="Only 32-bit indices can overflow."
+)
+class TestIndexOverflow:
+    def test_init(self):
+        # Casting such a row_index to int32 would silently wrap around.
+        arg = (
+            np.zeros(1, dtype=np.complex128),
+            np.zeros(1, dtype=np.int64),
+            np.array([0, 2**31], dtype=np.int64),
+        )
+        with pytest.raises(OverflowError, match="--with-idxint-64"):
+            data.CSR(arg, shape=(1, 2))
+
+    def test_kron(self):
+        matrix = csr.identity(2**16)
+        with pytest.raises(OverflowError, match="--with-idxint-64"):
+            data.kron_csr(matrix, matrix)
+
+
+class TestFromMemmap:
+    def test_zero_copy(self, tmp_path):
+        matrix = conftest.random_scipy_csr((5, 4), 0.5, True)
+        arrays = []
+        for i, array in enumerate(
+            [matrix.data, matrix.indices, matrix.indptr]
+        ):
+            mapped = np.memmap(tmp_path / str(i), dtype=array.dtype,
+                               mode="w+", shape=array.shape)
+            mapped[:] = array
+            arrays.append(mapped)
+        test = data.CSR.from_memmap(*arrays, shape=(5, 4))
+        assert test.shape == (5, 4)
+        assert np.shares_memory(test.as_scipy().data, arrays[0])
+        assert np.shares_memory(test.as_scipy().indices, arrays[1])
+        np.testing.assert_array_equal(test.to_array(), matrix.toarray())
+        vector = np.random.rand(4) + 0j
+        np.testing.assert_allclose(
+            data.matmul(test, data.Dense(vector)).to_array()[:, 0],
+            matrix @ vector,
+        )
+
+    def test_bad(self):
+        matrix = conftest.random_scipy_csr((5, 4), 0.5, True)
+        args = [matrix.data, matrix.indices, matrix.indptr]
+        with pytest.raises(TypeError):
+            data.CSR.from_memmap(matrix.data.real, *args[1:], shape=(5, 4))
+        with pytest.raises(TypeError):
+            data.CSR.from_memmap(
+                args[0], args[1].astype(np.int8), args[2], shape=(5, 4),
+            )
+        with pytest.raises(ValueError):
+            data.CSR.from_memmap(*args, shape=(4, 4))
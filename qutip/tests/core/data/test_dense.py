@@ -324,3 +324,26 @@ def test_nnz(shape):
         op[row, (row+1) % shape[1]] = 0.1 * tol
         op[row, row % shape[1]] = 0.8 * tol * (1. + 1j)
     assert dense.nnz(dense.Dense(op), tol) == shape[0]
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_from_memmap(tmp_path, order):
+    array = np.random.rand(4, 3) + 1j * np.random.rand(4, 3)
+    mapped = np.memmap(tmp_path / "dense.bin", dtype=np.complex128,
+                       mode="w+", shape=(4, 3), order=order)
+    mapped[:] = array
+    test = dense.Dense.from_memmap(mapped)
+    assert test.shape == (4, 3)
+    assert test.fortran == (order == "F")
+    assert np.shares_memory(test.as_ndarray(), mapped)
+    np.testing.assert_array_equal(test.to_array(), array)
+    np.testing.assert_allclose(
+        data.matmul(test, test.adjoint()).to_array(), array @ array.conj().T,
+    )
+
+
+def test_from_memmap_bad():
+    with pytest.raises(TypeError):
+        dense.Dense.from_memmap(np.zeros((2, 2), dtype=np.float64))
+    with pytest.raises(ValueError):
+        dense.Dense.from_memmap(np.zeros((4, 4), dtype=np.complex128)[::2])
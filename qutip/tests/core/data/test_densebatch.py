@@ -0,0 +1,214 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from qutip.core import data
+from qutip.core.data import DenseBatch
+
+from . import conftest
+
+BATCH_SIZE = 4
+
+
+def _random_batch(shape, batch_size=BATCH_SIZE):
+    states = [conftest.random_dense(shape, False) for _ in range(batch_size)]
+    return DenseBatch(states), [state.to_array() for state in states]
+
+
+def _operator(dtype, size=5):
+    return data.to(dtype, conftest.random_dense((size, size), False))
+
+
+@pytest.fixture(params=[
+    pytest.param((5, 1), id='ket'),
+    pytest.param((1, 5), id='bra'),
+    pytest.param((5, 5), id='square'),
+    pytest.param((5, 3), id='tall'),
+])
+def shape(request): return request.param
+
+
+class TestType:
+    def test_init(self, shape):
+        batch, arrays = _random_batch(shape)
+        assert batch.shape == shape
+        assert batch.batch_size == BATCH_SIZE
+        np.testing.assert_array_equal(batch.as_ndarray(), np.array(arrays))
+        for state, array in zip(batch.states(), arrays):
+            assert isinstance(state, data.Dense)
+            np.testing.assert_array_equal(state.to_array(), array)
+
+    def test_init_from_arrays(self):
+        kets = np.random.rand(BATCH_SIZE, 5) + 0j
+        batch = DenseBatch(kets)
+        assert batch.shape == (5, 1)
+        np.testing.assert_array_equal(batch.as_ndarray()[:, :, 0], kets)
+        np.testing.assert_array_equal(
+            DenseBatch(kets[:, :, None]).as_ndarray(), batch.as_ndarray()
+        )
+
+    @pytest.mark.parametrize("states", [
+        pytest.param([], id='empty'),
+        pytest.param(np.zeros((2, 2, 2, 2)), id='4D'),
+    ])
+    def test_init_bad(self, states):
+        with pytest.raises(ValueError):
+            DenseBatch(states)
+
+    def test_view(self, shape):
+        batch, _ = _random_batch(shape)
+        batch.as_ndarray()[1] = 0
+        np.testing.assert_array_equal(batch.states()[1].to_array(), 0)
+
+    def test_copy(self, shape):
+        batch, arrays = _random_batch(shape)
+        copy = batch.copy()
+        data.imul(copy, 2)
+        np.testing.assert_array_equal(batch.as_ndarray(), np.array(arrays))
+        np.testing.assert_allclose(copy.as_ndarray(), 2 * np.array(arrays))
+
+    def test_pickle(self, shape):
+        batch, _ = _random_batch(shape)
+        out = pickle.loads(pickle.dumps(batch))
+        assert out.batch_size == batch.batch_size
+        np.testing.assert_array_equal(out.as_ndarray(), batch.as_ndarray())
+
+    def test_conversion(self, shape):
+        state = conftest.random_dense(shape, False)
+        batch = data.to(DenseBatch, state)
+        assert batch.batch_size == 1
+        np.testing.assert_array_equal(batch.to_array(), state.to_array())
+        for dtype in [data.Dense, data.CSR]:
+            np.testing.assert_array_equal(
+                data.to(dtype, batch).to_array(), state.to_array()
+            )
+
+    def test_conversion_many_fails(self, shape):
+        batch, _ = _random_batch(shape)
+        with pytest.raises(ValueError):
+            data.to(data.Dense, batch)
+        with pytest.raises(ValueError):
+            batch.to_array()
+
+    def test_unary(self, shape):
+        batch, arrays = _random_batch(shape)
+        arrays = np.array(arrays)
+        for op, expected in [
+            (data.adjoint, arrays.transpose(0, 2, 1).conj()),
+            (data.transpose, arrays.transpose(0, 2, 1)),
+            (data.conj, arrays.conj()),
+            (data.neg, -arrays),
+            (lambda x: data.mul(x, 0.5j), 0.5j * arrays),
+        ]:
+            out = op(batch)
+            assert isinstance(out, DenseBatch)
+            np.testing.assert_allclose(out.as_ndarray(), expected)
+
+    def test_add(self, shape):
+        left, left_arrays = _random_batch(shape)
+        right, right_arrays = _random_batch(shape)
+        expected = np.array(left_arrays) + 2j * np.array(right_arrays)
+        out = data.add(left, right, 2j)
+        assert isinstance(out, DenseBatch)
+        np.testing.assert_allclose(out.as_ndarray(), expected)
+        np.testing.assert_allclose(
+            data.sub(left, right).as_ndarray(),
+            np.array(left_arrays) - np.array(right_arrays),
+        )
+        assert data.iadd(left, right, 2j) is left
+        np.testing.assert_allclose(left.as_ndarray(), expected)
+
+    def test_add_incompatible(self, shape):
+        left, _ = _random_batch(shape)
+        right, _ = _random_batch(shape, BATCH_SIZE + 1)
+        with pytest.raises(ValueError):
+            data.add(left, right)
+
+
+@pytest.mark.parametrize("dtype", [data.CSR, data.Dense, data.Dia])
+@pytest.mark.parametrize("ncols", [1, 3, 5])
+def test_matmul(dtype, ncols):
+    op = _operator(dtype)
+    batch, arrays = _random_batch((5, ncols))
+    expected = 0.5 * (op.to_array() @ np.array(arrays))
+    out = data.matmul(op, batch, 0.5)
+    assert isinstance(out, DenseBatch)
+    np.testing.assert_allclose(out.as_ndarray(), expected, atol=1e-12)
+    previous = out.as_ndarray().copy()
+    assert data.matmul(op, batch, 0.5, out=out) is out
+    np.testing.assert_allclose(
+        out.as_ndarray(), previous + expected, atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("dtype", [data.CSR, data.Dense, data.Dia])
+@pytest.mark.parametrize("shape", [(5, 1), (5, 5)], ids=['ket', 'dm'])
+def test_expect(dtype, shape):
+    op = _operator(dtype)
+    batch, arrays = _random_batch(shape)
+    out = data.expect(op, batch)
+    assert out.shape == (BATCH_SIZE,)
+    expected = [
+        data.expect(data.to(data.Dense, op), data.Dense(array))
+        for array in arrays
+    ]
+    np.testing.assert_allclose(out, expected, atol=1e-12)
+
+
+def test_expect_bad_shape():
+    batch, _ = _random_batch((5, 3))
+    with pytest.raises(ValueError):
+        data.expect(_operator(data.CSR), batch)
+
+
+@pytest.mark.parametrize("scalar_is_ket", [True, False])
+@pytest.mark.parametrize("left_shape", [(5, 1), (1, 5)], ids=['ket', 'bra'])
+@pytest.mark.parametrize("left_batch, right_batch", [
+    pytest.param(True, True, id='batch-batch'),
+    pytest.param(False, True, id='single-batch'),
+    pytest.param(True, False, id='batch-single'),
+])
+def test_inner(left_shape, scalar_is_ket, left_batch, right_batch):
+    size = BATCH_SIZE if left_batch else 1
+    left, left_arrays = _random_batch(left_shape, size)
+    if not left_batch:
+        left = left.states()[0]
+    size = BATCH_SIZE if right_batch else 1
+    right, right_arrays = _random_batch((5, 1), size)
+    if not right_batch:
+        right = right.states()[0]
+    out = data.inner(left, right, scalar_is_ket)
+    assert out.shape == (BATCH_SIZE,)
+    left_arrays = left_arrays * (BATCH_SIZE // len(left_arrays))
+    right_arrays = right_arrays * (BATCH_SIZE // len(right_arrays))
+    expected = [
+        data.inner(data.Dense(left_array), data.Dense(right_array),
+                   scalar_is_ket)
+        for left_array, right_array in zip(left_arrays, right_arrays)
+    ]
+    np.testing.assert_allclose(out, expected, atol=1e-12)
+
+
+def test_norm_and_trace():
+    batch, arrays = _random_batch((5, 1))
+    np.testing.assert_allclose(
+        data.norm.l2(batch), [np.linalg.norm(array) for array in arrays]
+    )
+    batch, arrays = _random_batch((5, 5))
+    np.testing.assert_allclose(
+        data.norm.frobenius(batch),
+        [np.linalg.norm(array) for array in arrays],
+    )
+    np.testing.assert_allclose(
+        data.trace(batch), [np.trace(array) for array in arrays]
+    )
+    with pytest.raises(ValueError):
+        data.norm.l2(batch)
+
+
+def test_single_state_operations_stay_unbatched():
+    op = _operator(data.CSR)
+    state = conftest.random_dense((5, 1), False)
+    assert isinstance(data.matmul(op, state), data.Dense)
+    assert isinstance(data.expect(op, state), complex)
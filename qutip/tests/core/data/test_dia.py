@@ -90,6 +90,12 @@ class TestClassMethods:
         the correct type.
         """
         sci = _valid_scipy()
+        if np.dtype(o_type).kind == 'u':
+            # Negative offsets cannot be represented by unsigned types.
+            keep = sci.offsets >= 0
+            sci = scipy.sparse.dia_matrix(
+                (sci.data[keep], sci.offsets[keep]), shape=sci.shape
+            )
         data = sci.data.real.astype(d_type, casting='unsafe')
         offsets = sci.offsets.astype(o_type, casting='unsafe')
         scipy_dia = scipy.sparse.dia_matrix((data, offsets), shape=sci.shape)
@@ -363,3 +369,11 @@ def test_autotidyup():
         auto_tidyup_atol=1e-3, auto_tidyup=False, default_dtype=Dia
     ):
         assert (small + small).tr() == 2e-5
+
+
+@pytest.mark.skipif(
+    data.base.idxint_size == 64, reason="Only 32-bit indices can overflow."
+)
+def test_empty_index_overflow():
+    with pytest.raises(OverflowError, match="--with-idxint-64"):
+        dia.empty(2**16, 2**16, 2**16)
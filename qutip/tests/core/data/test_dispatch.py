@@ -1,7 +1,9 @@
 import pytest
 import itertools
 import qutip
-from qutip.core.data.dispatch import Dispatcher, _constructed_specialisation
+from qutip.core.data.dispatch import (
+    Dispatcher, _constructed_specialisation, _cost_specialisation,
+)
 import qutip.core.data as _data
 
 
@@ -215,3 +217,51 @@ def test_Data_low_priority_two_dispatch():
         dispatched[_data.CSR, _data.Dense](_data.zeros[_data.CSR](1, 1))
         dispatched[_data.CSR, _data.CSR](_data.zeros[_data.CSR](1, 1))
         assert f_data.count == 1
+
+
+def test_costs():
+    def func_csr(left, /):
+        return "CSR"
+
+    def func_dense(left, /):
+        return "Dense"
+
+    def func_dia(left, /):
+        return "Dia"
+
+    dispatched = Dispatcher(func_csr, ("left",), False)
+    dispatched.add_specialisations([
+        (_data.CSR, func_csr),
+        (_data.Dense, func_dense),
+        (_data.Dia, func_dia),
+    ])
+    dispatched.add_costs([
+        (_data.CSR, lambda left: left.shape[0]),
+        (_data.Dense, lambda left: 10),
+    ])
+    small = _data.zeros[_data.CSR](5, 5)
+    large = _data.zeros[_data.CSR](50, 50)
+
+    assert isinstance(dispatched[_data.CSR], _cost_specialisation)
+    assert dispatched(small) == "CSR"
+    assert dispatched(large) == "Dense"
+    # Converting dense data to sparse is never considered.
+    assert dispatched[_data.Dense] is func_dense
+    # No cost function for the specialisation found from the weights.
+    assert dispatched[_data.Dia] is func_dia
+
+    _data.cost_model.enabled = False
+    try:
+        assert dispatched(large) == "CSR"
+    finally:
+        _data.cost_model.enabled = True
+
+
+def test_costs_unknown_specialisation():
+    def func_csr(left, /):
+        return "CSR"
+
+    dispatched = Dispatcher(func_csr, ("left",), False)
+    dispatched.add_specialisations([(_data.CSR, func_csr)])
+    with pytest.raises(ValueError):
+        dispatched.add_costs([(_data.Dense, lambda left: 0)])
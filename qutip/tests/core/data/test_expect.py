@@ -71,3 +71,37 @@ class TestExpectSuper(BinaryOpMixin):
         pytest.param(data.expect_super_dia_dense, Dia, Dense, complex),
         pytest.param(data.expect_super_data, CSR, Dense, complex),
     ]
+
+
+@pytest.mark.parametrize("dtypes", [
+    pytest.param([CSR, CSR, CSR], id="CSR"),
+    pytest.param([Dia, CSR, Dia], id="sparse"),
+    pytest.param([Dense, Dense, Dense], id="Dense"),
+    pytest.param([Dense, CSR, Dia], id="mixed"),
+])
+@pytest.mark.parametrize("shape", [(10, 1), (10, 10)], ids=["ket", "dm"])
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_expect_many(dtypes, shape, order):
+    ops = [
+        data.to(dtype, data.Dense(np.random.rand(10, 10) + 1j))
+        for dtype in dtypes
+    ]
+    state = data.Dense(np.array(
+        np.random.rand(*shape) + 1j * np.random.rand(*shape), order=order,
+    ))
+    expected = [data.expect(op, state) for op in ops]
+    np.testing.assert_allclose(data.expect_many(ops, state), expected,
+                               rtol=1e-12)
+    expect_many = data.ExpectMany(ops)
+    assert len(expect_many) == len(ops)
+    for _ in range(2):
+        np.testing.assert_allclose(expect_many(state), expected, rtol=1e-12)
+
+
+def test_expect_many_bad():
+    with pytest.raises(ValueError):
+        data.ExpectMany([])
+    with pytest.raises(ValueError):
+        data.ExpectMany([data.identity(2), data.identity(3)])
+    with pytest.raises(ValueError):
+        data.expect_many([data.identity(2)], data.zeros(3, 1))
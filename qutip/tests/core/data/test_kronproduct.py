@@ -0,0 +1,183 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import qutip
+from qutip.core import data
+from qutip.core.data import KronProduct
+
+from . import conftest
+
+
+def _factors(shapes, identity=()):
+    factors = []
+    for i, shape in enumerate(shapes):
+        if i in identity:
+            factors.append(data.identity(shape[0]))
+        else:
+            factors.append(conftest.random_csr(shape, 0.5, False))
+    return factors
+
+
+def _full(factors, scale=1):
+    out = np.ones((1, 1))
+    for factor in factors:
+        out = np.kron(out, factor.to_array())
+    return scale * out
+
+
+@pytest.fixture(params=[
+    pytest.param(([(2, 2), (3, 3), (4, 4)], ()), id='square'),
+    pytest.param(([(2, 2), (3, 3), (4, 4)], (0, 2)), id='identities'),
+    pytest.param(([(2, 3), (3, 3), (1, 4)], (1,)), id='rectangular'),
+])
+def kronproduct(request):
+    shapes, identity = request.param
+    factors = _factors(shapes, identity)
+    return KronProduct(factors, 0.5j), _full(factors, 0.5j)
+
+
+class TestType:
+    def test_init(self, kronproduct):
+        matrix, expected = kronproduct
+        assert matrix.shape == expected.shape
+        np.testing.assert_allclose(matrix.to_array(), expected, atol=1e-12)
+
+    @pytest.mark.parametrize("factors", [
+        pytest.param([], id='empty'),
+        pytest.param([np.eye(2)], id='array'),
+    ])
+    def test_init_bad(self, factors):
+        with pytest.raises((ValueError, TypeError)):
+            KronProduct(factors)
+
+    def test_pickle(self, kronproduct):
+        matrix, expected = kronproduct
+        out = pickle.loads(pickle.dumps(matrix))
+        np.testing.assert_allclose(out.to_array(), expected, atol=1e-12)
+
+    def test_conversion(self, kronproduct):
+        matrix, expected = kronproduct
+        for dtype in [data.CSR, data.Dense, data.Dia]:
+            out = data.to(dtype, matrix)
+            assert isinstance(out, dtype)
+            np.testing.assert_allclose(out.to_array(), expected, atol=1e-12)
+        single = data.to(KronProduct, data.to(data.CSR, matrix))
+        assert len(single.factors) == 1
+        np.testing.assert_allclose(single.to_array(), expected, atol=1e-12)
+
+    def test_unary(self, kronproduct):
+        matrix, expected = kronproduct
+        for op, result in [
+            (data.adjoint, expected.T.conj()),
+            (data.transpose, expected.T),
+            (data.conj, expected.conj()),
+            (data.neg, -expected),
+            (lambda x: data.mul(x, 2 - 1j), (2 - 1j) * expected),
+        ]:
+            out = op(matrix)
+            assert isinstance(out, KronProduct)
+            np.testing.assert_allclose(out.to_array(), result, atol=1e-12)
+
+    def test_add(self, kronproduct):
+        matrix, expected = kronproduct
+        out = data.add(matrix, data.mul(matrix, 2), 0.5j)
+        assert isinstance(out, KronProduct)
+        assert out.factors == matrix.factors
+        np.testing.assert_allclose(out.to_array(), (1 + 1j) * expected,
+                                   atol=1e-12)
+        other = KronProduct([data.to(data.CSR, matrix)])
+        out = data.sub(matrix, other)
+        assert isinstance(out, KronProduct)
+        np.testing.assert_allclose(out.to_array(), 0, atol=1e-12)
+
+    def test_kron(self, kronproduct):
+        matrix, expected = kronproduct
+        other = conftest.random_dense((2, 3), False)
+        for left, right, result in [
+            (matrix, other, np.kron(expected, other.to_array())),
+            (other, matrix, np.kron(other.to_array(), expected)),
+            (matrix, matrix, np.kron(expected, expected)),
+        ]:
+            out = data.kron(left, right)
+            assert isinstance(out, KronProduct)
+            np.testing.assert_allclose(out.to_array(), result, atol=1e-12)
+
+
+@pytest.mark.parametrize("ncols", [1, 3])
+def test_matmul(kronproduct, ncols):
+    matrix, expected = kronproduct
+    right = conftest.random_dense((matrix.shape[1], ncols), False)
+    result = 2 * expected @ right.to_array()
+    out = data.matmul(matrix, right, 2)
+    assert isinstance(out, data.Dense)
+    np.testing.assert_allclose(out.to_array(), result, atol=1e-12)
+    previous = out.to_array()
+    assert data.matmul(matrix, right, 2, out=out) is out
+    np.testing.assert_allclose(out.to_array(), previous + result, atol=1e-12)
+
+    left = conftest.random_dense((ncols, matrix.shape[0]), True)
+    out = data.matmul(left, matrix)
+    np.testing.assert_allclose(out.to_array(), left.to_array() @ expected,
+                               atol=1e-12)
+
+
+def test_matmul_kronproduct():
+    left_factors = _factors([(2, 2), (3, 3)], (1,))
+    right_factors = _factors([(2, 2), (3, 3)], (0,))
+    left = KronProduct(left_factors, 2)
+    right = KronProduct(right_factors, 1j)
+    out = data.matmul(left, right)
+    assert isinstance(out, KronProduct)
+    assert len(out.factors) == 2
+    np.testing.assert_allclose(
+        out.to_array(), _full(left_factors, 2) @ _full(right_factors, 1j),
+        atol=1e-12,
+    )
+    # Factors which do not line up still give the right product.
+    right_factors = _factors([(3, 3), (2, 2)])
+    right = KronProduct(right_factors)
+    out = data.matmul(left, right)
+    np.testing.assert_allclose(
+        out.to_array(), _full(left_factors, 2) @ _full(right_factors),
+        atol=1e-12,
+    )
+
+
+def test_trace_and_expect():
+    factors = _factors([(2, 2), (3, 3), (2, 2)], (1,))
+    matrix = KronProduct(factors, 0.5)
+    expected = _full(factors, 0.5)
+    assert data.trace(matrix) == pytest.approx(np.trace(expected))
+    ket = conftest.random_dense((12, 1), False)
+    assert data.expect(matrix, ket) == pytest.approx(
+        data.expect(data.Dense(expected), ket)
+    )
+    dm = conftest.random_dense((12, 12), False)
+    assert data.expect(matrix, dm) == pytest.approx(
+        data.expect(data.Dense(expected), dm)
+    )
+    assert not data.iszero(matrix)
+    assert data.iszero(data.mul(matrix, 0))
+
+
+def test_tensor_qobjevo():
+    sites = 6
+    factors = [qutip.qeye(2).to("kronproduct") for _ in range(sites)]
+    factors[1] = qutip.sigmax().to("kronproduct")
+    factors[4] = qutip.sigmaz().to("kronproduct")
+    op = qutip.tensor(*factors)
+    assert isinstance(op.data, KronProduct)
+    full = qutip.tensor(*[factor.to("csr") for factor in factors])
+    assert op == full
+
+    psi = qutip.rand_ket([2] * sites)
+    evo = qutip.QobjEvo([[op, "cos(t)"]])
+    np.testing.assert_allclose(
+        evo.matmul(0.3, psi).full(), np.cos(0.3) * (full @ psi).full(),
+        atol=1e-12,
+    )
+    assert evo.expect(0.3, psi) == pytest.approx(
+        np.cos(0.3) * qutip.expect(full, psi)
+    )
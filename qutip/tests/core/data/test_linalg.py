@@ -75,11 +75,46 @@ class TestSolve():
                                    atol=1e-7, rtol=1e-7)
 
 
-    def test_singular(self):
+    @pytest.mark.parametrize('method', [None, "splu", "solve"])
+    @pytest.mark.parametrize('dtype', [CSR, Dia, Dense])
+    def test_reuse(self, method, dtype):
+        if dtype is Dense and method == "splu":
+            pytest.skip("splu is only for sparse matrices")
+        _data.factorisation_cache.clear()
+        A = self._gen_op(10, dtype)
+        for _ in range(2):
+            b = self._gen_ket(10, Dense)
+            expected = self.op_numpy(A.to_array(), b.to_array())
+            test = _data.solve(A, b, method, reuse=True)
+            np.testing.assert_allclose(test.to_array(), expected,
+                                       atol=1e-7, rtol=1e-7)
+            assert len(_data.factorisation_cache) == 1
+        # A matrix with the same content uses the same factorisation.
+        _data.solve(A.copy(), b, method, reuse=True)
+        assert len(_data.factorisation_cache) == 1
+        _data.solve(_data.mul(A, 2), b, method, reuse=True)
+        assert len(_data.factorisation_cache) == 2
+
+    def test_reuse_eviction(self):
+        cache = _data.FactorisationCache(maxsize=2)
+        calls = []
+
+        def factorise(key):
+            return lambda: calls.append(key) or key
+
+        for key in ["a", "b", "a", "c", "b", "a"]:
+            assert cache.get(key, factorise(key)) == key
+        assert len(cache) == 2
+        # "b" was evicted by "c" since "a" was used more recently, then "a"
+        # was evicted when "b" came back.
+        assert calls == ["a", "b", "c", "b", "a"]
+
+    @pytest.mark.parametrize('reuse', [False, True])
+    def test_singular(self, reuse):
         A = qutip.num(2).data
         b = qutip.basis(2, 1).data
         with pytest.raises(ValueError) as err:
-            test1 = _data.solve(A, b)
+            test1 = _data.solve(A, b, reuse=reuse)
         assert "singular" in str(err.value).lower()
 
 
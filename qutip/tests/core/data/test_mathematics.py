@@ -813,6 +813,49 @@ class TestKronT(BinaryOpMixin):
     ]
 
 
+class TestKronMany:
+    factories = {
+        CSR: lambda shape: conftest.random_csr(shape, 0.4, False),
+        Dense: lambda shape: conftest.random_dense(shape, True),
+        Dia: lambda shape: conftest.random_diag(shape, 0.4),
+    }
+
+    @pytest.mark.parametrize("shapes", [
+        [(3, 3)],
+        [(2, 2), (3, 3), (2, 2), (4, 4)],
+        [(2, 3), (1, 4), (3, 1)],
+        [(3, 1), (2, 1), (4, 1)],
+    ], ids=["single", "square", "rectangular", "kets"])
+    @pytest.mark.parametrize("kind", [CSR, Dense, Dia, "mixed"])
+    def test_mathematically_correct(self, kind, shapes):
+        if kind == "mixed":
+            kinds = [[CSR, Dense, Dia][i % 3] for i in range(len(shapes))]
+        else:
+            kinds = [kind] * len(shapes)
+        matrices = [
+            self.factories[kind](shape) for kind, shape in zip(kinds, shapes)
+        ]
+        expected = matrices[0].to_array()
+        for matrix in matrices[1:]:
+            expected = np.kron(expected, matrix.to_array())
+        test = data.kron_many(matrices)
+        if kind != "mixed":
+            assert isinstance(test, kind)
+        np.testing.assert_allclose(test.to_array(), expected, atol=1e-12)
+
+    def test_csr_exact_nnz(self):
+        matrices = [conftest.random_csr((4, 4), 0.3, True) for _ in range(4)]
+        test = data.kron_many_csr(matrices)
+        assert data.csr.nnz(test) == np.prod(
+            [data.csr.nnz(matrix) for matrix in matrices]
+        )
+        assert test.as_scipy().has_sorted_indices
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError):
+            data.kron_many([])
+
+
 class TestMatmul(ScaledBinaryOpMixin):
     def op_numpy(self, left, right, scale=1):
         return scale * np.matmul(left, right)
@@ -1090,6 +1133,51 @@ class TestExpm(UnaryOpMixin):
     ]
 
 
+@pytest.mark.filterwarnings("ignore:Constructing a DIA matrix")
+class TestExpmMultiply(BinaryOpMixin):
+    def op_numpy(self, matrix, state):
+        return scipy.linalg.expm(matrix) @ state
+
+    atol = 1e-8
+    shapes = [
+        (x, y)
+        for x, y in shapes_binary_matmul()
+        if x.values[0][0] == x.values[0][1]
+    ]
+    bad_shapes = [
+        (x, y)
+        for x, y in shapes_binary_bad_matmul()
+        if x.values[0][0] == x.values[0][1]
+    ] + [(x, x) for (x,) in shapes_not_square()]
+    specialisations = [
+        pytest.param(data.expm_multiply_csr_dense, CSR, Dense, Dense),
+        pytest.param(data.expm_multiply_dia_dense, Dia, Dense, Dense),
+        pytest.param(data.expm_multiply_dense, Dense, Dense, Dense),
+    ]
+
+    def test_mathematically_correct(self, op, data_l, data_r, out_type):
+        # The norms of the random matrices make the exponential huge, so we
+        # compare relative to the scale of the result.
+        left, right = data_l(), data_r()
+        expected = self.op_numpy(left.to_array(), right.to_array())
+        test = op(left, right)
+        assert isinstance(test, out_type)
+        assert test.shape == expected.shape
+        scale = max(np.max(np.abs(expected)), 1)
+        np.testing.assert_allclose(test.to_array() / scale, expected / scale,
+                                   atol=self.atol)
+
+    def test_scaled(self):
+        matrix = conftest.random_csr((20, 20), 0.2, False)
+        state = conftest.random_dense((20, 3), False)
+        expected = scipy.linalg.expm(-0.3j * matrix.to_array())
+        expected = expected @ state.to_array()
+        np.testing.assert_allclose(
+            data.expm_multiply(matrix, state, -0.3j).to_array(), expected,
+            atol=1e-10,
+        )
+
+
 class TestLogm(UnaryOpMixin):
     def op_numpy(self, matrix):
         return scipy.linalg.logm(matrix)
@@ -0,0 +1,64 @@
+import pytest
+
+from qutip.core import data
+
+from . import conftest
+
+
+@pytest.fixture
+def operands():
+    return (
+        data.to(data.CSR, conftest.random_dense((5, 5), False)),
+        conftest.random_dense((5, 1), False),
+    )
+
+
+def test_direct_call(operands):
+    op, state = operands
+    with data.profile() as prof:
+        data.matmul(op, state)
+        data.matmul(op, state)
+    assert prof.calls == {
+        ("matmul", "matmul_csr_dense_dense"): [2, pytest.approx(0, abs=1)]
+    }
+    assert prof.conversions == {}
+
+
+def test_conversion(operands):
+    op, _ = operands
+    dense = conftest.random_dense((5, 5), False)
+    with data.profile() as prof:
+        data.add(op, dense)
+    assert list(prof.calls) == [("add", "add_dense")]
+    assert prof.conversions == {
+        ("add", "CSR", "Dense"): [1, 16 * 25, pytest.approx(0, abs=1)]
+    }
+    assert "add: CSR -> Dense" in prof.report()
+
+
+def test_inactive_outside_block(operands):
+    op, state = operands
+    with data.profile() as prof:
+        pass
+    data.matmul(op, state)
+    assert prof.calls == {}
+    assert "0 calls" in repr(prof)
+
+
+def test_nested(operands):
+    op, state = operands
+    with data.profile() as outer:
+        data.matmul(op, state)
+        with data.profile() as inner:
+            data.expect(op, state)
+        data.matmul(op, state)
+    assert sum(count for count, _ in outer.calls.values()) == 3
+    assert list(inner.calls) == [("expect", "expect_csr_dense")]
+
+
+def test_reset(operands):
+    op, state = operands
+    with data.profile() as prof:
+        data.matmul(op, state)
+        prof.reset()
+    assert prof.calls == {}
@@ -182,6 +182,142 @@ class Test_isdiag:
         assert not _data.isdiag(data)
 
 
+class TestCachedProperties:
+    def _herm(self, datatype, size=5):
+        matrix = np.random.rand(size, size) + 1j * np.random.rand(size, size)
+        return _data.to(datatype, _data.Dense(matrix + matrix.T.conj()))
+
+    def test_isherm_is_cached(self, datatype):
+        matrix = self._herm(datatype)
+        assert matrix._isherm is None
+        assert _data.isherm(matrix)
+        assert matrix._isherm is True
+        # The cached value is only used with the default tolerance.
+        matrix._isherm = False
+        assert not _data.isherm(matrix)
+        assert _data.isherm(matrix, 1e-12)
+
+    def test_isdiag_is_cached(self, datatype):
+        matrix = _data.to(datatype, _data.Dense(np.diag([1., 2., 3.])))
+        assert _data.isdiag(matrix)
+        assert matrix._isdiag is True
+        assert _data.to(datatype, matrix.copy())._isdiag is True
+
+    def test_propagation(self, datatype):
+        left = self._herm(datatype)
+        right = self._herm(datatype)
+        _data.isherm(left)
+        _data.isherm(right)
+        for out in [
+            left.copy(),
+            _data.adjoint(left),
+            _data.conj(left),
+            _data.transpose(left),
+            _data.neg(left),
+            _data.mul(left, 2.5),
+            _data.add(left, right),
+            _data.sub(left, right),
+            _data.add(left, right, 0.5),
+            _data.kron(left, right),
+        ]:
+            assert out._isherm is True
+            assert _data.isherm(out, 1e-12)
+        for out in [
+            _data.mul(left, 1j),
+            _data.add(left, right, 1j),
+            _data.add(left, _data.mul(right, 1j)),
+            _data.matmul(left, right),
+        ]:
+            assert out._isherm is None
+            assert not _data.isherm(out)
+
+    def test_identity(self, datatype):
+        matrix = _data.identity[datatype](4, 2)
+        assert matrix._isherm is True
+        assert matrix._isdiag is True
+        matrix = _data.identity[datatype](4, 1j)
+        assert matrix._isherm is None
+        assert not _data.isherm(matrix)
+
+    def test_inplace_operations_clear(self):
+        matrix = self._herm(_data.Dense)
+        assert _data.isherm(matrix)
+        _data.imul_dense(matrix, 2)
+        assert matrix._isherm is True
+        _data.imul_dense(matrix, 1j)
+        assert matrix._isherm is None
+        assert not _data.isherm(matrix)
+        _data.iadd_dense(matrix, _data.mul(matrix, -2))
+        assert matrix._isherm is None
+
+        out = self._herm(_data.Dense)
+        assert _data.isherm(out)
+        _data.matmul(self._herm(_data.CSR), matrix, out=out)
+        assert out._isherm is None
+        assert not _data.isherm(out)
+
+        stacked = _data.column_stack(self._herm(_data.Dense).reorder(True))
+        assert stacked._isherm is None
+
+    def test_iadd_adjoint(self):
+        matrix = _data.Dense(np.random.rand(4, 4) + 1j * np.random.rand(4, 4))
+        assert not _data.isherm(matrix)
+        _data.iadd_adjoint_dense(matrix, _data.dense.zeros(4, 4))
+        assert matrix._isherm is True
+        assert _data.isherm(matrix, 1e-100)
+
+    def test_csr_add_plan(self):
+        terms = [self._herm(_data.CSR) for _ in range(3)]
+        for term in terms:
+            _data.isherm(term)
+        plan = _data.CSRAddPlan(terms)
+        assert plan.sum([1, 2, 3])._isherm is True
+        assert plan.sum([1, 2j, 3])._isherm is None
+
+
+class TestFingerprint:
+    def _matrix(self, datatype, shape=(5, 5)):
+        matrix = np.random.rand(*shape) + 1j * np.random.rand(*shape)
+        matrix[np.random.rand(*shape) < 0.5] = 0
+        return _data.to(datatype, _data.Dense(matrix))
+
+    @pytest.mark.parametrize("shape", [(5, 5), (3, 7), (7, 3), (4, 1)])
+    def test_copies_match(self, datatype, shape):
+        matrix = self._matrix(datatype, shape)
+        fingerprint = _data.fingerprint(matrix)
+        assert isinstance(fingerprint, str)
+        assert matrix._fingerprint == fingerprint
+        assert _data.fingerprint(matrix.copy()) == fingerprint
+        rebuilt = _data.to(datatype, _data.Dense(matrix.to_array()))
+        assert _data.fingerprint(rebuilt) == fingerprint
+        assert _data.fingerprint(_data.mul(matrix, 2)) != fingerprint
+        assert _data.fingerprint(_data.transpose(matrix)) != fingerprint
+
+    def test_dense_order(self):
+        array = np.random.rand(4, 3) + 1j
+        c_order = _data.Dense(np.ascontiguousarray(array))
+        f_order = _data.Dense(np.asfortranarray(array))
+        assert _data.fingerprint(c_order) == _data.fingerprint(f_order)
+
+    def test_type_and_shape(self):
+        matrix = self._matrix(_data.Dense, (4, 4))
+        assert (
+            _data.fingerprint(matrix)
+            != _data.fingerprint(_data.to(_data.CSR, matrix))
+        )
+        assert (
+            _data.fingerprint(_data.dense.zeros(2, 8))
+            != _data.fingerprint(_data.dense.zeros(4, 4))
+        )
+
+    def test_inplace_clears(self):
+        matrix = self._matrix(_data.Dense)
+        fingerprint = _data.fingerprint(matrix)
+        _data.imul_dense(matrix, 2)
+        assert matrix._fingerprint is None
+        assert _data.fingerprint(matrix) != fingerprint
+
+
 class TestIsEqual:
     def op_numpy(self, left, right, atol, rtol):
         return np.allclose(left.to_array(), right.to_array(), rtol, atol)
@@ -107,3 +107,27 @@ class TestPtrace(testing.UnaryOpMixin):
 
     def generate_incorrect_sel_raises(self, metafunc):
         self.generate_mathematically_correct(metafunc)
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+@pytest.mark.parametrize("dtype", [Dense, CSR])
+def test_ptrace_many(dtype, order):
+    dims = [2, 3, 4]
+    sels = [[0], [1, 2], [2, 0], [], [0, 1, 2]]
+    array = np.random.rand(24, 24) + 1j * np.random.rand(24, 24)
+    matrix = data.to(dtype, data.Dense(np.array(array, order=order)))
+    outs = data.ptrace_many(matrix, dims, sels)
+    assert len(outs) == len(sels)
+    for out, sel in zip(outs, sels):
+        expected = TestPtrace().op_numpy(array.copy(), dims, list(sel))
+        np.testing.assert_allclose(out.to_array(), expected, atol=1e-12)
+
+
+def test_ptrace_many_ket():
+    dims = [2, 3, 4]
+    sels = [[0], [1, 2], [2, 0], []]
+    ket = np.random.rand(24, 1) + 1j * np.random.rand(24, 1)
+    outs = data.ptrace_many(data.Dense(ket), dims, sels)
+    for out, sel in zip(outs, sels):
+        expected = TestPtrace().op_numpy(ket @ ket.conj().T, dims, list(sel))
+        np.testing.assert_allclose(out.to_array(), expected, atol=1e-12)
@@ -0,0 +1,176 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import qutip
+from qutip.core import data
+from qutip.core.data import Dense32, CSR32
+
+from . import conftest
+
+# Single precision has ~7 significant digits.
+_tol = {"rtol": 1e-5, "atol": 1e-5}
+
+
+@pytest.fixture(params=[
+    pytest.param((1, 5), id='bra'),
+    pytest.param((5, 1), id='ket'),
+    pytest.param((5, 5), id='square'),
+    pytest.param((2, 4), id='wide'),
+])
+def shape(request): return request.param
+
+
+def _random(shape, dtype):
+    matrix = conftest.random_dense(shape, False)
+    return data.to(dtype, matrix), matrix.to_array()
+
+
+@pytest.mark.parametrize("dtype", [Dense32, CSR32])
+class TestType:
+    def test_storage(self, dtype, shape):
+        matrix, array = _random(shape, dtype)
+        assert matrix.shape == shape
+        assert matrix.to_array().dtype == np.complex128
+        stored = (
+            matrix.as_ndarray() if dtype is Dense32 else matrix.as_scipy()
+        )
+        assert stored.dtype == np.complex64
+        np.testing.assert_allclose(matrix.to_array(), array, **_tol)
+
+    def test_conversion_round_trip(self, dtype, shape):
+        matrix, array = _random(shape, dtype)
+        for target in [data.Dense, data.CSR, data.Dia, Dense32, CSR32]:
+            out = data.to(target, matrix)
+            assert isinstance(out, target)
+            np.testing.assert_allclose(out.to_array(), array, **_tol)
+
+    def test_copy(self, dtype, shape):
+        matrix, array = _random(shape, dtype)
+        copy = matrix.copy()
+        data.imul(copy, 2)
+        np.testing.assert_allclose(matrix.to_array(), array, **_tol)
+        np.testing.assert_allclose(copy.to_array(), 2 * array, **_tol)
+
+    def test_pickle(self, dtype, shape):
+        matrix, array = _random(shape, dtype)
+        out = pickle.loads(pickle.dumps(matrix))
+        assert type(out) is dtype
+        np.testing.assert_array_equal(out.to_array(), matrix.to_array())
+
+    def test_unary(self, dtype, shape):
+        matrix, array = _random(shape, dtype)
+        for op, expected in [
+            (data.adjoint, array.T.conj()),
+            (data.transpose, array.T),
+            (data.conj, array.conj()),
+            (data.neg, -array),
+            (lambda x: data.mul(x, 0.5j), 0.5j * array),
+        ]:
+            out = op(matrix)
+            assert type(out) is dtype
+            np.testing.assert_allclose(out.to_array(), expected, **_tol)
+
+    def test_add(self, dtype, shape):
+        left, left_array = _random(shape, dtype)
+        right, right_array = _random(shape, dtype)
+        out = data.add(left, right, 2j)
+        assert type(out) is dtype
+        np.testing.assert_allclose(
+            out.to_array(), left_array + 2j * right_array, **_tol
+        )
+        out = data.sub(left, right)
+        assert type(out) is dtype
+        np.testing.assert_allclose(
+            out.to_array(), left_array - right_array, **_tol
+        )
+
+    def test_matmul(self, dtype, shape):
+        left, left_array = _random(shape, dtype)
+        right, right_array = _random(shape[::-1], Dense32)
+        out = data.matmul(left, right, 0.5)
+        assert type(out) is Dense32
+        np.testing.assert_allclose(
+            out.to_array(), 0.5 * left_array @ right_array, **_tol
+        )
+
+    def test_trace_and_norm(self, dtype):
+        matrix, array = _random((5, 5), dtype)
+        assert data.trace(matrix) == pytest.approx(np.trace(array), rel=1e-5)
+        assert (
+            data.norm.frobenius(matrix)
+            == pytest.approx(np.linalg.norm(array), rel=1e-5)
+        )
+
+    def test_expect(self, dtype):
+        op, op_array = _random((5, 5), dtype)
+        ket, ket_array = _random((5, 1), Dense32)
+        dm, dm_array = _random((5, 5), Dense32)
+        assert data.expect(op, ket) == pytest.approx(
+            (ket_array.conj().T @ op_array @ ket_array)[0, 0], rel=1e-5
+        )
+        assert data.expect(op, dm) == pytest.approx(
+            np.trace(op_array @ dm_array), rel=1e-5
+        )
+
+    def test_zeros_identity(self, dtype):
+        assert type(data.zeros[dtype](3, 4)) is dtype
+        np.testing.assert_array_equal(
+            data.zeros[dtype](3, 4).to_array(), np.zeros((3, 4))
+        )
+        np.testing.assert_array_equal(
+            data.identity[dtype](3, 2).to_array(), 2 * np.eye(3)
+        )
+
+
+def test_iadd_inplace():
+    left, left_array = _random((5, 1), Dense32)
+    right, right_array = _random((5, 1), Dense32)
+    out = data.iadd(left, right, 0.5)
+    assert out is left
+    np.testing.assert_allclose(
+        out.to_array(), left_array + 0.5 * right_array, **_tol
+    )
+
+
+@pytest.mark.parametrize("scalar_is_ket", [True, False])
+@pytest.mark.parametrize("left_shape", [(5, 1), (1, 5)], ids=["ket", "bra"])
+def test_inner(left_shape, scalar_is_ket):
+    left, left_array = _random(left_shape, Dense32)
+    right, right_array = _random((5, 1), Dense32)
+    expected = data.inner(
+        data.to(data.Dense, left), data.to(data.Dense, right), scalar_is_ket
+    )
+    assert data.inner(left, right, scalar_is_ket) == pytest.approx(
+        expected, rel=1e-5
+    )
+
+
+def test_mixed_precision_promotes():
+    op = data.to(data.CSR, conftest.random_dense((5, 5), False))
+    state = data.to(Dense32, conftest.random_dense((5, 1), False))
+    assert type(data.matmul(op, state)) is data.Dense
+
+
+def test_group_conversion():
+    assert qutip.qeye(3).to("single").dtype is CSR32
+    assert qutip.basis(3, 0).to("complex64").dtype is Dense32
+    assert qutip.basis(3, 0).to("dense32").dtype is Dense32
+
+
+@pytest.mark.parametrize("method", ["vern7", "vern9", "tsit5"])
+def test_single_precision_integration(method):
+    H = qutip.rand_herm(10, density=0.5, seed=1)
+    psi0 = qutip.basis(10, 0)
+    tlist = np.linspace(0, 1, 11)
+    options = {"method": method, "atol": 1e-7, "rtol": 1e-6}
+    expected = qutip.sesolve(H, psi0, tlist, e_ops=[H], options=options)
+    options["single_precision"] = True
+    result = qutip.sesolve(
+        H, psi0, tlist, e_ops=[H], options={**options, "store_states": True}
+    )
+    assert result.final_state.dtype is data.Dense
+    np.testing.assert_allclose(
+        result.expect[0], expected.expect[0], atol=1e-4
+    )
@@ -72,6 +72,34 @@ class TestDefaultDType:
                 (qutip.core.data.CSR, qutip.core.data.Dia)
             )
 
+    def test_auto(self):
+        N = 20
+        hopping = qutip.Qobj(np.diag(np.ones(N - 1), 1))
+        hopping = hopping + hopping.dag()
+        assert hopping.to("auto").dtype is qutip.core.data.Dia
+        assert qutip.rand_herm(N, 0.9).to("auto").dtype is qutip.core.data.Dense
+        assert qutip.rand_herm(N, 0.05).to("auto").dtype is qutip.core.data.CSR
+        assert qutip.rand_ket(N).to("auto").dtype is qutip.core.data.Dense
+
+        with CoreOptions(auto_dtype_max_diags=1):
+            assert hopping.to("auto").dtype is qutip.core.data.CSR
+        with CoreOptions(auto_dtype_dense_fill=0.):
+            assert hopping.to("auto").dtype is qutip.core.data.Dense
+
+        with CoreOptions(default_dtype="auto", default_dtype_scope="full"):
+            hopping = qutip.Qobj(hopping.full())
+            assert hopping.dtype is qutip.core.data.Dia
+            # Structure is re-evaluated after each operation.
+            assert (hopping @ hopping).dtype is qutip.core.data.Dia
+            assert (
+                (hopping @ qutip.rand_unitary(N)).dtype
+                is qutip.core.data.Dense
+            )
+            assert (
+                qutip.tensor(qutip.sigmax(), qutip.rand_herm(N, 0.05)).dtype
+                is qutip.core.data.CSR
+            )
+
 
 class TestNumpyBackend:
     def test_getattr_numpy(self):
@@ -87,3 +115,52 @@ class TestNumpyBackend:
     def test_getattr_jax(self):
         with CoreOptions(numpy_backend=mock_jax):
             assert np.sum([1, 2, 3]) == "jax_sum"
+
+    def test_missing_function(self):
+        class Partial:
+            sum = staticmethod(numpy.sum)
+
+        with CoreOptions(numpy_backend=Partial()):
+            assert np.sum([1, 2, 3]) == 6
+            with pytest.raises(AttributeError):
+                np.exp(1)
+        assert np.exp(0) == 1
+
+    def test_wigner_uses_backend(self):
+        calls = []
+
+        class Recorder:
+            def __getattr__(self, name):
+                attr = getattr(numpy, name)
+                if not callable(attr) or isinstance(attr, type):
+                    return attr
+
+                def record(*args, **kwargs):
+                    calls.append(name)
+                    return attr(*args, **kwargs)
+                return record
+
+        rho = qutip.rand_dm(4, seed=1)
+        xvec = numpy.linspace(-2, 2, 11)
+        expected = qutip.wigner(rho, xvec, xvec)
+        with CoreOptions(numpy_backend=Recorder()):
+            calls.clear()
+            result = qutip.wigner(rho, xvec, xvec)
+        assert "exp" in calls
+        numpy.testing.assert_allclose(result, expected)
+
+    def test_threaded_numpy(self):
+        from qutip.core.bench_numpy_backend import ThreadedNumpy
+        backend = ThreadedNumpy(num_threads=3, min_size=10)
+        x = numpy.linspace(-1, 1, 101).reshape(1, 101) * (1 + 1j)
+        numpy.testing.assert_allclose(backend.exp(x), numpy.exp(x))
+        numpy.testing.assert_allclose(backend.abs(x.T), numpy.abs(x.T))
+        assert backend.abs(x).dtype == numpy.float64
+        assert backend.sum is numpy.sum
+        rho = qutip.rand_dm(4, seed=1)
+        xvec = numpy.linspace(-2, 2, 11)
+        with CoreOptions(numpy_backend=backend):
+            result = qutip.wigner(rho, xvec, xvec, method="iterative")
+        numpy.testing.assert_allclose(
+            result, qutip.wigner(rho, xvec, xvec, method="iterative")
+        )
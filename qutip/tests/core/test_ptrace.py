@@ -149,4 +149,13 @@ def test_ptrace_ket_specialization_matches_old_implementation(dtype, dims, sel):
        as the non-specialized version.
     """
     A = qutip.rand_ket(dims)
-    assert A.ptrace(sel) == A.proj().ptrace(sel)
\ No newline at end of file
+    assert A.ptrace(sel) == A.proj().ptrace(sel)
+
+@pytest.mark.parametrize('sels', [
+    [[0], [1], [2]],
+    [[0, 1], [2, 0], [1, 2]],
+    [[], 1, [0, 1, 2]],
+])
+def test_ptrace_many(state, sels):
+    results = state.ptrace_many(sels)
+    assert results == [state.ptrace(sel) for sel in sels]
@@ -455,6 +455,23 @@ def test_QobjEquals():
         assert q1 == q2 * 100
 
 
+def test_QobjFingerprint():
+    "qutip.Qobj fingerprint"
+    data = _random_not_singular(4)
+    q1 = qutip.Qobj(data, dims=[[2, 2], [2, 2]])
+    q2 = qutip.Qobj(data.copy(), dims=[[2, 2], [2, 2]])
+    assert q1.fingerprint() == q2.fingerprint()
+    assert q1.fingerprint() == q1.copy().fingerprint()
+    cache = {q1.fingerprint(): "value"}
+    assert cache[q2.fingerprint()] == "value"
+    assert q1.fingerprint() != qutip.Qobj(data).fingerprint()
+    assert q1.fingerprint() != (2 * q1).fingerprint()
+    assert q1.fingerprint() != q1.to("csr").fingerprint()
+    choi = qutip.to_super(q1)
+    choi.superrep = "choi"
+    assert qutip.to_super(q1).fingerprint() != choi.fingerprint()
+
+
 def test_QobjGetItem():
     "qutip.Qobj getitem"
     data = _random_not_singular(5)
@@ -639,6 +656,27 @@ def test_QobjExpmZeroOper():
     assert B == qutip.qeye(5)
 
 
+@pytest.mark.parametrize("dtype", ["dense", "csr", "dia"])
+def test_QobjExpmMultiply(dtype):
+    "qutip.Qobj expm_multiply"
+    H = qutip.rand_herm([3, 2], dtype=dtype)
+    psi = qutip.rand_ket([3, 2])
+    out = H.expm_multiply(psi, -0.5j)
+    assert out.dims == psi.dims
+    np.testing.assert_allclose(
+        out.full(), ((-0.5j * H).expm() @ psi).full(), atol=1e-10
+    )
+    L = qutip.liouvillian(H, [qutip.destroy(3) & qutip.qeye(2)])
+    rho = qutip.operator_to_vector(qutip.rand_dm([3, 2]))
+    out = L.expm_multiply(rho, 0.1)
+    assert out.dims == rho.dims
+    np.testing.assert_allclose(
+        out.full(), ((0.1 * L).expm() @ rho).full(), atol=1e-10
+    )
+    with pytest.raises(TypeError):
+        H.expm_multiply(qutip.rand_ket(5))
+
+
 def test_QobjLogm():
     "qutip.Qobj expm (dense)"
     data = _random_not_singular(15)
@@ -553,12 +553,15 @@ def test_layer_support(qobjdtype, statedtype):
     state_dense = rand_ket(N).to(_data.Dense)
     state = state_dense.to(statedtype).data
     state_dense = state_dense.data
+    tol = {}
+    if {qobjdtype, statedtype} & {_data.Dense32, _data.CSR32}:
+        tol = {"rtol": 1e-5, "atol": 1e-7}
     exp_any = qevo.expect_data(0, state)
     exp_dense = qevo.expect_data(0, state_dense)
-    assert_allclose(exp_any, exp_dense)
+    assert_allclose(exp_any, exp_dense, **tol)
     mul_any = qevo.matmul_data(0, state).to_array()
     mul_dense = qevo.matmul_data(0, state_dense).to_array()
-    assert_allclose(mul_any, mul_dense)
+    assert_allclose(mul_any, mul_dense, **tol)
 
 
 def test_QobjEvo_step_coeff():
@@ -714,3 +717,19 @@ def test_qobjevo_mixed():
     obj = QobjEvo([qeye(2, dtype="CSR"), [num(2, dtype="Dense"), lambda t: t]])
     # We test that the output dtype is a know type: accepted by `to.parse`.
     _data.to.parse(obj.dtype)
+
+
+def test_call_add_plan():
+    N = 5
+    a = destroy(N).to("CSR")
+    qevo = QobjEvo([a.dag() * a, [a + a.dag(), "cos(t)"], [a * a, "t"]])
+    for t in [0, 0.5, np.pi / 2]:
+        expected = a.dag() * a + np.cos(t) * (a + a.dag()) + t * a * a
+        assert qevo(t) == expected
+    # The previous output is not modified by later calls.
+    first = qevo(1)
+    qevo(2)
+    assert first == a.dag() * a + np.cos(1) * (a + a.dag()) + a * a
+    # The plan follows changes of the terms.
+    qevo += qeye(N, dtype="CSR")
+    assert qevo(0) == a.dag() * a + a + a.dag() + qeye(N)
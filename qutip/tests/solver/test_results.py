@@ -108,6 +108,32 @@ class TestResult:
                 np.testing.assert_allclose(res.e_data[k], results[k])
                 np.testing.assert_allclose(e_op_call_values, results[k])
 
+    @pytest.mark.parametrize("dm", [False, True], ids=["ket", "dm"])
+    def test_grouped_e_ops(self, dm):
+        N = 5
+        e_ops = {
+            "num": qutip.num(N),
+            "x": qutip.position(N).to("csr"),
+            "p": qutip.momentum(N).to("csr"),
+            "a": qutip.destroy(N).to("csr"),
+            "dense": qutip.rand_herm(N).to("dense"),
+            "func": lambda t, state: t,
+        }
+        res = Result(e_ops, fill_options(store_states=False))
+        states = [qutip.rand_ket(N) for _ in range(3)]
+        if dm:
+            states = [qutip.ket2dm(state) for state in states]
+        for t, state in enumerate(states):
+            res.add(t, state)
+        for key, op in e_ops.items():
+            expected = [
+                qutip.expect(op, state) if isinstance(op, qutip.Qobj)
+                else op(t, state)
+                for t, state in enumerate(states)
+            ]
+            np.testing.assert_allclose(res.e_data[key], expected)
+            assert np.array(res.e_data[key]).dtype == np.array(expected).dtype
+
     def test_add_processor(self):
         res = Result([], fill_options(store_states=False, method="vern7"))
         a = []
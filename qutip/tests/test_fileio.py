@@ -60,3 +60,143 @@ def test_qsave_qload(use_path, suffix):
     assert ops_in == ops_out
     # check that the file was saved with the correct name:
     assert Path(str(filename) + ".qu").exists()
+
+
+@pytest.mark.parametrize('obj', [
+    pytest.param(lambda: qutip.rand_dm(_dimension, dtype="dense"), id="dense"),
+    pytest.param(lambda: qutip.rand_dm(_dimension, dtype="csr"), id="csr"),
+    pytest.param(lambda: qutip.num(_dimension, dtype="dia"), id="dia"),
+    pytest.param(lambda: qutip.rand_ket([2, 5]), id="ket"),
+    pytest.param(lambda: qutip.to_choi(qutip.spre(qutip.sigmax())),
+                 id="super"),
+    pytest.param(lambda: qutip.qzero(_dimension, dtype="csr"), id="empty"),
+])
+def test_save_load_memmap(obj):
+    qobj = obj()
+    filename = _random_file_name()
+    qutip.save_memmap(qobj, filename)
+    out = qutip.load_memmap(filename)
+    assert out == qobj
+    assert out.dims == qobj.dims
+    assert out.superrep == qobj.superrep
+    expected = qutip.data.Dense if qobj.dtype is qutip.data.Dense else (
+        qutip.data.CSR
+    )
+    assert isinstance(out.data, expected)
+
+
+def test_save_load_memmap_data():
+    matrix = qutip.rand_dm(_dimension, dtype="dense").data
+    filename = _random_file_name()
+    qutip.save_memmap(matrix, filename)
+    out = qutip.load_memmap(filename)
+    assert isinstance(out, qutip.data.Dense)
+    np.testing.assert_array_equal(out.to_array(), matrix.to_array())
+
+
+@pytest.mark.parametrize('mode', ['c', 'r+'])
+def test_load_memmap_mode(mode):
+    qobj = qutip.rand_dm(_dimension, dtype="dense")
+    filename = _random_file_name()
+    qutip.save_memmap(qobj, filename)
+    out = qutip.load_memmap(filename, mode=mode)
+    out.data.as_ndarray()[0, 0] = 10
+    del out
+    reloaded = qutip.load_memmap(filename)
+    changed = reloaded.full()[0, 0] == 10
+    assert changed == (mode == 'r+')
+
+
+def test_load_memmap_errors():
+    filename = _random_file_name()
+    qutip.qsave(qutip.sigmax(), filename)
+    with pytest.raises(ValueError):
+        qutip.load_memmap(filename + ".qu")
+    qutip.save_memmap(qutip.sigmax(), filename)
+    with pytest.raises(ValueError):
+        qutip.load_memmap(filename, mode="r")
+
+
+def _result():
+    a = qutip.destroy(_dimension)
+    H = a.dag() * a + 0.5 * (a + a.dag())
+    return qutip.mesolve(
+        H, qutip.basis(_dimension, 0), np.linspace(0, 1, 11),
+        [0.1 * a], e_ops={"n": a.dag() * a, "x": a + a.dag()},
+        options={"store_states": True},
+    )
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_qsave_qload_binary(compress):
+    objs = [
+        qutip.sigmax(),
+        qutip.rand_ket([2, 3]).to("dense"),
+        qutip.num(_dimension, dtype="dia"),
+        qutip.to_super(qutip.sigmaz()),
+        np.arange(6.).reshape(2, 3),
+        {"a": 1, 2: [1.5, 2j, None, "text"]},
+        (True, qutip.qzero(3)),
+    ]
+    filename = _random_file_name()
+    qutip.qsave(objs, filename, binary=True, compress=compress)
+    out = qutip.qload(filename)
+    for obj, loaded in zip(objs, out):
+        if isinstance(obj, np.ndarray):
+            np.testing.assert_array_equal(obj, loaded)
+        else:
+            assert obj == loaded
+    assert out[2].dtype is qutip.data.Dia
+    assert out[3].superrep == "super"
+
+
+@pytest.mark.parametrize('mmap', [False, True])
+@pytest.mark.parametrize('compress', [False, True])
+def test_qsave_qload_binary_result(compress, mmap):
+    result = _result()
+    filename = _random_file_name()
+    qutip.qsave(result, filename, binary=True, compress=compress)
+    out = qutip.qload(filename, mmap=mmap)
+    assert out.solver == result.solver
+    assert out.times == result.times
+    assert out.states == result.states
+    assert out.final_state == result.final_state
+    assert list(out.e_data) == list(result.e_data)
+    for loaded, expected in zip(out.expect, result.expect):
+        np.testing.assert_allclose(loaded, expected)
+    assert out.e_ops["n"].op == result.e_ops["n"].op
+    assert out.stats["num_collapse"] == result.stats["num_collapse"]
+
+
+def test_qload_binary_partial():
+    result = _result()
+    filename = _random_file_name()
+    qutip.qsave(result, filename, binary=True)
+    out = qutip.qload(filename, fields=["times", "expect"])
+    assert out.states == []
+    assert out.times == result.times
+    np.testing.assert_allclose(out.expect[1], result.expect[1])
+    out = qutip.qload(filename, states=slice(2, 5))
+    assert out.states == result.states[2:5]
+    assert out.final_state == result.final_state
+    out = qutip.qload(filename, fields=["states"], states=[0, 10])
+    assert out.states == [result.states[0], result.states[10]]
+    assert out.e_data == {}
+
+    ops = [qutip.sigmax(), qutip.sigmay(), qutip.sigmaz()]
+    qutip.qsave(ops, filename, binary=True)
+    assert qutip.qload(filename, states=[2]) == [qutip.sigmaz()]
+
+
+def test_qload_binary_errors():
+    filename = _random_file_name()
+    with pytest.raises(TypeError):
+        qutip.qsave(lambda t: t, filename, binary=True)
+    qutip.qsave([qutip.sigmax()], filename)
+    with pytest.raises(ValueError):
+        qutip.qload(filename, mmap=True)
+    qutip.qsave(qutip.sigmax(), filename, binary=True)
+    with pytest.raises(ValueError):
+        qutip.qload(filename, fields=["expect"])
+    with pytest.raises(ValueError):
+        qutip.qload(filename, states=[0])
@@ -1,111 +1,83 @@
 import numpy as np
-from numpy.testing import assert_equal
 import pytest
-from qutip import *
+import qutip
+from qutip import CoreOptions
+from qutip.core import data as _data
 from qutip.settings import settings as qset
-# if qset.has_openmp:
-#    from qutip.core.cy.openmp.benchmark import _spmvpy, _spmvpy_openmp
 
+# Setting the threshold above any possible number of elements forces the
+# serial kernels, while setting it to 0 forces the OpenMP kernels (if
+# available).  Without OpenMP, both paths are the serial one.
+serial = CoreOptions(openmp_thresh=np.iinfo(np.int64).max)
+parallel = CoreOptions(openmp_thresh=0, openmp_num_threads=2)
 
-# @unittest.skipIf(qset.has_openmp == False, 'OPENMP not available.')
-@pytest.mark.skipif(True, reason='OPENMP disabled.')
-def test_openmp_spmv():
-    "OPENMP : spmvpy_openmp == spmvpy"
-    for k in range(100):
-        L = rand_herm(10,0.25).data
-        vec = rand_ket(L.shape[0],0.25).full().ravel()
-        out = np.zeros_like(vec)
-        out_openmp = np.zeros_like(vec)
-        _spmvpy(L.data, L.indices, L.indptr, vec, 1, out)
-        _spmvpy_openmp(L.data, L.indices, L.indptr, vec, 1, out_openmp, 2)
-        assert (np.allclose(out, out_openmp, 1e-15))
 
-# @unittest.skipIf(qset.has_openmp == False, 'OPENMP not available.')
-@pytest.mark.skipif(True, reason='OPENMP disabled.')
-def test_openmp_mesolve():
-    "OPENMP : mesolve"
-    N = 100
-    wc = 1.0  * 2 * np.pi  # cavity frequency
-    wa = 1.0  * 2 * np.pi  # atom frequency
-    g  = 0.05 * 2 * np.pi  # coupling strength
-    kappa = 0.005          # cavity dissipation rate
-    gamma = 0.05           # atom dissipation rate
-    n_th_a = 1           # temperature in frequency units
-    use_rwa = 0
-    # operators
-    a  = tensor(destroy(N), qeye(2))
-    sm = tensor(qeye(N), destroy(2))
-    # Hamiltonian
-    if use_rwa:
-        H = wc * a.dag() * a + wa * sm.dag() * sm + g * (a.dag() * sm + a * sm.dag())
-    else:
-        H = wc * a.dag() * a + wa * sm.dag() * sm + g * (a.dag() + a) * (sm + sm.dag())
-    c_op_list = []
-
-    rate = kappa * (1 + n_th_a)
-    if rate > 0.0:
-        c_op_list.append(np.sqrt(rate) * a)
-
-    rate = kappa * n_th_a
-    if rate > 0.0:
-        c_op_list.append(np.sqrt(rate) * a.dag())
-
-    rate = gamma
-    if rate > 0.0:
-        c_op_list.append(np.sqrt(rate) * sm)
+def test_has_openmp():
+    assert isinstance(qset.has_openmp, bool)
 
-    n = N - 2
-    psi0 = tensor(basis(N, n), basis(2, 1))
-    tlist = np.linspace(0, 1, 100)
-    opts = SolverOptions(use_openmp=False)
-    out = mesolve(H, psi0, tlist, c_op_list, [a.dag() * a, sm.dag() * sm], options=opts)
-    opts = SolverOptions(use_openmp=True)
-    out_omp = mesolve(H, psi0, tlist, c_op_list, [a.dag() * a, sm.dag() * sm], options=opts)
-    assert (np.allclose(out.expect[0],out_omp.expect[0]))
-    assert (np.allclose(out.expect[1],out_omp.expect[1]))
 
+@pytest.mark.parametrize("fortran", [True, False], ids=["Fortran", "C"])
+@pytest.mark.parametrize("ncols", [1, 4], ids=["vector", "matrix"])
+@pytest.mark.parametrize("scale", [1, 0.5 - 2j])
+def test_openmp_matmul_csr_dense(fortran, ncols, scale):
+    N = 50
+    op = qutip.rand_herm(N, density=0.25, dtype="CSR").data
+    array = np.random.rand(N, ncols) + 1j * np.random.rand(N, ncols)
+    state = _data.Dense(np.asarray(array, order="F" if fortran else "C"))
+    out = np.random.rand(N, ncols) + 0j
 
-# @unittest.skipIf(qset.has_openmp == False, 'OPENMP not available.')
-@pytest.mark.skipif(True, reason='OPENMP disabled.')
-def test_openmp_mesolve_td():
-    "OPENMP : mesolve (td)"
-    N = 100
-    wc = 1.0  * 2 * np.pi  # cavity frequency
-    wa = 1.0  * 2 * np.pi  # atom frequency
-    g  = 0.5 * 2 * np.pi  # coupling strength
-    kappa = 0.005          # cavity dissipation rate
-    gamma = 0.05           # atom dissipation rate
-    n_th_a = 1           # temperature in frequency units
-    use_rwa = 0
-    # operators
-    a  = tensor(destroy(N), qeye(2))
-    sm = tensor(qeye(N), destroy(2))
-    # Hamiltonian
-    H0 = wc * a.dag() * a + wa * sm.dag() * sm
-    H1 = g * (a.dag() + a) * (sm + sm.dag())
+    expected = scale * (op.to_array() @ array)
+    with serial:
+        serial_out = _data.matmul_csr_dense_dense(op, state, scale)
+    with parallel:
+        parallel_out = _data.matmul_csr_dense_dense(op, state, scale)
+        inplace = _data.matmul_csr_dense_dense(
+            op, state, scale, _data.Dense(out.copy(order="F" if fortran else "C"))
+        )
+    np.testing.assert_allclose(parallel_out.to_array(), expected, atol=1e-12)
+    np.testing.assert_allclose(
+        parallel_out.to_array(), serial_out.to_array(), atol=1e-12
+    )
+    np.testing.assert_allclose(inplace.to_array(), out + expected, atol=1e-12)
 
-    H = [H0, [H1,'sin(t)']]
 
-    c_op_list = []
-
-    rate = kappa * (1 + n_th_a)
-    if rate > 0.0:
-        c_op_list.append(np.sqrt(rate) * a)
-
-    rate = kappa * n_th_a
-    if rate > 0.0:
-        c_op_list.append(np.sqrt(rate) * a.dag())
+def test_openmp_mesolve():
+    N = 20
+    a = qutip.tensor(qutip.destroy(N), qutip.qeye(2))
+    sm = qutip.tensor(qutip.qeye(N), qutip.destroy(2))
+    H = [
+        2 * np.pi * (a.dag() * a + sm.dag() * sm),
+        [0.1 * np.pi * (a.dag() + a) * (sm + sm.dag()), "sin(t)"],
+    ]
+    c_ops = [np.sqrt(0.01) * a, np.sqrt(0.005) * a.dag(), np.sqrt(0.05) * sm]
+    psi0 = qutip.tensor(qutip.basis(N, N - 2), qutip.basis(2, 1))
+    tlist = np.linspace(0, 1, 21)
+    e_ops = [a.dag() * a, sm.dag() * sm]
+    options = {"atol": 1e-10, "rtol": 1e-8}
+    with serial:
+        out = qutip.mesolve(
+            H, psi0, tlist, c_ops, e_ops=e_ops, options=options
+        )
+    with parallel:
+        out_omp = qutip.mesolve(
+            H, psi0, tlist, c_ops, e_ops=e_ops, options=options
+        )
+    np.testing.assert_allclose(out.expect[0], out_omp.expect[0], atol=1e-7)
+    np.testing.assert_allclose(out.expect[1], out_omp.expect[1], atol=1e-7)
 
-    rate = gamma
-    if rate > 0.0:
-        c_op_list.append(np.sqrt(rate) * sm)
 
-    n = N - 10
-    psi0 = tensor(basis(N, n), basis(2, 1))
-    tlist = np.linspace(0, 1, 100)
-    opts = SolverOptions(use_openmp=True)
-    out_omp = mesolve(H, psi0, tlist, c_op_list, [a.dag() * a, sm.dag() * sm], options=opts)
-    opts = SolverOptions(use_openmp=False)
-    out = mesolve(H, psi0, tlist, c_op_list, [a.dag() * a, sm.dag() * sm], options=opts)
-    assert (np.allclose(out.expect[0],out_omp.expect[0]))
-    assert (np.allclose(out.expect[1],out_omp.expect[1]))
+def test_system_bench(monkeypatch):
+    from qutip.core.cy.openmp import bench_openmp
+    # Alternating (serial, parallel) timings: the OpenMP kernel becomes
+    # faster for the third size.
+    timings = iter([1, 2, 1, 1.25, 1, 0.5])
+    monkeypatch.setattr(
+        bench_openmp, "_min_timer", lambda *args: next(timings)
+    )
+    nnz = [
+        _data.to(_data.CSR, bench_openmp._spin_hamiltonian(N).data)
+        for N in [3, 4]
+    ]
+    nnz = [_data.csr.nnz(matrix) for matrix in nnz]
+    thresh = bench_openmp.system_bench(bench_openmp._spin_hamiltonian, [2, 3, 4])
+    assert nnz[0] < thresh < nnz[1]
@@ -3,11 +3,7 @@ __all__ = [
     'wigner_transform',
 ]
 
-import numpy as np
 import warnings
-from numpy import (
-    zeros, array, arange, exp, real, conj, pi, copy, sqrt, meshgrid, cos, sin,
-)
 import scipy.sparse as sp
 import scipy.fftpack as ft
 import scipy.linalg as la
@@ -26,6 +22,7 @@ except ImportError:
 
 import qutip
 from qutip import Qobj, ket2dm, jmat
+from .core.numpy_backend import np
 from .solver.parallel import parallel_map
 from .utilities import clebsch
 from .core import data as _data
@@ -171,7 +168,7 @@ def _angle_slice(slicearray, theta, phi):
     return theta, phi
 
 
-def wigner(psi, xvec, yvec=None, method='clenshaw', g=sqrt(2),
+def wigner(psi, xvec, yvec=None, method='clenshaw', g=np.sqrt(2),
            sparse=False, parfor=False, offset=0):
     """Wigner function for a state vector or density matrix at points
     `xvec + i * yvec`.
@@ -279,7 +276,7 @@ def wigner(psi, xvec, yvec=None, method='clenshaw', g=sqrt(2),
             "method must be either 'iterative', 'laguerre', or 'fft'.")
 
 
-def _wigner_iterative(rho, xvec, yvec, g=sqrt(2), offset=0):
+def _wigner_iterative(rho, xvec, yvec, g=np.sqrt(2), offset=0):
     r"""
     Using an iterative method to evaluate the wigner functions for the Fock
     state :math:`|m><n|`.
@@ -297,38 +294,42 @@ def _wigner_iterative(rho, xvec, yvec, g=sqrt(2), offset=0):
 
     M = np.prod(rho.shape[0])
     M_full = M + offset
-    X, Y = meshgrid(xvec, yvec)
+    X, Y = np.meshgrid(xvec, yvec)
     A = 0.5 * g * (X + 1.0j * Y)
 
-    Wlist = array([zeros(np.shape(A), dtype=complex) for k in range(M_full)])
-    Wlist[0] = exp(-2.0 * abs(A) ** 2) / pi
+    Wlist = np.array([
+        np.zeros(np.shape(A), dtype=complex) for k in range(M_full)
+    ])
+    Wlist[0] = np.exp(-2.0 * abs(A) ** 2) / np.pi
 
-    W = zeros(np.shape(A), dtype=float)
+    W = np.zeros(np.shape(A), dtype=float)
 
     if offset == 0:
-        W += real(rho[0, 0]) * real(Wlist[0])
+        W += np.real(rho[0, 0]) * np.real(Wlist[0])
 
     for n in range(1, M_full):
-        Wlist[n] = (2.0 * A * Wlist[n - 1]) / sqrt(n)
+        Wlist[n] = (2.0 * A * Wlist[n - 1]) / np.sqrt(n)
         if offset == 0:
-            W += 2 * real(rho[0, n] * Wlist[n])
+            W += 2 * np.real(rho[0, n] * Wlist[n])
 
     for m in range(1, M_full):
-        temp = copy(Wlist[m])
-        Wlist[m] = (2 * conj(A) * temp - sqrt(m) * Wlist[m - 1]) / sqrt(m)
+        temp = np.copy(Wlist[m])
+        Wlist[m] = (
+            (2 * np.conj(A) * temp - np.sqrt(m) * Wlist[m - 1]) / np.sqrt(m)
+        )
 
         if m >= offset:
             # Wlist[m] = Wigner function for |m><m|
-            W += real(rho[m - offset, m - offset] * Wlist[m])
+            W += np.real(rho[m - offset, m - offset] * Wlist[m])
 
         for n in range(m + 1, M_full):
-            temp2 = (2 * A * Wlist[n - 1] - sqrt(m) * temp) / sqrt(n)
-            temp = copy(Wlist[n])
+            temp2 = (2 * A * Wlist[n - 1] - np.sqrt(m) * temp) / np.sqrt(n)
+            temp = np.copy(Wlist[n])
             Wlist[n] = temp2
 
             if m >= offset and n >= offset:
                 # Wlist[n] = Wigner function for |m><n|
-                W += 2 * real(rho[m - offset, n - offset] * Wlist[n])
+                W += 2 * np.real(rho[m - offset, n - offset] * Wlist[n])
 
     return 0.5 * W * g ** 2
 
@@ -341,9 +342,9 @@ def _wigner_laguerre(rho, xvec, yvec, g, parallel, offset=0):
     """
 
     M = np.prod(rho.shape[0])
-    X, Y = meshgrid(xvec, yvec)
+    X, Y = np.meshgrid(xvec, yvec)
     A = 0.5 * g * (X + 1.0j * Y)
-    W = zeros(np.shape(A))
+    W = np.zeros(np.shape(A))
 
     # compute wigner functions for density matrices |m><n| and
     # weight by all the elements in the density matrix
@@ -364,12 +365,12 @@ def _wigner_laguerre(rho, xvec, yvec, g, parallel, offset=0):
                     n = rho.data.indices[jj]
                     n_phys = n + offset
                     if m == n:
-                        W += real(rho[m, m] * (-1) ** m_phys *
+                        W += np.real(rho[m, m] * (-1) ** m_phys *
                                   genlaguerre(m_phys, 0)(B))
                     elif n > m:
-                        W += 2.0 * real(rho[m, n] * (-1) ** m_phys *
+                        W += 2.0 * np.real(rho[m, n] * (-1) ** m_phys *
                                         (2 * A) ** (n_phys - m_phys) *
-                                        sqrt(factorial(m_phys) /
+                                        np.sqrt(factorial(m_phys) /
                                         factorial(n_phys)) *
                                         genlaguerre(m_phys, n_phys - m_phys)
                                         (B))
@@ -379,17 +380,19 @@ def _wigner_laguerre(rho, xvec, yvec, g, parallel, offset=0):
         for m in range(M):
             m_phys = m + offset
             if abs(rho[m, m]) > 0.0:
-                W += real(rho[m, m] * (-1) ** m_phys * genlaguerre(m_phys, 0)(B))
+                W += np.real(
+                    rho[m, m] * (-1) ** m_phys * genlaguerre(m_phys, 0)(B)
+                )
             for n in range(m + 1, M):
                 n_phys = n + offset
                 if abs(rho[m, n]) > 0.0:
-                    W += 2.0 * real(rho[m, n] * (-1) ** m_phys *
+                    W += 2.0 * np.real(rho[m, n] * (-1) ** m_phys *
                                     (2 * A) ** (n_phys - m_phys) *
-                                    sqrt(factorial(m_phys) /
+                                    np.sqrt(factorial(m_phys) /
                                     factorial(n_phys)) *
                                     genlaguerre(m_phys, n_phys - m_phys)(B))
 
-    return 0.5 * W * g ** 2 * np.exp(-B / 2) / pi
+    return 0.5 * W * g ** 2 * np.exp(-B / 2) / np.pi
 
 
 def _par_wig_eval(args):
@@ -399,19 +402,21 @@ def _par_wig_eval(args):
     """
     m, rho, A, B, offset = args
 
-    W1 = zeros(np.shape(A))
+    W1 = np.zeros(np.shape(A))
     m_phys = m + offset
     for jj in range(rho.data.indptr[m], rho.data.indptr[m + 1]):
         n = rho.data.indices[jj]
         n_phys = n + offset
 
         if m == n:
-            W1 += real(rho[m, m] * (-1) ** m_phys * genlaguerre(m_phys, 0)(B))
+            W1 += np.real(
+                rho[m, m] * (-1) ** m_phys * genlaguerre(m_phys, 0)(B)
+            )
 
         elif n > m:
-            W1 += 2.0 * real(rho[m, n] * (-1) ** m_phys *
+            W1 += 2.0 * np.real(rho[m, n] * (-1) ** m_phys *
                              (2 * A) ** (n_phys - m_phys) *
-                             sqrt(factorial(m_phys) /
+                             np.sqrt(factorial(m_phys) /
                              factorial(n_phys)) *
                              genlaguerre(m_phys, n_phys - m_phys)(B))
     return W1
@@ -435,7 +440,7 @@ def _wigner_fourier(psi, xvec, g=np.sqrt(2)):
         return W, yvec
 
 
-def _psi_wigner_fft(psi, xvec, g=sqrt(2)):
+def _psi_wigner_fft(psi, xvec, g=np.sqrt(2)):
     """
     FFT method for a single state vector.  Called multiple times when the
     input is a density matrix.
@@ -477,7 +482,7 @@ def _osc_eigen(N, pnts):
     pnts = np.asarray(pnts)
     lpnts = len(pnts)
     A = np.zeros((N, lpnts))
-    A[0, :] = np.exp(-pnts ** 2 / 2.0) / pi ** 0.25
+    A[0, :] = np.exp(-pnts ** 2 / 2.0) / np.pi ** 0.25
     if N == 1:
         return A
     else:
@@ -488,7 +493,7 @@ def _osc_eigen(N, pnts):
         return A
 
 
-def _wigner_clenshaw(rho, xvec, yvec, g=sqrt(2), sparse=False, offset=0):
+def _wigner_clenshaw(rho, xvec, yvec, g=np.sqrt(2), sparse=False, offset=0):
     r"""
     Using Clenshaw summation - numerically stable and efficient
     iterative algorithm to evaluate polynomial series.
@@ -541,7 +546,7 @@ def _wigner_clenshaw(rho, xvec, yvec, g=sqrt(2), sparse=False, offset=0):
             # here c_L = _wig_laguerre_val(L, B, np.diag(rho, L))
             w0 = _wig_laguerre_val(L, B, diag) + w0 * A2 * (L+1)**-0.5
 
-    return w0.real * np.exp(-B*0.5) * (g*g*0.5 / pi)
+    return w0.real * np.exp(-B*0.5) * (g*g*0.5 / np.pi)
 
 
 def _wig_laguerre_val(L, x, c):
@@ -833,7 +838,7 @@ def qfunc(
     state: Qobj,
     xvec,
     yvec,
-    g: float = sqrt(2),
+    g: float = np.sqrt(2),
     precompute_memory: float = 1024,
 ):
     r"""
@@ -953,22 +958,23 @@ def spin_q_function(rho, theta, phi):
     J = rho.shape[0]
     j = (J - 1) / 2
 
-    THETA, PHI = meshgrid(theta, phi)
+    THETA, PHI = np.meshgrid(theta, phi)
 
     Q = np.zeros_like(THETA, dtype=complex)
     data = rho.full()
 
-    for m1 in arange(-j, j + 1):
-        Q += binom(2 * j, j + m1) * cos(THETA / 2) ** (2 * (j + m1)) * \
-             sin(THETA / 2) ** (2 * (j - m1)) * \
+    for m1 in np.arange(-j, j + 1):
+        Q += binom(2 * j, j + m1) * np.cos(THETA / 2) ** (2 * (j + m1)) * \
+             np.sin(THETA / 2) ** (2 * (j - m1)) * \
              data[int(j - m1), int(j - m1)]
 
-        for m2 in arange(m1 + 1, j + 1):
-            Q += (sqrt(binom(2 * j, j + m1)) * sqrt(binom(2 * j, j + m2)) *
-                  cos(THETA / 2) ** (2 * j + m1 + m2) *
-                  sin(THETA / 2) ** (2 * j - m1 - m2)) * \
-             (exp(1j * (m1 - m2) * PHI) * data[int(j - m1), int(j - m2)] +
-              exp(1j * (m2 - m1) * PHI) * data[int(j - m2), int(j - m1)])
+        for m2 in np.arange(m1 + 1, j + 1):
+            Q += (np.sqrt(binom(2 * j, j + m1)) *
+                  np.sqrt(binom(2 * j, j + m2)) *
+                  np.cos(THETA / 2) ** (2 * j + m1 + m2) *
+                  np.sin(THETA / 2) ** (2 * j - m1 - m2)) * \
+             (np.exp(1j * (m1 - m2) * PHI) * data[int(j - m1), int(j - m2)] +
+              np.exp(1j * (m2 - m1) * PHI) * data[int(j - m2), int(j - m1)])
 
     return Q.real, THETA, PHI
 
@@ -997,8 +1003,8 @@ def _rho_kq(rho, j, k, q):
 
     v = 0j
     data = rho.full()
-    for m1 in arange(-j, j+1):
-        for m2 in arange(-j, j+1):
+    for m1 in np.arange(-j, j+1):
+        for m2 in np.arange(-j, j+1):
             v += (
                     (-1) ** (2 * j - k - m1 - m2)
                     * np.sqrt((2 * k + 1) / (2 * j + 1))
@@ -1052,12 +1058,12 @@ def spin_wigner(rho, theta, phi):
     J = rho.shape[0]
     j = (J - 1) / 2
 
-    THETA, PHI = meshgrid(theta, phi)
+    THETA, PHI = np.meshgrid(theta, phi)
 
     W = np.zeros_like(THETA, dtype=complex)
 
     for k in range(int(2 * j)+1):
-        for q in arange(-k, k+1):
+        for q in np.arange(-k, k+1):
             W += _rho_kq(rho, j, k, q) * sph_harm_y(k, q, THETA, PHI)
 
     return W.real, THETA, PHI
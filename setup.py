@@ -27,8 +27,8 @@ def process_options():
         'release': bool
             Is this a release build (True) or a local development build (False)
         'openmp': bool
-            Should we build our OpenMP extensions and attempt to link in OpenMP
-            libraries? (Not supported in this version.)
+            Should we compile with OpenMP and attempt to link in OpenMP
+            libraries?  This enables the multi-threaded sparse kernels.
         'cflags': list of str
             Flags to be passed to the C++ compiler.
         'ldflags': list of str
@@ -88,8 +88,7 @@ def _determine_user_arguments(options):
             --wheel \
             --config-setting="--global-option=--with-openmp"
     """
-    # options = _parse_bool_user_argument(options, 'openmp')
-    options['openmp'] = False  # Not supported yet
+    options = _parse_bool_user_argument(options, 'openmp')
     options = _parse_bool_user_argument(options, 'idxint_64')
     return options
 
@@ -216,6 +215,7 @@ def _extension_extra_sources():
             'qutip/core/data/src/matmul_csr_vector.cpp',
             'qutip/core/data/src/matmul_csr_dense.cpp',
             'qutip/core/data/src/matmul_diag_vector.cpp',
+            'qutip/core/data/src/matmul_csr_openmp.cpp',
         ],
     }
     out = collections.defaultdict(list)
@@ -256,8 +256,6 @@ def create_extension_modules(options):
     root = pathlib.Path(options['rootdir'])
     _create_int_type_file(options)
     pyx_files = set(root.glob('qutip/**/*.pyx'))
-    if not options['openmp']:
-        pyx_files -= set(root.glob('qutip/**/openmp/**/*.pyx'))
     extra_sources = _extension_extra_sources()
     # Add Cython files from qutip
     for pyx_file in pyx_files: